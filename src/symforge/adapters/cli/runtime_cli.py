@@ -1,8 +1,15 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import AutoCommitError, DomainException, StorageConfigError
 from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.retention import RetentionPolicy
+from symforge.domain.states import SessionState
+from symforge.infrastructure.storage import load_storage_config
 
 
 class RuntimeCLI:
@@ -14,45 +21,179 @@ class RuntimeCLI:
     def __init__(self, workspace: Path, auto_commit: bool = False):
         self.workspace = workspace
         sessions_dir = workspace / ".symforge" / "sessions"
-        self.runtime = RuntimeUseCases(sessions_dir, auto_commit=auto_commit)
+        storage = load_storage_config(workspace)
+        self.storage = storage
+        self.runtime = RuntimeUseCases(
+            sessions_dir,
+            auto_commit=auto_commit,
+            storage=storage,
+            process_cache=workspace / ".symforge" / "cache" / "processes",
+        )
+        # A sessão já está gravada quando o auto-commit falha: o comando termina
+        # (imprimindo id/estado) e a CLI reporta as falhas em seguida.
+        self.runtime.repo.commit_errors = []
 
-    def start(self, process_name: str, required_artifacts: Optional[list[str]] = None) -> str:
-        process = ProcessDefinition(name=process_name, required_artifacts=required_artifacts or [])
+    @property
+    def commit_errors(self) -> list[AutoCommitError]:
+        return list(self.runtime.repo.commit_errors or [])
+
+    def close(self) -> None:
+        self.runtime.close()
+
+    def start(
+        self,
+        process_name: str,
+        required_artifacts: Optional[list[str]] = None,
+        flow: Optional[str] = None,
+    ) -> str:
+        process = ProcessDefinition(
+            name=process_name,
+            required_artifacts=required_artifacts or [],
+            flow_source=self._relative(flow) if flow else None,
+        )
         session = self.runtime.start(process, self.workspace)
         return session.id
 
+    def advance(
+        self, session_id: str, value: Optional[str] = None, actor: Optional[str] = None
+    ) -> dict:
+        session = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.advance(s, self.workspace, value, actor)
+        )
+        return {
+            "state": session.state.value,
+            "flow_node": session.flow_node,
+            "call_stack": session.call_stack,
+            "options": self.runtime.flow_options(session, self.workspace),
+        }
+
     def resume(self, session_id: str) -> str:
-        session = self.runtime.repo.load(session_id)
-        session = self.runtime.resume_after_input(session, self.workspace)
+        session = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.resume_after_input(s, self.workspace)
+        )
         return session.state.value
 
-    def reset(self, session_id: str, step_id: str) -> str:
-        session = self.runtime.repo.load(session_id)
-        session = self.runtime.reset_step(session, step_id)
+    def reset(self, session_id: str, step_id: str, restore: bool = False) -> str:
+        workspace = self.workspace if restore else None
+        session = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.reset_step(s, step_id, workspace)
+        )
         return session.state.value
 
-    def decide(self, session_id: str, decision: str) -> str:
-        session = self.runtime.repo.load(session_id)
-        session = self.runtime.mark_decision(session, decision)
+    def decide(self, session_id: str, decision: str, actor: str | None = None) -> str:
+        session = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.mark_decision(s, decision, actor, self.workspace)
+        )
         return session.state.value
 
-    def status(self, session_id: str) -> dict:
-        session = self.runtime.repo.load(session_id)
-        return {
+    def status(self, session_id: str, brief: bool = False) -> dict:
+        if brief:
+            # Apenas o cabeçalho: o histórico não é lido do disco.
+            session = self.runtime.repo.load_lazy(session_id)
+        else:
+            session = self.runtime.repo.load(session_id)
+        status = {
             "id": session.id,
             "process_name": session.process_name,
             "state": session.state.value,
             "missing_artifacts": session.missing_artifacts,
-            "history": session.history,
             "pending_decision": session.pending_decision,
+            "version": session.version,
         }
+        if session.flow_source is not None:
+            status["flow_node"] = session.flow_node
+            status["call_stack"] = session.call_stack
+        if not brief:
+            status["history"] = [str(event) for event in session.history]
+        return status
+
+    def status_many(
+        self, session_ids: Iterable[str], brief: bool = False, workers: int = 8
+    ) -> Iterator[dict]:
+        """
+        Status de várias sessões carregadas em paralelo (thread pool), na ordem
+        de `session_ids`. Falhas por sessão viram `{"id", "error"}` sem interromper.
+        """
+
+        def one(session_id: str) -> dict:
+            try:
+                return self.status(session_id, brief=brief)
+            except (DomainException, OSError, ValueError) as exc:
+                return {"id": session_id, "error": str(exc)}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(one, session_ids)
+
+    def all_session_ids(self) -> list[str]:
+        return [s.id for s in self.runtime.repo.query()]
 
     def pause(self, session_id: str) -> str:
-        session = self.runtime.repo.load(session_id)
-        handoff_path = self.runtime.pause(session, self.workspace)
+        handoff_path = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.pause(s, self.workspace)
+        )
         return str(handoff_path)
 
+    def pause_many(self, session_ids: list[str]) -> list[str]:
+        handoff_paths = self.runtime.with_retry_many(
+            session_ids, lambda sessions: self.runtime.pause_many(sessions, self.workspace)
+        )
+        return [str(path) for path in handoff_paths]
+
     def complete(self, session_id: str) -> str:
-        session = self.runtime.repo.load(session_id)
-        handoff_path = self.runtime.complete(session, self.workspace)
+        handoff_path = self.runtime.with_retry(
+            session_id, lambda s: self.runtime.complete(s, self.workspace)
+        )
         return str(handoff_path)
+
+    def list_sessions(
+        self,
+        state: Optional[str] = None,
+        process_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        created_since: Optional[datetime] = None,
+    ) -> list[dict]:
+        summaries = self.runtime.repo.query(
+            state=SessionState(state) if state else None,
+            process_name=process_name,
+            since=since,
+            created_since=created_since,
+        )
+        return [
+            {
+                "id": s.id,
+                "process_name": s.process_name,
+                "state": s.state.value,
+                "updated_at": datetime.fromtimestamp(s.updated_at).isoformat(timespec="seconds"),
+            }
+            for s in summaries
+        ]
+
+    def reindex(self) -> int:
+        return self.runtime.repo.reindex()
+
+    def migrate(self, session_format: Optional[str] = None, layout: Optional[str] = None) -> int:
+        return self.runtime.repo.migrate(session_format, layout)
+
+    def gc(self, ttl: Optional[dict[str, str]] = None, dry_run: bool = False) -> dict:
+        """Coleta sessões expiradas; `ttl` ({ESTADO: dias}) substitui sessions.retention."""
+        policy = RetentionPolicy.parse(ttl) if ttl else self.storage.retention
+        if not policy.ttl_days:
+            raise StorageConfigError(
+                "nenhuma política de retenção (use --ttl ESTADO=DIAS ou sessions.retention)"
+            )
+        report = self.runtime.gc(self.workspace, policy, dry_run=dry_run)
+        return {"sessions": report.sessions, "handoffs": [str(p) for p in report.handoffs]}
+
+    def _relative(self, path: str) -> str:
+        """Caminho gravado na sessão: relativo ao workspace quando estiver dentro dele."""
+        resolved = (self.workspace / path).resolve()
+        try:
+            return resolved.relative_to(self.workspace.resolve()).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def compact(self, older_than_days: Optional[int] = None) -> int:
+        before = None
+        if older_than_days is not None:
+            before = datetime.now() - timedelta(days=older_than_days)
+        return self.runtime.repo.compact(before)
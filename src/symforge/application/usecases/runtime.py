@@ -1,28 +1,127 @@
+import os
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TypeVar
 
-from symforge.domain.exceptions import NoPendingDecisionError, StepNotFoundError
+from symforge.domain.exceptions import (
+    FlowTransitionError,
+    NoPendingDecisionError,
+    SessionConflictError,
+    StepCommitNotFoundError,
+    StepNotFoundError,
+)
+from symforge.domain.flow import FlowEngine
 from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.retention import RetentionPolicy
 from symforge.domain.session import Session
 from symforge.domain.states import SessionState
-from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.process_loader import ProcessLoader
+from symforge.infrastructure.storage import StorageConfig, create_session_repository
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class GcReport:
+    """Resultado de um `gc`: sessões e handoffs removidos (ou que seriam, em dry-run)."""
+
+    sessions: list[str] = field(default_factory=list)
+    handoffs: list[Path] = field(default_factory=list)
 
 
 class RuntimeUseCases:
-    def __init__(self, sessions_dir: Path, auto_commit: bool = False):
-        self.repo = SessionRepository(sessions_dir, auto_commit=auto_commit)
+    MAX_ATTEMPTS = 10
+
+    def __init__(
+        self,
+        sessions_dir: Path,
+        auto_commit: bool = False,
+        storage: StorageConfig | None = None,
+        process_cache: Path | None = None,
+    ):
+        self.repo = create_session_repository(sessions_dir, storage, auto_commit=auto_commit)
+        self.processes = ProcessLoader(process_cache)
+
+    def flush(self) -> None:
+        """
+        Grava o que está pendente (fsync em lote, lote do auto-commit, fila do
+        fast-import) sem encerrar o runtime; para uso em daemons e lotes longos.
+        """
+        self.repo.flush()
+
+    def close(self) -> None:
+        """Encerra o runtime gravando commits pendentes do auto-commit em lote."""
+        self.repo.close()
+
+    def with_retry(self, session_id: str, operation: Callable[[Session], T]) -> T:
+        """
+        Executa load -> `operation` -> update com retry otimista: em
+        SessionConflictError recarrega a sessão e reaplica a operação.
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            session = self.repo.load(session_id)
+            try:
+                return operation(session)
+            except SessionConflictError:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(random.uniform(0, 0.005 * (attempt + 1)))
+        raise AssertionError("unreachable")
+
+    def with_retry_many(
+        self, session_ids: list[str], operation: Callable[[list[Session]], T]
+    ) -> T:
+        """
+        Como `with_retry`, para operações em lote: carrega todas as sessões e
+        reaplica `operation` sobre todas em SessionConflictError.
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            sessions = [self.repo.load(session_id) for session_id in session_ids]
+            try:
+                return operation(sessions)
+            except SessionConflictError:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(random.uniform(0, 0.005 * (attempt + 1)))
+        raise AssertionError("unreachable")
 
     def start(self, process: ProcessDefinition, workspace: Path) -> Session:
         missing = self._missing_artifacts(process.required_artifacts, workspace)
-        session = self.repo.create(process, missing)
-        if process.required_artifacts and missing:
-            session.mark_awaiting_input(missing)
-            self.repo.update(session)
-        else:
-            session.state = SessionState.RUNNING
-            self.repo.update(session)
+        if process.flow_source is None:
+            # create já grava a sessão em RUNNING ou AWAITING_INPUT (artefatos faltando).
+            return self.repo.create(process, missing)
+        # Entrada no fluxo dentro da transação: um PROCESS.yml inválido (raiz ou
+        # subprocesso alcançado) descarta a sessão antes de gravá-la.
+        engine = self._flow_engine(process.flow_source, workspace)
+        with self.repo.transaction() as tx:
+            session = tx.create(process, missing)
+            engine.enter(session)
+        return session
+
+    def advance(
+        self,
+        session: Session,
+        workspace: Path,
+        value: str | None = None,
+        actor: str | None = None,
+    ) -> Session:
+        """
+        Avança a sessão no fluxo do processo: conclui o passo corrente ou, em
+        decisões e chamadas, segue o desvio de `value`.
+        """
+        self._engine(session, workspace).advance(session, value, actor)
+        self.repo.update(session)
         return session
 
+    def flow_options(self, session: Session, workspace: Path) -> list[str]:
+        """Valores aceitos pelo nó corrente do fluxo da sessão."""
+        return self._engine(session, workspace).options(session)
+
     def resume_after_input(self, session: Session, workspace: Path) -> Session:
         missing = self._missing_artifacts(session.required_artifacts, workspace)
         if missing:
@@ -32,17 +131,40 @@ class RuntimeUseCases:
         self.repo.update(session)
         return session
 
-    def reset_step(self, session: Session, step_id: str) -> Session:
-        if not session.can_reset(step_id):
+    def reset_step(
+        self, session: Session, step_id: str, workspace: Path | None = None
+    ) -> Session:
+        """
+        Trunca o histórico no passo. Com `workspace`, restaura também os
+        artefatos requeridos rastreados no Git para o commit registrado do passo.
+        """
+        position = session.position(step_id)
+        if position is None:
             raise StepNotFoundError(step_id)
+        if workspace is not None:
+            commit = self.repo.step_commit(session, position)
+            if commit is None:
+                raise StepCommitNotFoundError(step_id)
+            self.repo.restore_files(
+                commit, [workspace / artifact for artifact in session.required_artifacts]
+            )
         session.reset_to(step_id)
         self.repo.update(session)
         return session
 
-    def mark_decision(self, session: Session, decision: str) -> Session:
+    def mark_decision(
+        self,
+        session: Session,
+        decision: str,
+        actor: str | None = None,
+        workspace: Path | None = None,
+    ) -> Session:
+        """Registra a decisão; com `workspace`, sessões com fluxo seguem o desvio."""
         if session.state != SessionState.AWAITING_DECISION:
             raise NoPendingDecisionError()
-        session.register_decision(decision)
+        if session.flow_source is not None and workspace is not None:
+            return self.advance(session, workspace, decision, actor)
+        session.register_decision(decision, actor)
         self.repo.update(session)
         return session
 
@@ -52,12 +174,52 @@ class RuntimeUseCases:
         self.repo.update(session)
         return self._generate_handoff(session, workspace, "pause")
 
+    def pause_many(self, sessions: list[Session], workspace: Path) -> list[Path]:
+        """Pausa várias sessões em uma transação (um save por sessão, um commit Git)."""
+        with self.repo.transaction() as tx:
+            for session in sessions:
+                session.mark_paused()
+                tx.update(session)
+        return [self._generate_handoff(s, workspace, "pause") for s in sessions]
+
     def complete(self, session: Session, workspace: Path) -> Path:
         """Complete session and generate final handoff."""
         session.mark_completed()
         self.repo.update(session)
         return self._generate_handoff(session, workspace, "complete")
 
+    def gc(
+        self,
+        workspace: Path,
+        policy: RetentionPolicy,
+        dry_run: bool = False,
+        now: float | None = None,
+    ) -> GcReport:
+        """
+        Remove as sessões expiradas pela `policy` (seleção pelo catálogo, sem
+        abrir documentos) e os handoffs dessas sessões em .symforge/handoffs.
+        """
+        now = time.time() if now is None else now
+        expired = [
+            summary.id
+            for state in policy.states
+            for summary in self.repo.query(state=state)
+            if policy.expired(summary, now)
+        ]
+        report = GcReport(self.repo.purge(expired, policy.states, dry_run=dry_run))
+        purged = set(report.sessions)
+        handoffs_dir = workspace / ".symforge" / "handoffs"
+        if purged and handoffs_dir.is_dir():
+            with os.scandir(handoffs_dir) as entries:
+                for entry in entries:
+                    # Nome: <id>_<tipo>_<timestamp>.md
+                    if entry.is_file() and entry.name.split("_", 1)[0] in purged:
+                        report.handoffs.append(Path(entry.path))
+        if not dry_run:
+            for path in report.handoffs:
+                path.unlink(missing_ok=True)
+        return report
+
     def _generate_handoff(self, session: Session, workspace: Path, handoff_type: str) -> Path:
         """Generate handoff file for session."""
         handoffs_dir = workspace / ".symforge" / "handoffs"
@@ -67,9 +229,8 @@ class RuntimeUseCases:
         filename = f"{session.id}_{handoff_type}_{timestamp}.md"
         handoff_path = handoffs_dir / filename
 
-        # Extract decisions from history
-        decisions = [h for h in session.history if h.startswith("decision:")]
-        steps = [h for h in session.history if not h.startswith("decision:")]
+        decisions = session.decisions()
+        steps = session.steps()
 
         content = [
             f"# Handoff: {session.process_name}",
@@ -91,7 +252,7 @@ class RuntimeUseCases:
                 "",
             ])
             for step in steps:
-                content.append(f"- {step}")
+                content.append(f"- {step.value}")
             content.append("")
 
         if decisions:
@@ -100,7 +261,8 @@ class RuntimeUseCases:
                 "",
             ])
             for dec in decisions:
-                content.append(f"- {dec.replace('decision:', '')}")
+                actor = f" ({dec.actor})" if dec.actor else ""
+                content.append(f"- {dec.value}{actor}")
             content.append("")
 
         if session.required_artifacts:
@@ -124,9 +286,18 @@ class RuntimeUseCases:
             content.append("- Sessão concluída")
             content.append("- Revisar artefatos gerados")
 
-        handoff_path.write_text("\n".join(content), encoding="utf-8")
+        self.repo.files.write(handoff_path, "\n".join(content).encode("utf-8"))
         return handoff_path
 
+    def _engine(self, session: Session, workspace: Path) -> FlowEngine:
+        if session.flow_source is None:
+            raise FlowTransitionError("-", f"sessão '{session.id}' sem fluxo")
+        return self._flow_engine(session.flow_source, workspace)
+
+    def _flow_engine(self, source: str, workspace: Path) -> FlowEngine:
+        # Subprocessos são compilados sob demanda, na primeira chamada que os alcança.
+        return FlowEngine(source, lambda path: self.processes.load(workspace / path))
+
     def _missing_artifacts(self, required: list[str], workspace: Path) -> list[str]:
         missing: list[str] = []
         for rel in required:
@@ -1,8 +1,13 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
+from symforge.domain.exceptions import ProcessFileError
+from symforge.domain.flow_analysis import analyze_flow
+from symforge.infrastructure.process_loader import ProcessLoader
 
 
 @dataclass
@@ -12,14 +17,44 @@ class ValidationResult:
     details: dict[str, Any] = field(default_factory=dict)
 
 
+# Referências que apontam para outro PROCESS.yml (validado e seguido); as demais
+# só precisam existir.
+_PROCESS_REFERENCES = frozenset({"sub_phase", "subprocesses"})
+
+
+@dataclass(frozen=True)
+class _Reference:
+    """Arquivo citado por um PROCESS.yml (`origin`), resolvido a partir do diretório dele."""
+
+    kind: str
+    value: str
+    path: Path
+    origin: Path
+
+
 class ValidateUseCases:
     """
     Valida PROCESS.yml e, quando solicitado, verifica templates/artefatos.
     Nesta etapa, a validação é leve: garante presença de conteúdo YAML e
-    existência da chave phases com lista.
+    existência da chave phases com lista. O YAML é lido pelo ProcessLoader
+    (com cache por hash de conteúdo quando configurado). Com `flow`, o fluxo do
+    processo e de todos os subprocessos chamados passa pela análise estática
+    (`analyze_flow`); o relatório fica em details["flow"].
+
+    Com `recursive`, além dos artefatos das fases, percorre o grafo de arquivos
+    referenciados: `sub_phase` e `subprocesses` (outros PROCESS.yml, validados e
+    seguidos), `spec_file` de fases e passos, `template` de inputs/outputs e
+    `prompt_file` dos symbiotes. Cada nível do grafo é validado em paralelo
+    (thread pool); arquivos citados por mais de um processo são validados uma vez.
     """
 
-    def validate_process(self, process_path: Path, recursive: bool = False) -> ValidationResult:
+    def __init__(self, processes: ProcessLoader | None = None, workers: int = 8):
+        self.processes = processes or ProcessLoader()
+        self.workers = workers
+
+    def validate_process(
+        self, process_path: Path, recursive: bool = False, flow: bool = False
+    ) -> ValidationResult:
         if not process_path.exists():
             return ValidationResult(False, ["PROCESS.yml não encontrado"])
 
@@ -28,9 +63,9 @@ class ValidateUseCases:
             return ValidationResult(False, ["PROCESS.yml vazio ou sem conteúdo"])
 
         try:
-            data = yaml.safe_load(content) or {}
-        except yaml.YAMLError as exc:
-            return ValidationResult(False, [f"YAML inválido: {exc}"])
+            data = self.processes.document(process_path)
+        except ProcessFileError as exc:
+            return ValidationResult(False, [exc.reason])
 
         phases = data.get("phases", [])
         if not isinstance(phases, list) or not phases:
@@ -38,8 +73,8 @@ class ValidateUseCases:
 
         details: dict[str, Any] = {"phases": phases}
 
-        # Validação recursiva simplificada: assegura que artefatos referenciados existem.
         if recursive:
+            errors: list[str] = []
             missing_artifacts: list[str] = []
             process_dir = process_path.parent
             for phase in phases:
@@ -49,10 +84,97 @@ class ValidateUseCases:
                     if not artifact_path.exists():
                         missing_artifacts.append(str(artifact))
             if missing_artifacts:
-                return ValidationResult(
-                    False,
-                    [f"Artefatos ausentes: {', '.join(missing_artifacts)}"],
-                    details,
-                )
+                errors.append(f"Artefatos ausentes: {', '.join(missing_artifacts)}")
+            files, reference_errors = self._validate_references(process_path, data)
+            details["references"] = files
+            errors.extend(reference_errors)
+            if errors:
+                return ValidationResult(False, errors, details)
+
+        if flow:
+            process_dir = process_path.parent
+            report = analyze_flow(
+                process_path.name, lambda source: self.processes.document(process_dir / source)
+            )
+            details["flow"] = report
+            if report.errors:
+                return ValidationResult(False, report.errors, details)
 
         return ValidationResult(True, [], details)
+
+    def _validate_references(
+        self, process_path: Path, data: dict[str, Any]
+    ) -> tuple[dict[str, str], list[str]]:
+        """
+        Valida, nível a nível, os arquivos alcançáveis a partir de `process_path`.
+        Devolve os arquivos visitados (caminho relativo → tipo da referência) e
+        os erros, na ordem em que as referências aparecem.
+        """
+        root_dir = process_path.parent.resolve()
+
+        def display(path: Path) -> str:
+            return Path(os.path.relpath(path, root_dir)).as_posix()
+
+        files: dict[str, str] = {}
+        errors: list[str] = []
+        seen = {process_path.resolve()}
+        level = list(_references(process_path.resolve(), data))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while level:
+                unique: list[_Reference] = []
+                for ref in level:
+                    if ref.path not in seen:
+                        seen.add(ref.path)
+                        unique.append(ref)
+                level = []
+                for ref, (reason, found) in zip(unique, pool.map(self._check, unique)):
+                    files[display(ref.path)] = ref.kind
+                    if reason is not None:
+                        errors.append(f"{display(ref.origin)}: {ref.kind} {ref.value}: {reason}")
+                    level.extend(found)
+        return files, errors
+
+    def _check(self, ref: _Reference) -> tuple[str | None, list[_Reference]]:
+        """Erro do arquivo (ou None) e, para PROCESS.yml, as referências dele."""
+        if ref.kind not in _PROCESS_REFERENCES:
+            return (None if ref.path.is_file() else "arquivo não encontrado"), []
+        try:
+            data = self.processes.document(ref.path)
+        except ProcessFileError as exc:
+            return exc.reason, []
+        phases = data.get("phases")
+        if not isinstance(phases, list) or not phases:
+            return "phases ausentes ou vazias", []
+        return None, list(_references(ref.path, data))
+
+
+def _references(process_path: Path, data: dict[str, Any]) -> Iterator[_Reference]:
+    """Arquivos citados por um PROCESS.yml, na ordem do documento."""
+    base = process_path.parent
+
+    def ref(kind: str, value: Any) -> Iterator[_Reference]:
+        if isinstance(value, str) and value:
+            yield _Reference(kind, value, (base / value).resolve(), process_path)
+
+    def prompts(symbiotes: Any) -> Iterator[_Reference]:
+        for symbiote in symbiotes if isinstance(symbiotes, list) else []:
+            if isinstance(symbiote, dict):
+                yield from ref("prompt_file", symbiote.get("prompt_file"))
+
+    for phase in data.get("phases") or []:
+        if not isinstance(phase, dict):
+            continue
+        yield from ref("sub_phase", phase.get("sub_phase"))
+        yield from ref("spec_file", phase.get("spec_file"))
+        yield from prompts(phase.get("symbiotes"))
+        for step in phase.get("steps") or []:
+            if not isinstance(step, dict):
+                continue
+            yield from ref("spec_file", step.get("spec_file"))
+            for item in [*(step.get("inputs") or []), *(step.get("outputs") or [])]:
+                if isinstance(item, dict):
+                    yield from ref("template", item.get("template"))
+    for subprocess in data.get("subprocesses") or []:
+        if isinstance(subprocess, dict):
+            yield from ref("subprocesses", subprocess.get("path"))
+    yield from prompts(data.get("symbiotes"))
@@ -1,18 +1,145 @@
 import argparse
 import json
 import sys
+from datetime import datetime
 from pathlib import Path
 
 from symforge.adapters.cli.plugins_cli import PluginsCLI
 from symforge.adapters.cli.runtime_cli import RuntimeCLI
 from symforge.application.usecases.init_process import init_process
 from symforge.application.usecases.validation import ValidateUseCases
+from symforge.domain.states import SessionState
+from symforge.infrastructure.process_loader import ProcessLoader
+
+RUNTIME_COMMANDS = {
+    "start", "resume", "reset", "decide", "advance", "status", "pause", "complete", "sessions",
+    "gc",
+}
 
 
 def _workspace(path_str: str | None) -> Path:
     return Path(path_str).resolve() if path_str else Path.cwd()
 
 
+def _process_cache_dir(process_path: Path) -> Path | None:
+    """Cache de processos do workspace que contém o arquivo (não cria .symforge)."""
+    for parent in process_path.parents:
+        if (parent / ".symforge").is_dir():
+            return parent / ".symforge" / "cache" / "processes"
+    return None
+
+
+def _read_ids(source: str) -> list[str]:
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _ttl(value: str) -> tuple[str, str]:
+    state, sep, days = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError("use ESTADO=DIAS (ex.: PAUSED=30)")
+    return state, days
+
+
+def _run_runtime(args: argparse.Namespace, runtime_cli: RuntimeCLI) -> int:
+    """Executa um comando de runtime e devolve o código de saída."""
+    if args.command == "start":
+        session_id = runtime_cli.start(args.process, args.required, args.flow)
+        print(session_id)
+        return 0
+    if args.command == "resume":
+        state = runtime_cli.resume(args.session_id)
+        print(state)
+        return 0
+    if args.command == "reset":
+        state = runtime_cli.reset(args.session_id, args.step_id, args.restore)
+        print(state)
+        return 0
+    if args.command == "decide":
+        state = runtime_cli.decide(args.session_id, args.decision, args.actor)
+        print(state)
+        return 0
+    if args.command == "advance":
+        result = runtime_cli.advance(args.session_id, args.value, args.actor)
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+    if args.command == "status" and (args.all or args.ids_from):
+        if args.all:
+            session_ids = runtime_cli.all_session_ids()
+        else:
+            session_ids = _read_ids(args.ids_from)
+        failed = False
+        for entry in runtime_cli.status_many(session_ids, args.brief, args.workers):
+            failed = failed or "error" in entry
+            print(json.dumps(entry, ensure_ascii=False), flush=True)
+        return 1 if failed else 0
+    if args.command == "status":
+        if args.session_id is None:
+            print("[symforge] informe session_id, --all ou --ids-from", file=sys.stderr)
+            return 1
+        status = runtime_cli.status(args.session_id, brief=args.brief)
+        print(json.dumps(status, indent=2))
+        return 0
+    if args.command == "pause" and len(args.session_id) > 1:
+        for handoff_path in runtime_cli.pause_many(list(dict.fromkeys(args.session_id))):
+            print(f"[symforge] sessão pausada | handoff: {handoff_path}")
+        return 0
+    if args.command == "pause":
+        handoff_path = runtime_cli.pause(args.session_id[0])
+        print(f"[symforge] sessão pausada | handoff: {handoff_path}")
+        return 0
+    if args.command == "complete":
+        handoff_path = runtime_cli.complete(args.session_id)
+        print(f"[symforge] sessão concluída | handoff: {handoff_path}")
+        return 0
+    if args.command == "sessions" and args.sessions_command == "list":
+        for entry in runtime_cli.list_sessions(
+            args.state, args.process, args.since, args.created_since
+        ):
+            print(json.dumps(entry))
+        return 0
+    if args.command == "sessions" and args.sessions_command == "reindex":
+        count = runtime_cli.reindex()
+        print(f"[symforge] catálogo reconstruído | sessões: {count}")
+        return 0
+    if args.command == "sessions" and args.sessions_command == "migrate":
+        if not args.format and not args.layout:
+            print("[symforge] informe --format e/ou --layout", file=sys.stderr)
+            return 1
+        count = runtime_cli.migrate(args.format, args.layout)
+        settings = [
+            f"sessions.{key}: {value}"
+            for key, value in (("format", args.format), ("layout", args.layout))
+            if value
+        ]
+        print(
+            f"[symforge] sessões migradas: {count} "
+            f"| defina {', '.join(settings)} em .symforge/config.yml"
+        )
+        return 0
+    if args.command == "gc":
+        if not args.ttl and not runtime_cli.storage.retention.ttl_days:
+            print(
+                "[symforge] informe --ttl ESTADO=DIAS ou sessions.retention no config",
+                file=sys.stderr,
+            )
+            return 1
+        result = runtime_cli.gc(dict(args.ttl) if args.ttl else None, args.dry_run)
+        for session_id in result["sessions"]:
+            print(session_id)
+        verb = "seriam removidos" if args.dry_run else "removidos"
+        print(
+            f"[symforge] gc: {len(result['sessions'])} sessões e "
+            f"{len(result['handoffs'])} handoffs {verb}"
+        )
+        return 0
+    if args.command == "sessions" and args.sessions_command == "compact":
+        count = runtime_cli.compact(args.older_than)
+        print(f"[symforge] sessões compactadas: {count}")
+        return 0
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="symforge")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -23,11 +150,23 @@ def main(argv: list[str] | None = None) -> int:
 
     validate_cmd = sub.add_parser("validate", help="Valida PROCESS.yml")
     validate_cmd.add_argument("process_path", help="Caminho para PROCESS.yml")
-    validate_cmd.add_argument("--recursive", action="store_true", help="Validar artefatos referenciados")
+    validate_cmd.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Validar artefatos, subprocessos, specs, templates e prompts referenciados",
+    )
+    validate_cmd.add_argument(
+        "--flow",
+        action="store_true",
+        help="Analisar o fluxo e os subprocessos (alcance, becos sem saída, laços)",
+    )
 
     start_cmd = sub.add_parser("start", help="Inicia sessão de processo")
     start_cmd.add_argument("--process", required=True, help="Nome do processo")
     start_cmd.add_argument("--required", nargs="*", default=[], help="Artefatos obrigatórios")
+    start_cmd.add_argument(
+        "--flow", metavar="PROCESS_YML", help="PROCESS.yml cujo flow conduz a sessão"
+    )
     start_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
     start_cmd.add_argument("--auto-commit", action="store_true", help="Auto-commit Git por step")
 
@@ -39,27 +178,94 @@ def main(argv: list[str] | None = None) -> int:
     reset_cmd = sub.add_parser("reset", help="Reseta sessão para passo anterior")
     reset_cmd.add_argument("session_id")
     reset_cmd.add_argument("step_id")
+    reset_cmd.add_argument(
+        "--restore",
+        action="store_true",
+        help="Restaura os artefatos requeridos para o commit registrado do passo",
+    )
     reset_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
     reset_cmd.add_argument("--auto-commit", action="store_true", help="Auto-commit Git por step")
 
     decide_cmd = sub.add_parser("decide", help="Registra decisão HIL")
     decide_cmd.add_argument("session_id")
     decide_cmd.add_argument("decision", help="Decisão a registrar")
+    decide_cmd.add_argument("--actor", help="Quem tomou a decisão (registrado no histórico)")
     decide_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
     decide_cmd.add_argument("--auto-commit", action="store_true", help="Auto-commit Git por step")
 
+    advance_cmd = sub.add_parser("advance", help="Avança a sessão no flow do processo")
+    advance_cmd.add_argument("session_id")
+    advance_cmd.add_argument(
+        "value", nargs="?", help="Desvio em decisões/chamadas (omitir para concluir o passo)"
+    )
+    advance_cmd.add_argument("--actor", help="Quem executou a transição (registrado no histórico)")
+    advance_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+    advance_cmd.add_argument("--auto-commit", action="store_true", help="Auto-commit Git por step")
+
     status_cmd = sub.add_parser("status", help="Exibe status da sessão")
-    status_cmd.add_argument("session_id")
+    status_cmd.add_argument("session_id", nargs="?")
+    status_cmd.add_argument(
+        "--brief", action="store_true", help="Omite o histórico (lê só o cabeçalho da sessão)"
+    )
+    status_bulk = status_cmd.add_mutually_exclusive_group()
+    status_bulk.add_argument("--all", action="store_true", help="Todas as sessões do catálogo")
+    status_bulk.add_argument(
+        "--ids-from", metavar="FILE", help="Arquivo com um id por linha ('-' = stdin)"
+    )
+    status_cmd.add_argument(
+        "--workers", type=int, default=8, help="Threads de leitura em modo bulk (default: 8)"
+    )
     status_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
 
     pause_cmd = sub.add_parser("pause", help="Pausa sessão e gera handoff")
-    pause_cmd.add_argument("session_id")
+    pause_cmd.add_argument(
+        "session_id", nargs="+", help="Uma ou mais sessões (lote em uma única transação)"
+    )
     pause_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
 
     complete_cmd = sub.add_parser("complete", help="Completa sessão e gera handoff final")
     complete_cmd.add_argument("session_id")
     complete_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
 
+    sessions_cmd = sub.add_parser("sessions", help="Consulta e mantém o armazenamento de sessões")
+    sessions_sub = sessions_cmd.add_subparsers(dest="sessions_command", required=True)
+    sessions_list = sessions_sub.add_parser("list", help="Lista sessões a partir do catálogo")
+    sessions_list.add_argument("--state", choices=[s.value for s in SessionState])
+    sessions_list.add_argument("--process", help="Nome do processo")
+    sessions_list.add_argument(
+        "--since", type=datetime.fromisoformat, help="Atualizadas desde (ISO 8601)"
+    )
+    sessions_list.add_argument(
+        "--created-since", type=datetime.fromisoformat, help="Criadas desde (ISO 8601)"
+    )
+    sessions_list.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+    sessions_reindex = sessions_sub.add_parser("reindex", help="Reconstrói o catálogo de sessões")
+    sessions_reindex.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+    sessions_migrate = sessions_sub.add_parser(
+        "migrate", help="Converte o formato e/ou o layout dos arquivos"
+    )
+    sessions_migrate.add_argument("--format", choices=["yaml", "json", "msgpack"])
+    sessions_migrate.add_argument("--layout", choices=["flat", "sharded"])
+    sessions_migrate.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+    sessions_compact = sessions_sub.add_parser(
+        "compact", help="Move sessões concluídas para o arquivo compactado"
+    )
+    sessions_compact.add_argument(
+        "--older-than", type=int, metavar="DIAS", help="Apenas sessões sem atualização há N dias"
+    )
+    sessions_compact.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+
+    gc_cmd = sub.add_parser("gc", help="Remove sessões expiradas e seus handoffs")
+    gc_cmd.add_argument(
+        "--ttl",
+        type=_ttl,
+        action="append",
+        metavar="ESTADO=DIAS",
+        help="Retenção por estado (repetível); substitui sessions.retention do config",
+    )
+    gc_cmd.add_argument("--dry-run", action="store_true", help="Apenas lista o que seria removido")
+    gc_cmd.add_argument("--workspace", help="Diretório de trabalho (default: cwd)")
+
     plugin_cmd = sub.add_parser("plugin", help="Gerencia plugins")
     plugin_sub = plugin_cmd.add_subparsers(dest="plugin_command", required=True)
     plugin_add = plugin_sub.add_parser("add")
@@ -88,48 +294,41 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "validate":
-        validator = ValidateUseCases()
         process_path = Path(args.process_path).resolve()
-        result = validator.validate_process(process_path, recursive=args.recursive)
+        validator = ValidateUseCases(ProcessLoader(_process_cache_dir(process_path)))
+        result = validator.validate_process(
+            process_path, recursive=args.recursive, flow=args.flow
+        )
+        report = result.details.get("flow")
+        if report is not None:
+            for warning in report.warnings:
+                print(f"[symforge] aviso: {warning}", file=sys.stderr)
         if result.is_valid:
             phases = result.details.get("phases", [])
-            print(f"[symforge] PROCESS.yml ok | fases: {len(phases)}")
+            summary = f"[symforge] PROCESS.yml ok | fases: {len(phases)}"
+            if "references" in result.details:
+                summary += f" | referências: {len(result.details['references'])}"
+            if report is not None:
+                summary += f" | fluxo: {len(report.files)} arquivos, {report.nodes} nós"
+            print(summary)
             return 0
         print(f"[symforge] validação falhou: {', '.join(result.errors)}", file=sys.stderr)
         return 1
 
-    if args.command in {"start", "resume", "reset", "decide", "status", "pause", "complete"}:
+    if args.command in RUNTIME_COMMANDS:
         workspace = _workspace(getattr(args, "workspace", None))
         auto_commit = getattr(args, "auto_commit", False)
         runtime_cli = RuntimeCLI(workspace, auto_commit=auto_commit)
-        if args.command == "start":
-            session_id = runtime_cli.start(args.process, args.required)
-            print(session_id)
-            return 0
-        if args.command == "resume":
-            state = runtime_cli.resume(args.session_id)
-            print(state)
-            return 0
-        if args.command == "reset":
-            state = runtime_cli.reset(args.session_id, args.step_id)
-            print(state)
-            return 0
-        if args.command == "decide":
-            state = runtime_cli.decide(args.session_id, args.decision)
-            print(state)
-            return 0
-        if args.command == "status":
-            status = runtime_cli.status(args.session_id)
-            print(json.dumps(status, indent=2))
-            return 0
-        if args.command == "pause":
-            handoff_path = runtime_cli.pause(args.session_id)
-            print(f"[symforge] sessão pausada | handoff: {handoff_path}")
-            return 0
-        if args.command == "complete":
-            handoff_path = runtime_cli.complete(args.session_id)
-            print(f"[symforge] sessão concluída | handoff: {handoff_path}")
-            return 0
+        try:
+            code = _run_runtime(args, runtime_cli)
+        finally:
+            runtime_cli.close()
+        for error in runtime_cli.commit_errors:
+            print(
+                f"[symforge] {error} | a sessão foi gravada, mas a transição não entrou no Git",
+                file=sys.stderr,
+            )
+        return 1 if runtime_cli.commit_errors else code
 
     if args.command == "plugin":
         workspace = Path.cwd()
@@ -20,6 +20,16 @@ class StepNotFoundError(DomainException):
         super().__init__(f"Passo '{step_id}' sem versionamento para reset")
 
 
+class StepCommitNotFoundError(DomainException):
+    """Passo sem commit registrado para restaurar o workspace."""
+
+    def __init__(self, step_id: str):
+        self.step_id = step_id
+        super().__init__(
+            f"Passo '{step_id}' sem commit registrado (requer --auto-commit com commit imediato)"
+        )
+
+
 class NoPendingDecisionError(DomainException):
     """Nenhuma decisão pendente para registrar."""
 
@@ -80,3 +90,59 @@ class PluginLoadError(DomainException):
         if reason:
             msg += f": {reason}"
         super().__init__(msg)
+
+
+class StorageConfigError(DomainException):
+    """Configuração de armazenamento de sessões inválida."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(f"Configuração de armazenamento inválida: {reason}")
+
+
+class AutoCommitError(DomainException):
+    """Falha ao registrar transição de sessão no Git (auto-commit)."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(f"Auto-commit falhou: {reason}")
+
+
+class SessionConflictError(DomainException):
+    """Sessão alterada por outro processo desde que foi carregada."""
+
+    def __init__(self, session_id: str, expected_version: int, actual_version: int):
+        self.session_id = session_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"Sessão '{session_id}' alterada concorrentemente "
+            f"(versão esperada {expected_version}, atual {actual_version})"
+        )
+
+
+class InvalidFlowError(DomainException):
+    """Fluxo (`flow`) de PROCESS.yml inválido: não pode ser compilado."""
+
+    def __init__(self, process_id: str, reason: str):
+        self.process_id = process_id
+        self.reason = reason
+        super().__init__(f"Fluxo de '{process_id}' inválido: {reason}")
+
+
+class FlowTransitionError(DomainException):
+    """Transição não permitida a partir do nó corrente do fluxo."""
+
+    def __init__(self, node_id: str, reason: str):
+        self.node_id = node_id
+        self.reason = reason
+        super().__init__(f"Transição inválida em '{node_id}': {reason}")
+
+
+class ProcessFileError(DomainException):
+    """Arquivo PROCESS.yml ausente ou ilegível."""
+
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"PROCESS.yml '{path}': {reason}")
@@ -0,0 +1,343 @@
+"""
+Fluxo compilado de um PROCESS.yml.
+
+`compile_flow` transforma a lista `flow` (nós start/step/call/decision/end/return,
+ligados por `next`, `on_return` e `branches`) em um grafo imutável: nós
+numerados, `step_ref` resolvidos para o id do passo, tabelas de desvio por nó e
+o arquivo de cada subprocesso chamado. Compilado uma vez por processo, o grafo
+é percorrido pelo FlowEngine com uma consulta de tabela por transição, sem
+revisitar o YAML; subprocessos só são carregados quando uma chamada os alcança.
+"""
+
+import posixpath
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from symforge.domain.exceptions import FlowTransitionError, InvalidFlowError
+from symforge.domain.session import Session
+from symforge.domain.states import SessionState
+
+START = "start"
+STEP = "step"
+CALL = "call"
+DECISION = "decision"
+END = "end"
+RETURN = "return"
+NODE_TYPES = frozenset({START, STEP, CALL, DECISION, END, RETURN})
+
+NO_NODE = -1
+
+# Transições automáticas (start, entrada e retorno de chamadas) seguidas sem
+# parar em um passo ou decisão: acima disso o fluxo gira em falso.
+MAX_HOPS = 1000
+
+
+@dataclass(frozen=True)
+class CompiledFlow:
+    """
+    Grafo de um fluxo em tabelas paralelas indexadas pelo número do nó.
+    `next` vale NO_NODE quando o nó não tem sucessor direto; `branches` mapeia
+    valor → nó (`when` das decisões, status de `on_return` das chamadas) e é
+    vazio nos demais tipos. `calls` guarda, nas chamadas, o PROCESS.yml do
+    subprocesso relativo ao diretório deste processo (`sub_phase` da fase ou
+    `path` em `subprocesses`).
+    """
+
+    process_id: str
+    start: int
+    ids: tuple[str, ...]
+    kinds: tuple[str, ...]
+    next: tuple[int, ...]
+    branches: tuple[Mapping[str, int], ...]
+    steps: tuple[str | None, ...]
+    subprocesses: tuple[str | None, ...]
+    calls: tuple[str | None, ...]
+    return_status: tuple[str | None, ...]
+    index: Mapping[str, int]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_record(self) -> dict[str, Any]:
+        """Forma serializável (JSON): tabelas como listas, `index` omitido."""
+        return {
+            "process_id": self.process_id,
+            "start": self.start,
+            "ids": list(self.ids),
+            "kinds": list(self.kinds),
+            "next": list(self.next),
+            "branches": [dict(table) for table in self.branches],
+            "steps": list(self.steps),
+            "subprocesses": list(self.subprocesses),
+            "calls": list(self.calls),
+            "return_status": list(self.return_status),
+        }
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "CompiledFlow":
+        ids = tuple(record["ids"])
+        return cls(
+            process_id=record["process_id"],
+            start=record["start"],
+            ids=ids,
+            kinds=tuple(record["kinds"]),
+            next=tuple(record["next"]),
+            branches=tuple(MappingProxyType(dict(table)) for table in record["branches"]),
+            steps=tuple(record["steps"]),
+            subprocesses=tuple(record["subprocesses"]),
+            calls=tuple(record["calls"]),
+            return_status=tuple(record["return_status"]),
+            index=MappingProxyType({node_id: number for number, node_id in enumerate(ids)}),
+        )
+
+    def node(self, node_id: str) -> int:
+        number = self.index.get(node_id)
+        if number is None:
+            raise FlowTransitionError(node_id, f"nó inexistente no fluxo de '{self.process_id}'")
+        return number
+
+
+def compile_flow(data: Mapping[str, Any]) -> CompiledFlow:
+    """Compila o `flow` de um PROCESS.yml já carregado; levanta InvalidFlowError."""
+    process_id = str(data.get("id") or "?")
+    nodes = data.get("flow")
+    if not isinstance(nodes, list) or not nodes:
+        raise InvalidFlowError(process_id, "flow ausente ou vazio")
+
+    index: dict[str, int] = {}
+    for number, node in enumerate(nodes):
+        if not isinstance(node, dict) or not node.get("id"):
+            raise InvalidFlowError(process_id, f"nó #{number} sem id")
+        node_id = str(node["id"])
+        if node_id in index:
+            raise InvalidFlowError(process_id, f"nó '{node_id}' duplicado")
+        index[node_id] = number
+
+    def target(node_id: str, ref: Any) -> int:
+        number = index.get(str(ref)) if ref is not None else None
+        if number is None:
+            raise InvalidFlowError(process_id, f"'{node_id}' aponta para nó inexistente '{ref}'")
+        return number
+
+    refs = step_refs(data.get("phases"))
+    callees = subprocess_paths(data)
+    kinds: list[str] = []
+    successors: list[int] = []
+    tables: list[Mapping[str, int]] = []
+    steps: list[str | None] = []
+    subprocesses: list[str | None] = []
+    calls: list[str | None] = []
+    statuses: list[str | None] = []
+    for node in nodes:
+        node_id = str(node["id"])
+        kind = node.get("type")
+        if kind not in NODE_TYPES:
+            raise InvalidFlowError(process_id, f"'{node_id}' com tipo desconhecido '{kind}'")
+        successor = NO_NODE
+        table: dict[str, int] = {}
+        step = subprocess = call = status = None
+        if kind in (START, STEP):
+            successor = target(node_id, node.get("next"))
+        if kind == STEP:
+            step = refs.get(str(node.get("step_ref")))
+            if step is None:
+                raise InvalidFlowError(
+                    process_id, f"'{node_id}' com step_ref desconhecido '{node.get('step_ref')}'"
+                )
+        elif kind == CALL:
+            subprocess = node.get("subprocess_id")
+            if not subprocess:
+                raise InvalidFlowError(process_id, f"'{node_id}' sem subprocess_id")
+            call = callees.get(str(subprocess))
+            if call is None:
+                raise InvalidFlowError(
+                    process_id, f"'{node_id}' chama subprocesso não declarado '{subprocess}'"
+                )
+            on_return = node.get("on_return") or {}
+            if not isinstance(on_return, dict):
+                raise InvalidFlowError(process_id, f"'{node_id}': on_return não é um mapeamento")
+            table = {str(value): target(node_id, goto) for value, goto in on_return.items()}
+        elif kind == DECISION:
+            decision = node.get("decision") or {}
+            if not isinstance(decision, dict):
+                raise InvalidFlowError(process_id, f"'{node_id}': decision não é um mapeamento")
+            branches = decision.get("branches") or []
+            if not isinstance(branches, list) or not all(isinstance(b, dict) for b in branches):
+                raise InvalidFlowError(
+                    process_id, f"'{node_id}': branches não é uma lista de mapeamentos"
+                )
+            table = {str(b.get("when")): target(node_id, b.get("goto")) for b in branches}
+        elif kind == RETURN:
+            status = node.get("return_status")
+        if kind in (CALL, DECISION) and not table:
+            raise InvalidFlowError(process_id, f"'{node_id}' sem desvios")
+        kinds.append(kind)
+        successors.append(successor)
+        tables.append(MappingProxyType(table))
+        steps.append(step)
+        subprocesses.append(subprocess)
+        calls.append(call)
+        statuses.append(None if status is None else str(status))
+
+    starts = [number for number, kind in enumerate(kinds) if kind == START]
+    if len(starts) != 1:
+        raise InvalidFlowError(process_id, f"esperado um nó start, encontrados {len(starts)}")
+    if kinds[successors[starts[0]]] == START:
+        raise InvalidFlowError(process_id, "start aponta para si mesmo")
+
+    return CompiledFlow(
+        process_id=process_id,
+        start=starts[0],
+        ids=tuple(index),
+        kinds=tuple(kinds),
+        next=tuple(successors),
+        branches=tuple(tables),
+        steps=tuple(steps),
+        subprocesses=tuple(subprocesses),
+        calls=tuple(calls),
+        return_status=tuple(statuses),
+        index=MappingProxyType(index),
+    )
+
+
+def step_refs(phases: Any) -> dict[str, str]:
+    """`fase.passo` → id do passo, para cada passo declarado em `phases`."""
+    refs: dict[str, str] = {}
+    for phase in phases if isinstance(phases, list) else []:
+        if not isinstance(phase, dict):
+            continue
+        steps = phase.get("steps")
+        for step in steps if isinstance(steps, list) else []:
+            if isinstance(step, dict) and step.get("id"):
+                refs[f"{phase.get('id')}.{step['id']}"] = str(step["id"])
+    return refs
+
+
+def subprocess_paths(data: Mapping[str, Any]) -> dict[str, str]:
+    """id do subprocesso → PROCESS.yml: `sub_phase` das fases e `subprocesses[].path`."""
+    paths: dict[str, str] = {}
+    phases = data.get("phases")
+    for phase in phases if isinstance(phases, list) else []:
+        if isinstance(phase, dict) and phase.get("sub_phase"):
+            paths[str(phase.get("id"))] = str(phase["sub_phase"])
+    subprocesses = data.get("subprocesses")
+    for subprocess in subprocesses if isinstance(subprocesses, list) else []:
+        if isinstance(subprocess, dict) and subprocess.get("path"):
+            paths[str(subprocess.get("id"))] = str(subprocess["path"])
+    return paths
+
+
+class FlowEngine:
+    """
+    Conduz sessões por fluxos compilados, com pilha de chamadas.
+
+    A posição da sessão é o id do nó corrente (`session.flow_node`) no fluxo do
+    topo da pilha; `session.call_stack` guarda os nós `call` dos quadros
+    chamadores, do processo raiz (`session.flow_source`) para dentro. Um nó
+    call empilha o quadro e entra no subprocesso; um nó return desempilha e
+    segue o `on_return` da chamada com o `return_status`. Os fluxos são obtidos
+    por `load(caminho)` (relativo ao workspace) apenas quando alcançados.
+
+    Nós step aguardam `advance()` e registram o passo no histórico; nós
+    decision aguardam `advance(valor)` em AWAITING_DECISION; end, ou return no
+    processo raiz, concluem a sessão.
+    """
+
+    def __init__(self, source: str, load: Callable[[str], CompiledFlow]):
+        self.source = source
+        self.load = load
+
+    def enter(self, session: Session) -> None:
+        """Posiciona a sessão no início do fluxo raiz."""
+        session.call_stack = []
+        root = self.load(self.source)
+        self._settle(session, [(self.source, root)], root.start)
+
+    def frames(self, session: Session) -> list[tuple[str, CompiledFlow]]:
+        """(caminho, fluxo) de cada quadro da pilha, do raiz ao corrente."""
+        if session.flow_node is None:
+            raise FlowTransitionError("-", f"sessão '{session.id}' sem fluxo")
+        source = self.source
+        frames = [(source, self.load(source))]
+        for call_id in session.call_stack:
+            caller = frames[-1][1]
+            callee = caller.calls[caller.node(call_id)]
+            if callee is None:
+                raise FlowTransitionError(call_id, "quadro da pilha não é uma chamada")
+            source = resolve_source(source, callee)
+            frames.append((source, self.load(source)))
+        return frames
+
+    def options(self, session: Session) -> list[str]:
+        """Valores aceitos pelo nó corrente (vazio em nós step e terminais)."""
+        flow = self.frames(session)[-1][1]
+        return list(flow.branches[flow.node(session.flow_node)])
+
+    def advance(self, session: Session, value: str | None = None, actor: str | None = None) -> None:
+        frames = self.frames(session)
+        flow = frames[-1][1]
+        node = flow.node(session.flow_node)
+        kind = flow.kinds[node]
+        node_id = flow.ids[node]
+        if kind == STEP:
+            if value is not None:
+                raise FlowTransitionError(node_id, "passo não recebe valor")
+            if session.state != SessionState.RUNNING:
+                raise FlowTransitionError(node_id, f"sessão em {session.state.value}")
+            session.add_step(flow.steps[node], actor)
+            self._settle(session, frames, flow.next[node])
+            return
+        if kind != DECISION:
+            raise FlowTransitionError(node_id, "fluxo encerrado")
+        if session.state != SessionState.AWAITING_DECISION:
+            raise FlowTransitionError(node_id, f"sessão em {session.state.value}")
+        successor = flow.branches[node].get(value) if value is not None else None
+        if successor is None:
+            options = ", ".join(flow.branches[node])
+            raise FlowTransitionError(node_id, f"valor '{value}' fora das opções ({options})")
+        session.register_decision(value, actor)
+        self._settle(session, frames, successor)
+
+    def _settle(
+        self, session: Session, frames: list[tuple[str, CompiledFlow]], node: int
+    ) -> None:
+        """Segue as transições automáticas até um passo, decisão ou fim."""
+        stack = session.call_stack
+        for _ in range(MAX_HOPS):
+            source, flow = frames[-1]
+            kind = flow.kinds[node]
+            if kind == START:
+                node = flow.next[node]
+            elif kind == CALL:
+                stack.append(flow.ids[node])
+                callee = resolve_source(source, flow.calls[node])
+                sub = self.load(callee)
+                frames.append((callee, sub))
+                node = sub.start
+            elif kind == RETURN and stack:
+                status = flow.return_status[node]
+                frames.pop()
+                caller = frames[-1][1]
+                call = caller.node(stack.pop())
+                node = caller.branches[call].get(status, NO_NODE)
+                if node == NO_NODE:
+                    raise InvalidFlowError(
+                        caller.process_id,
+                        f"'{caller.ids[call]}' sem on_return para o status '{status}'",
+                    )
+            else:
+                break
+        else:
+            raise FlowTransitionError(flow.ids[node], "transições automáticas em ciclo")
+        session.flow_node = flow.ids[node]
+        if kind in (END, RETURN):
+            session.mark_completed()
+        elif kind == DECISION and session.state == SessionState.RUNNING:
+            session.mark_awaiting_decision()
+
+
+def resolve_source(source: str, relative: str | None) -> str:
+    """Caminho do subprocesso a partir do PROCESS.yml chamador."""
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), relative or ""))
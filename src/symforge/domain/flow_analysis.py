@@ -0,0 +1,349 @@
+"""
+Análise estática dos fluxos de um processo e de todos os subprocessos chamados.
+
+`analyze_flow` monta um único grafo com os nós de todos os arquivos (numerados
+globalmente) e o percorre em tempo linear no número de nós e arestas:
+
+- referências: alvos de `next`/`goto`/`on_return`, `step_ref`, subprocessos e
+  estrutura de cada nó (start único, decisões com desvios, chamadas com on_return);
+- alcance a partir do start raiz, com semântica de chamada: a continuação de um
+  `on_return` só é alcançada se o subprocesso alcança um return com aquele status;
+- caminho até o fim: busca reversa a partir dos nós end (e return do raiz);
+  nós alcançáveis fora dela ficam presos em um laço sem saída;
+- laços automáticos: ciclos só de start/call/return, que o FlowEngine
+  percorreria sem parar em um passo ou decisão.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from symforge.domain.exceptions import ProcessFileError
+from symforge.domain.flow import (
+    CALL,
+    DECISION,
+    END,
+    NODE_TYPES,
+    RETURN,
+    START,
+    STEP,
+    resolve_source,
+    step_refs,
+    subprocess_paths,
+)
+
+_AUTOMATIC = frozenset({START, CALL, RETURN})
+
+
+@dataclass
+class FlowReport:
+    """Resultado da análise: erros impedem a execução; avisos apontam nós inúteis."""
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    nodes: int = 0
+    edges: int = 0
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+class _Graph:
+    """Nós de todos os arquivos em listas paralelas indexadas pelo número global."""
+
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self.ids: list[str] = []
+        self.kinds: list[str] = []
+        self.succ: list[list[int]] = []
+        self.status: list[str | None] = []
+        # Chamadas: arquivo do subprocesso e tabela status → continuação.
+        self.callee: dict[int, str] = {}
+        self.on_return: dict[int, dict[str, int]] = {}
+        self.start: dict[str, int] = {}
+        self.returns: dict[str, list[int]] = {}
+        self.call_sites: dict[str, list[int]] = {}
+
+    def label(self, node: int) -> str:
+        return f"{self.files[node]}: '{self.ids[node]}'"
+
+
+def analyze_flow(root: str, load: Callable[[str], dict[str, Any]]) -> FlowReport:
+    """
+    Analisa o fluxo de `root` e dos subprocessos alcançados por chamadas.
+    `load(caminho)` devolve o documento de um PROCESS.yml (caminhos relativos
+    ao de `root`, como no FlowEngine) ou levanta ProcessFileError.
+    """
+    report = FlowReport()
+    graph = _Graph()
+    _build(graph, root, load, report)
+    if root not in graph.start:
+        return report
+    report.nodes = len(graph.ids)
+    report.edges = sum(map(len, graph.succ)) + sum(map(len, graph.on_return.values()))
+    _check_statuses(graph, report)
+    reached = _reach(graph, root)
+    for node in range(len(graph.ids)):
+        if not reached[node]:
+            report.warnings.append(f"{graph.label(node)} inalcançável a partir do start")
+    finishing = _finishing(graph, root)
+    for node in range(len(graph.ids)):
+        if reached[node] and not finishing[node]:
+            report.errors.append(f"{graph.label(node)} sem caminho até um end")
+    for node in _automatic_cycles(graph):
+        report.errors.append(f"{graph.label(node)} em laço sem passos ou decisões")
+    return report
+
+
+def _build(
+    graph: _Graph, root: str, load: Callable[[str], dict[str, Any]], report: FlowReport
+) -> None:
+    """Lê cada arquivo uma vez (a partir das chamadas) e numera seus nós."""
+    pending = [root]
+    seen = {root}
+    calls: list[tuple[int, str]] = []
+    while pending:
+        source = pending.pop()
+        try:
+            data = load(source)
+        except ProcessFileError as exc:
+            report.errors.append(f"{source}: {exc.reason}")
+            continue
+        report.files.append(source)
+        for node, callee in _add_file(graph, source, data, report):
+            calls.append((node, callee))
+            if callee not in seen:
+                seen.add(callee)
+                pending.append(callee)
+    # Chamadas resolvidas depois de todos os arquivos numerados.
+    for node, callee in calls:
+        if callee not in graph.start:
+            # Arquivo ilegível ou sem start (erro já reportado): as continuações
+            # viram sucessores diretos para não gerar erros em cascata.
+            graph.succ[node].extend(graph.on_return[node].values())
+            continue
+        graph.succ[node].append(graph.start[callee])
+        graph.callee[node] = callee
+        graph.call_sites.setdefault(callee, []).append(node)
+
+
+def _add_file(
+    graph: _Graph, source: str, data: dict[str, Any], report: FlowReport
+) -> list[tuple[int, str]]:
+    """Numera os nós de um arquivo; devolve as chamadas (nó, arquivo do subprocesso)."""
+    nodes = data.get("flow")
+    if not isinstance(nodes, list) or not nodes:
+        report.errors.append(f"{source}: flow ausente ou vazio")
+        return []
+    base = len(graph.ids)
+    local: dict[str, int] = {}
+    valid: list[dict[str, Any]] = []
+    for position, node in enumerate(nodes):
+        if not isinstance(node, dict) or not node.get("id"):
+            report.errors.append(f"{source}: nó #{position} sem id")
+            continue
+        node_id = str(node["id"])
+        if node_id in local:
+            report.errors.append(f"{source}: nó '{node_id}' duplicado")
+            continue
+        local[node_id] = base + len(valid)
+        valid.append(node)
+        graph.files.append(source)
+        graph.ids.append(node_id)
+        graph.kinds.append(str(node.get("type")))
+        graph.succ.append([])
+        graph.status.append(None)
+
+    def target(node_id: str, ref: Any) -> int | None:
+        number = local.get(str(ref)) if ref is not None else None
+        if number is None:
+            report.errors.append(f"{source}: '{node_id}' aponta para nó inexistente '{ref}'")
+        return number
+
+    refs = step_refs(data.get("phases"))
+    callees = subprocess_paths(data)
+    calls: list[tuple[int, str]] = []
+    starts: list[int] = []
+    for node in valid:
+        node_id = str(node["id"])
+        number = local[node_id]
+        kind = graph.kinds[number]
+        successors: list[int | None] = []
+        if kind not in NODE_TYPES:
+            report.errors.append(f"{source}: '{node_id}' com tipo desconhecido '{kind}'")
+        elif kind in (START, STEP):
+            successors.append(target(node_id, node.get("next")))
+            if kind == START:
+                starts.append(number)
+            elif str(node.get("step_ref")) not in refs:
+                report.errors.append(
+                    f"{source}: '{node_id}' com step_ref desconhecido '{node.get('step_ref')}'"
+                )
+        elif kind == DECISION:
+            decision = node.get("decision")
+            branches = decision.get("branches") if isinstance(decision, dict) else None
+            if not isinstance(branches, list):
+                branches = []
+            targets = [b.get("goto") for b in branches if isinstance(b, dict)]
+            if not targets:
+                report.errors.append(f"{source}: '{node_id}' sem desvios")
+            successors.extend(target(node_id, goto) for goto in targets)
+        elif kind == CALL:
+            on_return = node.get("on_return")
+            if not isinstance(on_return, dict) or not on_return:
+                report.errors.append(f"{source}: '{node_id}' sem desvios")
+                on_return = {}
+            table = {str(value): target(node_id, goto) for value, goto in on_return.items()}
+            graph.on_return[number] = {s: t for s, t in table.items() if t is not None}
+            subprocess = node.get("subprocess_id")
+            path = callees.get(str(subprocess))
+            if path is not None and subprocess:
+                calls.append((number, resolve_source(source, path)))
+            else:
+                if not subprocess:
+                    report.errors.append(f"{source}: '{node_id}' sem subprocess_id")
+                else:
+                    report.errors.append(
+                        f"{source}: '{node_id}' chama subprocesso não declarado '{subprocess}'"
+                    )
+                successors.extend(graph.on_return[number].values())
+        elif kind == RETURN:
+            status = node.get("return_status")
+            graph.status[number] = None if status is None else str(status)
+            graph.returns.setdefault(source, []).append(number)
+        graph.succ[number].extend(t for t in successors if t is not None)
+    if len(starts) != 1:
+        report.errors.append(f"{source}: esperado um nó start, encontrados {len(starts)}")
+    else:
+        graph.start[source] = starts[0]
+    return calls
+
+
+def _check_statuses(graph: _Graph, report: FlowReport) -> None:
+    """Status retornados sem on_return na chamada, e on_return nunca retornados."""
+    for node, callee in graph.callee.items():
+        returned = {graph.status[r] for r in graph.returns.get(callee, [])}
+        handled = graph.on_return[node]
+        for status in sorted(s for s in returned if s not in handled):
+            report.errors.append(
+                f"{graph.label(node)} sem on_return para o status '{status}' de {callee}"
+            )
+        for status in sorted(s for s in handled if s not in returned):
+            report.warnings.append(
+                f"{graph.label(node)}: on_return '{status}' nunca retornado por {callee}"
+            )
+
+
+def _reach(graph: _Graph, root: str) -> bytearray:
+    """
+    Alcance a partir do start raiz. Um return com status s no subprocesso F
+    libera a continuação `on_return[s]` das chamadas a F já alcançadas; uma
+    chamada alcançada depois herda os status que F já retornou. Cada par
+    (chamada, status) é tratado uma vez.
+    """
+    reached = bytearray(len(graph.ids))
+    callers: dict[str, list[int]] = {}
+    returned: dict[str, set[str | None]] = {}
+    stack: list[int] = []
+
+    def visit(node: int | None) -> None:
+        if node is not None and not reached[node]:
+            reached[node] = 1
+            stack.append(node)
+
+    visit(graph.start[root])
+    while stack:
+        node = stack.pop()
+        for successor in graph.succ[node]:
+            visit(successor)
+        kind = graph.kinds[node]
+        if kind == CALL and node in graph.callee:
+            callee = graph.callee[node]
+            callers.setdefault(callee, []).append(node)
+            for status in returned.get(callee, ()):
+                visit(graph.on_return[node].get(status))
+        elif kind == RETURN and graph.files[node] != root:
+            source = graph.files[node]
+            status = graph.status[node]
+            statuses = returned.setdefault(source, set())
+            if status not in statuses:
+                statuses.add(status)
+                for call in callers.get(source, ()):
+                    visit(graph.on_return[call].get(status))
+    return reached
+
+
+def _finishing(graph: _Graph, root: str) -> bytearray:
+    """Nós com caminho até um end (ou return do raiz): busca reversa."""
+    reverse: list[list[int]] = [[] for _ in graph.ids]
+    for node, successors in enumerate(graph.succ):
+        for successor in successors:
+            reverse[successor].append(node)
+    for callee, sites in graph.call_sites.items():
+        for ret in graph.returns.get(callee, []):
+            for call in sites:
+                continuation = graph.on_return[call].get(graph.status[ret])
+                if continuation is not None:
+                    reverse[continuation].append(ret)
+    # Returns sem on_return em alguma chamada já são erro de status: contam
+    # como saída para não repetir o erro em todos os nós anteriores.
+    unhandled = {
+        ret
+        for callee, sites in graph.call_sites.items()
+        for ret in graph.returns.get(callee, [])
+        if any(graph.status[ret] not in graph.on_return[call] for call in sites)
+    }
+    finishing = bytearray(len(graph.ids))
+    stack = [
+        node
+        for node, kind in enumerate(graph.kinds)
+        if kind == END or (kind == RETURN and graph.files[node] == root) or node in unhandled
+    ]
+    for node in stack:
+        finishing[node] = 1
+    while stack:
+        node = stack.pop()
+        for predecessor in reverse[node]:
+            if not finishing[predecessor]:
+                finishing[predecessor] = 1
+                stack.append(predecessor)
+    return finishing
+
+
+def _automatic_cycles(graph: _Graph) -> list[int]:
+    """
+    Nós que fecham ciclos formados só por transições automáticas (start, call,
+    return → continuação): DFS iterativa com três cores no subgrafo desses nós.
+    """
+    automatic: list[list[int]] = [[] for _ in graph.ids]
+    for node, kind in enumerate(graph.kinds):
+        if kind in (START, CALL):
+            automatic[node] = [s for s in graph.succ[node] if graph.kinds[s] in _AUTOMATIC]
+    for callee, sites in graph.call_sites.items():
+        for ret in graph.returns.get(callee, []):
+            for call in sites:
+                continuation = graph.on_return[call].get(graph.status[ret])
+                if continuation is not None and graph.kinds[continuation] in _AUTOMATIC:
+                    automatic[ret].append(continuation)
+    color = bytearray(len(graph.ids))  # 0 = novo, 1 = na pilha, 2 = concluído
+    closing: list[int] = []
+    for origin in range(len(graph.ids)):
+        if color[origin] or not automatic[origin]:
+            continue
+        color[origin] = 1
+        stack = [(origin, iter(automatic[origin]))]
+        while stack:
+            node, successors = stack[-1]
+            for successor in successors:
+                if color[successor] == 1:
+                    closing.append(successor)
+                elif color[successor] == 0:
+                    color[successor] = 1
+                    stack.append((successor, iter(automatic[successor])))
+                    break
+            else:
+                color[node] = 2
+                stack.pop()
+    return closing
@@ -0,0 +1,100 @@
+"""
+Eventos tipados do histórico de sessão.
+
+No formato antigo o histórico era uma lista de strings, com decisões
+codificadas como "decision:<x>". Cada item agora é um HistoryEvent (tipo,
+valor, timestamp, ator); `str(evento)` e a comparação com strings preservam a
+forma antiga, e `from_record` lê tanto as strings legadas quanto a codificação
+compacta gravada em disco: `[código, valor, timestamp?, ator?]`.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+STEP = "step"
+DECISION = "decision"
+
+_DECISION_PREFIX = f"{DECISION}:"
+_CODES = {STEP: "s", DECISION: "d"}
+_KINDS = {code: kind for kind, code in _CODES.items()}
+
+
+def _now() -> float:
+    return round(time.time(), 3)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class HistoryEvent:
+    kind: str
+    value: str
+    timestamp: float | None = None
+    actor: str | None = None
+
+    @classmethod
+    def step(cls, step_id: str, actor: str | None = None) -> "HistoryEvent":
+        return cls(STEP, step_id, _now(), actor)
+
+    @classmethod
+    def decision(cls, decision: str, actor: str | None = None) -> "HistoryEvent":
+        return cls(DECISION, decision, _now(), actor)
+
+    @classmethod
+    def parse(cls, text: str) -> "HistoryEvent":
+        """Converte um item legado ("passo" ou "decision:<x>"), sem timestamp."""
+        if text.startswith(_DECISION_PREFIX):
+            return cls(DECISION, text[len(_DECISION_PREFIX) :])
+        return cls(STEP, text)
+
+    @classmethod
+    def coerce(cls, item: "HistoryEvent | str") -> "HistoryEvent":
+        return item if isinstance(item, HistoryEvent) else cls.parse(item)
+
+    @classmethod
+    def from_record(cls, record: Any) -> "HistoryEvent":
+        """Decodifica um item gravado: string legada ou lista compacta."""
+        if isinstance(record, str):
+            return cls.parse(record)
+        code, value, *rest = record
+        timestamp = rest[0] if rest else None
+        actor = rest[1] if len(rest) > 1 else None
+        return cls(_KINDS[code], value, timestamp, actor)
+
+    def to_record(self) -> list[Any]:
+        """Codificação compacta; campos opcionais ausentes no fim são omitidos."""
+        record: list[Any] = [_CODES[self.kind], self.value, self.timestamp, self.actor]
+        while record[-1] is None:
+            record.pop()
+        return record
+
+    @property
+    def is_decision(self) -> bool:
+        return self.kind == DECISION
+
+    def __str__(self) -> str:
+        return f"{_DECISION_PREFIX}{self.value}" if self.kind == DECISION else self.value
+
+    def __eq__(self, other: object) -> bool:
+        # Strings comparam pela forma legada: `"passo" in session.history` e
+        # `history.index("passo")` continuam funcionando.
+        if isinstance(other, str):
+            return str(self) == other
+        if isinstance(other, HistoryEvent):
+            return (self.kind, self.value, self.timestamp, self.actor) == (
+                other.kind,
+                other.value,
+                other.timestamp,
+                other.actor,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+def encode_history(history: list[HistoryEvent | str]) -> list[list[Any]]:
+    return [HistoryEvent.coerce(item).to_record() for item in history]
+
+
+def decode_history(records: list[Any]) -> list[HistoryEvent]:
+    return [HistoryEvent.from_record(record) for record in records]
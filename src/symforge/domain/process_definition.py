@@ -5,3 +5,5 @@ from dataclasses import dataclass, field
 class ProcessDefinition:
     name: str
     required_artifacts: list[str] = field(default_factory=list)
+    # PROCESS.yml (relativo ao workspace) cujo `flow` conduz as sessões do processo.
+    flow_source: str | None = None
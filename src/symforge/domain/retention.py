@@ -0,0 +1,46 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.session import SessionSummary
+from symforge.domain.states import SessionState
+
+_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Política de coleta de sessões: TTL em dias por estado. Uma sessão em um
+    estado da política, sem atualização há mais que o TTL, expirou.
+    Estados fora da política nunca expiram.
+    """
+
+    ttl_days: dict[SessionState, float] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, mapping: Mapping[str, Any]) -> "RetentionPolicy":
+        """Constrói a política a partir de `{ESTADO: dias}` (config ou CLI)."""
+        ttl: dict[SessionState, float] = {}
+        for name, days in mapping.items():
+            try:
+                state = SessionState(str(name).upper())
+            except ValueError:
+                raise StorageConfigError(f"estado '{name}' inválido na retenção") from None
+            try:
+                value = float(days)
+            except (TypeError, ValueError):
+                raise StorageConfigError(f"TTL de {state.value} deve ser numérico") from None
+            if value < 0:
+                raise StorageConfigError(f"TTL de {state.value} deve ser >= 0")
+            ttl[state] = value
+        return cls(ttl)
+
+    @property
+    def states(self) -> frozenset[SessionState]:
+        return frozenset(self.ttl_days)
+
+    def expired(self, summary: SessionSummary, now: float) -> bool:
+        days = self.ttl_days.get(summary.state)
+        return days is not None and summary.updated_at < now - days * _DAY
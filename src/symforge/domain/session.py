@@ -1,6 +1,9 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 from symforge.domain.exceptions import StepNotFoundError
+from symforge.domain.history import HistoryEvent
 from symforge.domain.states import SessionState
 
 
@@ -11,8 +14,41 @@ class Session:
     state: SessionState = SessionState.RUNNING
     required_artifacts: list[str] = field(default_factory=list)
     missing_artifacts: list[str] = field(default_factory=list)
-    history: list[str] = field(default_factory=list)
+    history: list[HistoryEvent] = field(default_factory=list)
     pending_decision: bool = False
+    # PROCESS.yml do fluxo (relativo ao workspace), id do nó corrente e nós `call`
+    # dos quadros chamadores (subprocessos em andamento); ver FlowEngine.
+    flow_source: str | None = None
+    flow_node: str | None = None
+    call_stack: list[str] = field(default_factory=list)
+    # Versão persistida; incrementada a cada update (controle otimista de concorrência).
+    version: int = 0
+    # Quantos itens do histórico já estão persistidos; reset_to rebaixa a marca
+    # para que repositórios incrementais (journal) detectem truncamentos.
+    synced_history: int = field(default=0, init=False, repr=False, compare=False)
+    # Índice item → primeira posição no histórico (forma de string legada),
+    # estendido incrementalmente a cada append; ver `_step_positions`.
+    _step_index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_history: list | None = field(default=None, init=False, repr=False, compare=False)
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
+
+    def copy(self) -> "Session":
+        """Cópia independente: listas próprias (os eventos do histórico são imutáveis)."""
+        clone = Session(
+            id=self.id,
+            process_name=self.process_name,
+            state=self.state,
+            required_artifacts=list(self.required_artifacts),
+            missing_artifacts=list(self.missing_artifacts),
+            history=list(self.history),
+            pending_decision=self.pending_decision,
+            flow_source=self.flow_source,
+            flow_node=self.flow_node,
+            call_stack=list(self.call_stack),
+            version=self.version,
+        )
+        clone.synced_history = self.synced_history
+        return clone
 
     def mark_awaiting_input(self, missing: list[str]) -> None:
         self.state = SessionState.AWAITING_INPUT
@@ -26,26 +62,97 @@ class Session:
         self.state = SessionState.AWAITING_DECISION
         self.pending_decision = True
 
-    def register_decision(self, decision: str) -> None:
-        self.history.append(f"decision:{decision}")
+    def register_decision(self, decision: str, actor: str | None = None) -> None:
+        self.history.append(HistoryEvent.decision(decision, actor))
         self.pending_decision = False
         self.state = SessionState.RUNNING
 
-    def add_step(self, step_id: str) -> None:
-        self.history.append(step_id)
+    def add_step(self, step_id: str, actor: str | None = None) -> None:
+        self.history.append(HistoryEvent.step(step_id, actor))
+
+    def steps(self) -> list[HistoryEvent]:
+        return [e for e in map(HistoryEvent.coerce, self.history) if not e.is_decision]
+
+    def decisions(self) -> list[HistoryEvent]:
+        return [e for e in map(HistoryEvent.coerce, self.history) if e.is_decision]
 
     def can_reset(self, step_id: str) -> bool:
-        return step_id in self.history
+        return step_id in self._step_positions()
+
+    def position(self, step_id: str) -> int | None:
+        """Posição da primeira ocorrência de `step_id` no histórico (alvo do reset)."""
+        return self._step_positions().get(step_id)
 
     def reset_to(self, step_id: str) -> None:
-        if step_id not in self.history:
+        index = self._step_positions()
+        idx = index.get(step_id)
+        if idx is None:
             raise StepNotFoundError(step_id)
-        idx = self.history.index(step_id)
-        self.history = self.history[: idx + 1]
+        # Trunca no lugar: o prefixo mantido não é copiado, e só os itens
+        # removidos saem do índice.
+        history = self.history
+        for pos in range(idx + 1, len(history)):
+            key = str(history[pos])
+            if index.get(key) == pos:
+                del index[key]
+        del history[idx + 1 :]
+        self._indexed_len = len(history)
+        self.synced_history = min(self.synced_history, idx + 1)
         self.state = SessionState.RUNNING
 
+    def _step_positions(self) -> dict[str, int]:
+        """
+        Índice do histórico sincronizado com a lista atual: apenas os itens
+        acrescentados desde a última consulta são indexados. Se a lista foi
+        substituída ou encolheu por fora de `reset_to`, o índice é refeito.
+        """
+        history = self.history
+        if history is not self._indexed_history or len(history) < self._indexed_len:
+            self._step_index = {}
+            self._indexed_history = history
+            self._indexed_len = 0
+        index = self._step_index
+        for pos in range(self._indexed_len, len(history)):
+            index.setdefault(str(history[pos]), pos)
+        self._indexed_len = len(history)
+        return index
+
     def mark_paused(self) -> None:
         self.state = SessionState.PAUSED
 
     def mark_completed(self) -> None:
         self.state = SessionState.COMPLETED
+
+
+class LazySession(Session):
+    """
+    Sessão carregada apenas pelo cabeçalho: `history` é lido do repositório no
+    primeiro acesso (leitura, mutação ou gravação), via `load_history`.
+    """
+
+    def __init__(self, load_history: Callable[[], list[HistoryEvent]], **header: Any):
+        super().__init__(**header)
+        del self.history
+        self._load_history = load_history
+
+    @property
+    def history_loaded(self) -> bool:
+        return "history" in self.__dict__
+
+    def __getattr__(self, name: str) -> Any:
+        # Chamado apenas para atributos ausentes, ou seja, `history` ainda não lido.
+        if name != "history" or "_load_history" not in self.__dict__:
+            raise AttributeError(name)
+        self.history = self._load_history()
+        self.synced_history = len(self.history)
+        return self.history
+
+
+@dataclass(frozen=True)
+class SessionSummary:
+    """Resumo de sessão para listagens (sem histórico)."""
+
+    id: str
+    process_name: str
+    state: SessionState
+    updated_at: float
@@ -0,0 +1,81 @@
+"""
+Ids de sessão ordenáveis por tempo (estilo ULID, Crockford base32 minúsculo).
+
+26 caracteres: 10 para o timestamp em milissegundos (48 bits) e 16 para a
+parte aleatória (80 bits). A ordem lexicográfica dos ids é a ordem de criação;
+dentro do mesmo milissegundo a parte aleatória é incrementada (monotônica).
+"""
+
+import secrets
+import threading
+import time
+from datetime import datetime
+
+ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+ID_LENGTH = 26
+_TIME_CHARS = 10
+_RANDOM_BITS = 80
+_CHARSET = frozenset(ALPHABET)
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def _decode(text: str) -> int:
+    value = 0
+    for ch in text:
+        value = value * 32 + ALPHABET.index(ch)
+    return value
+
+
+class SessionIdGenerator:
+    """Gerador thread-safe de ids monotônicos."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new(self, now: float | None = None) -> str:
+        ms = int((time.time() if now is None else now) * 1000)
+        with self._lock:
+            if ms <= self._last_ms:
+                ms = self._last_ms
+                random_part = self._last_random + 1
+                if random_part >> _RANDOM_BITS:
+                    # Parte aleatória esgotada no mesmo milissegundo: avança o relógio lógico.
+                    ms += 1
+                    random_part = secrets.randbits(_RANDOM_BITS)
+            else:
+                random_part = secrets.randbits(_RANDOM_BITS)
+            self._last_ms, self._last_random = ms, random_part
+        return _encode(ms, _TIME_CHARS) + _encode(random_part, ID_LENGTH - _TIME_CHARS)
+
+
+_generator = SessionIdGenerator()
+
+
+def new_session_id() -> str:
+    return _generator.new()
+
+
+def is_time_ordered(session_id: str) -> bool:
+    """True para ids no formato ordenável (ids hex legados não carregam tempo)."""
+    return len(session_id) == ID_LENGTH and set(session_id) <= _CHARSET
+
+
+def session_id_time(session_id: str) -> datetime | None:
+    """Instante de criação codificado no id, ou None para ids legados."""
+    if not is_time_ordered(session_id):
+        return None
+    return datetime.fromtimestamp(_decode(session_id[:_TIME_CHARS]) / 1000)
+
+
+def lower_bound(since: datetime) -> str:
+    """Menor id possível criado em `since`: ids >= este valor foram criados depois."""
+    return _encode(int(since.timestamp() * 1000), _TIME_CHARS) + "0" * (ID_LENGTH - _TIME_CHARS)
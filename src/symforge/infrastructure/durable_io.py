@@ -0,0 +1,139 @@
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from symforge.domain.exceptions import StorageConfigError
+
+try:
+    import fcntl
+except ImportError:  # plataformas sem flock (ex.: Windows)
+    fcntl = None  # type: ignore[assignment]
+
+DURABILITY_MODES = ("none", "batch", "always")
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = False, exclusive: bool = False) -> None:
+    """
+    Grava `data` em um temporário no mesmo diretório e o renomeia sobre `path`.
+    Um crash no meio da escrita deixa o arquivo anterior intacto, nunca truncado.
+    Com `exclusive`, levanta FileExistsError em vez de sobrescrever um arquivo existente.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+            if fsync:
+                fp.flush()
+                os.fsync(fp.fileno())
+        if exclusive:
+            _publish_exclusive(tmp, path)
+        else:
+            os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    if fsync:
+        fsync_dir(path.parent)
+
+
+def _publish_exclusive(tmp: str, path: Path) -> None:
+    """Publica `tmp` em `path` apenas se `path` ainda não existir (hard link atômico)."""
+    try:
+        os.link(tmp, path)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Sistema de arquivos sem hard links: reserva o nome com O_EXCL e o substitui.
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        os.replace(tmp, path)
+        return
+    os.unlink(tmp)
+
+
+def fsync_dir(path: Path) -> None:
+    """Persiste a entrada de diretório (renomes/criações); no-op onde não suportado."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def file_stamp(path: Path) -> tuple[int, int, int] | None:
+    """
+    inode/mtime/tamanho do arquivo, ou None se ausente. Como atomic_write
+    sempre troca o inode, qualquer regravação muda o carimbo.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Lock exclusivo entre processos (flock) sobre `path`; no-op sem fcntl."""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as fp:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+class DurableWriter:
+    """
+    Escrita de arquivos de sessão com política de fsync configurável:
+    - none: apenas rename atômico (rápido; o SO decide quando persistir)
+    - batch: rename atômico; fsync dos arquivos alterados em `sync()`
+    - always: fsync do arquivo e do diretório a cada escrita
+    """
+
+    def __init__(self, durability: str = "batch"):
+        if durability not in DURABILITY_MODES:
+            raise StorageConfigError(f"durability '{durability}' não suportada")
+        self.durability = durability
+        self._dirty: dict[Path, None] = {}
+
+    def write(self, path: Path, data: bytes, exclusive: bool = False) -> None:
+        atomic_write(path, data, fsync=self.durability == "always", exclusive=exclusive)
+        self._mark(path)
+
+    def append(self, path: Path, text: str) -> None:
+        with path.open("a", encoding="utf-8") as fp:
+            fp.write(text)
+            if self.durability == "always":
+                fp.flush()
+                os.fsync(fp.fileno())
+        self._mark(path)
+
+    def sync(self) -> None:
+        """Aplica o fsync pendente do modo batch (arquivos e diretórios)."""
+        dirty, self._dirty = list(self._dirty), {}
+        for path in dirty:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        for directory in dict.fromkeys(p.parent for p in dirty):
+            fsync_dir(directory)
+
+    def _mark(self, path: Path) -> None:
+        if self.durability == "batch":
+            self._dirty[path] = None
@@ -0,0 +1,365 @@
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Protocol
+
+from symforge.domain.exceptions import AutoCommitError
+from symforge.infrastructure.durable_io import file_lock
+
+
+def find_git_root(path: Path) -> Path | None:
+    current = path.resolve()
+    for candidate in [current, *current.parents]:
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def restore_paths(repo_root: Path, commit: str, paths: list[Path]) -> list[Path]:
+    """
+    Restaura no working tree os `paths` rastreados em `commit` (um único
+    `git restore --source`, sem tocar no índice). Caminhos ausentes no commit
+    são ignorados; retorna os restaurados.
+    """
+    rel = {p.resolve().relative_to(repo_root).as_posix(): p for p in paths}
+    if not rel:
+        return []
+    root = str(repo_root)
+    listed = subprocess.run(
+        ["git", "-C", root, "ls-tree", "-r", "--name-only", "--full-tree", commit, "--", *rel],
+        capture_output=True,
+        text=True,
+    )
+    if listed.returncode != 0:
+        raise AutoCommitError(f"git ls-tree: {listed.stderr.strip()}")
+    tracked = [name for name in listed.stdout.splitlines() if name in rel]
+    if tracked:
+        restored = subprocess.run(
+            ["git", "-C", root, "restore", f"--source={commit}", "--worktree", "--", *tracked],
+            capture_output=True,
+            text=True,
+        )
+        if restored.returncode != 0:
+            raise AutoCommitError(f"git restore: {restored.stderr.strip()}")
+    return [rel[name] for name in tracked]
+
+
+class Committer(Protocol):
+    """
+    Contrato dos backends de auto-commit usados pelo SessionRepository.
+    `commit` retorna o id do commit quando ele é gravado na hora (None se
+    adiado para um lote/checkpoint ou se o Git estiver indisponível).
+    """
+
+    def commit(self, paths: list[Path], message: str) -> str | None: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class GitCommitter:
+    """
+    Commit imediato de transições no branch atual sem usar o índice compartilhado.
+    Cada commit é montado em um índice temporário privado (GIT_INDEX_FILE) a
+    partir do HEAD, gravado com `commit-tree` e publicado com `update-ref`
+    em compare-and-swap; se outro processo avançou o branch, refaz sobre o
+    novo HEAD. Assim, processos concorrentes não disputam o .git/index.lock
+    nem perdem histórico.
+    """
+
+    MAX_ATTEMPTS = 20
+    ZERO_OID = "0" * 40
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+
+    def commit(self, paths: list[Path], message: str) -> str | None:
+        rel_paths = [p.resolve().relative_to(self.repo_root).as_posix() for p in paths]
+        try:
+            for attempt in range(self.MAX_ATTEMPTS):
+                commit = self._try_commit(rel_paths, message)
+                if commit is not None:
+                    self._sync_shared_index(rel_paths)
+                    return commit
+                time.sleep(random.uniform(0, 0.005 * (attempt + 1)))
+        except OSError:
+            # Git indisponível; não impede o fluxo.
+            return None
+        raise AutoCommitError(f"branch atualizado concorrentemente {self.MAX_ATTEMPTS} vezes")
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _try_commit(self, rel_paths: list[str], message: str) -> str | None:
+        """
+        Tenta publicar um commit e retorna seu id (o HEAD, se nada mudou);
+        None se o compare-and-swap falhar.
+        """
+        ref = self._git("symbolic-ref", "-q", "HEAD", check=False).strip() or "HEAD"
+        head = self._git("rev-parse", "--verify", "-q", "HEAD", check=False).strip()
+        with tempfile.TemporaryDirectory(prefix="symforge-index-") as tmp:
+            env = {**os.environ, "GIT_INDEX_FILE": str(Path(tmp) / "index")}
+            if head:
+                self._git("read-tree", head, env=env)
+            self._git("update-index", "--add", "--remove", "--", *rel_paths, env=env)
+            tree = self._git("write-tree", env=env).strip()
+        if head and tree == self._git("rev-parse", f"{head}^{{tree}}").strip():
+            return head  # nada mudou desde o último commit
+        parents = ["-p", head] if head else []
+        commit = self._git("commit-tree", tree, *parents, "-m", message).strip()
+        old = head or self.ZERO_OID
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_root), "update-ref", "-m", message, ref, commit, old],
+            capture_output=True,
+            text=True,
+        )
+        return commit if result.returncode == 0 else None
+
+    def _sync_shared_index(self, rel_paths: list[str]) -> None:
+        """Atualiza o índice do workspace (best-effort) para o `git status` refletir o commit."""
+        subprocess.run(
+            ["git", "-C", str(self.repo_root), "update-index", "-q", "--add", "--remove", "--", *rel_paths],
+            capture_output=True,
+        )
+
+    def _git(self, *args: str, env: dict[str, str] | None = None, check: bool = True) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_root), *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if check and result.returncode != 0:
+            raise AutoCommitError(f"git {args[0]}: {result.stderr.strip()}")
+        return result.stdout
+
+
+class CoalescingCommitter:
+    """
+    Agrupa transições em um único commit por lote.
+    O lote é entregue ao committer interno ao atingir `max_batch` transições,
+    quando a janela de `window_ms` expira (0 = sem limite de tempo) ou em
+    `flush()`/`close()`; a janela e o `flush()` também descarregam o interno.
+    Uma falha na gravação pela janela (thread do timer) fica guardada e é
+    levantada no próximo `commit()`/`flush()`/`close()`.
+    """
+
+    def __init__(self, inner: Committer, max_batch: int = 1, window_ms: int = 0):
+        self.inner = inner
+        self.max_batch = max_batch
+        self.window_ms = window_ms
+        self._paths: dict[Path, None] = {}
+        self._messages: list[str] = []
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._started = 0.0
+        self._window_error: AutoCommitError | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._messages)
+
+    def commit(self, paths: list[Path], message: str) -> str | None:
+        with self._lock:
+            if not self._messages:
+                self._started = time.monotonic()
+                self._arm_timer()
+            self._paths.update(dict.fromkeys(paths))
+            self._messages.append(message)
+            expired = self.window_ms and (time.monotonic() - self._started) * 1000 >= self.window_ms
+            if len(self._messages) >= self.max_batch or expired:
+                self._commit_batch()
+        self._raise_window_error()
+        return None
+
+    def flush(self) -> None:
+        with self._lock:
+            self._commit_batch()
+            self.inner.flush()
+        self._raise_window_error()
+
+    def _commit_batch(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._messages:
+                return
+            paths, messages = list(self._paths), self._messages
+            self._paths, self._messages = {}, []
+            self.inner.commit(paths, self._combine(messages))
+
+    def close(self) -> None:
+        self.flush()
+        self.inner.close()
+
+    def _arm_timer(self) -> None:
+        if not self.window_ms or self.max_batch <= 1:
+            return
+        self._timer = threading.Timer(self.window_ms / 1000, self._flush_window)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_window(self) -> None:
+        try:
+            self.flush()
+        except AutoCommitError as exc:
+            with self._lock:
+                self._window_error = exc
+
+    def _raise_window_error(self) -> None:
+        with self._lock:
+            error, self._window_error = self._window_error, None
+        if error is not None:
+            raise error
+
+    def _combine(self, messages: list[str]) -> str:
+        if len(messages) == 1:
+            return messages[0]
+        body = "\n".join(f"- {m}" for m in messages)
+        return f"[symforge] {len(messages)} transições de sessão\n\n{body}"
+
+
+class FastImportCommitter:
+    """
+    Auto-commit por `git fast-import` na ref dedicada (default
+    refs/symforge/sessions), sem tocar no índice nem no HEAD do workspace.
+    `commit` enfileira a transição (com o conteúdo dos arquivos naquele
+    momento); a fila é gravada com um único fast-import em `flush()`/`close()`
+    ou ao atingir `max_pending` commits ou `max_pending_bytes`, o que limita a
+    memória retida e o que se perde se o processo morrer antes do flush.
+
+    A gravação acontece sob um lock exclusivo da ref, com a ponta lida dentro
+    dele: runtimes concorrentes encadeiam seus commits em vez de partir do
+    mesmo pai (o fast-import recusaria a atualização não fast-forward e as
+    transições se perderiam). Uma falha do fast-import levanta AutoCommitError.
+    """
+
+    DEFAULT_REF = "refs/symforge/sessions"
+    FALLBACK_IDENT = "symforge <symforge@localhost>"
+    MAX_PENDING = 256
+    MAX_PENDING_BYTES = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        repo_root: Path,
+        ref: str = DEFAULT_REF,
+        max_pending: int = MAX_PENDING,
+        max_pending_bytes: int = MAX_PENDING_BYTES,
+    ):
+        self.repo_root = repo_root
+        self.ref = ref
+        self.max_pending = max_pending
+        self.max_pending_bytes = max_pending_bytes
+        self._ident: str | None = None
+        # Por commit: cabeçalho (até a mensagem) e operações de arquivo; o
+        # `from` do primeiro é decidido na gravação.
+        self._pending: list[tuple[bytes, bytes]] = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+
+    def commit(self, paths: list[Path], message: str) -> str | None:
+        header = b"".join([
+            f"commit {self.ref}\n".encode(),
+            f"committer {self._identity()} {int(time.time())} +0000\n".encode(),
+            self._data(message.encode("utf-8")),
+        ])
+        ops: list[bytes] = []
+        for path in paths:
+            rel = self._quote(path.resolve().relative_to(self.repo_root).as_posix())
+            if path.exists():
+                ops.append(f"M 100644 inline {rel}\n".encode("utf-8"))
+                ops.append(self._data(path.read_bytes()))
+            else:
+                ops.append(f"D {rel}\n".encode("utf-8"))
+        ops.append(b"\n")
+        entry = (header, b"".join(ops))
+        with self._lock:
+            self._pending.append(entry)
+            self._pending_bytes += len(entry[0]) + len(entry[1])
+            full = (
+                len(self._pending) >= self.max_pending
+                or self._pending_bytes >= self.max_pending_bytes
+            )
+        if full:
+            self.flush()
+        return None
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending, self._pending_bytes = self._pending, [], 0
+        if not pending:
+            return
+        root = str(self.repo_root)
+        try:
+            with file_lock(self._lock_path()):
+                parent = subprocess.run(
+                    ["git", "-C", root, "rev-parse", "--verify", "-q", f"{self.ref}^{{commit}}"],
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+                (header, ops), *rest = pending
+                chunks = [header, f"from {parent}\n".encode() if parent else b"", ops]
+                for header, ops in rest:
+                    chunks += [header, ops]
+                result = subprocess.run(
+                    ["git", "-C", root, "fast-import", "--quiet"],
+                    input=b"".join(chunks),
+                    capture_output=True,
+                )
+        except OSError:
+            # Git indisponível; não impede o fluxo.
+            return
+        if result.returncode != 0:
+            error = result.stderr.decode("utf-8", "replace").strip()
+            raise AutoCommitError(f"git fast-import ({len(pending)} commits perdidos): {error}")
+
+    def close(self) -> None:
+        self.flush()
+
+    def _identity(self) -> str:
+        if self._ident is None:
+            self._ident = self.FALLBACK_IDENT
+            try:
+                ident = subprocess.run(
+                    ["git", "-C", str(self.repo_root), "var", "GIT_COMMITTER_IDENT"],
+                    capture_output=True,
+                    text=True,
+                )
+            except OSError:
+                return self._ident
+            if ident.returncode == 0:
+                # Formato "Nome <email> <timestamp> <tz>"; o horário é gerado por commit.
+                self._ident = ident.stdout.strip().rsplit(" ", 2)[0]
+        return self._ident
+
+    def _lock_path(self) -> Path:
+        git_dir = self.repo_root / ".git"
+        if not git_dir.is_dir():
+            # Worktree ou submódulo: `.git` é um arquivo apontando para o diretório real.
+            common = subprocess.run(
+                ["git", "-C", str(self.repo_root), "rev-parse", "--git-common-dir"],
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            git_dir = self.repo_root / common if common else git_dir.parent
+        return git_dir / "symforge-fast-import.lock"
+
+    @staticmethod
+    def _data(payload: bytes) -> bytes:
+        return f"data {len(payload)}\n".encode() + payload + b"\n"
+
+    @staticmethod
+    def _quote(path: str) -> str:
+        if not any(ch in path for ch in ('"', "\\", "\n")):
+            return path
+        escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
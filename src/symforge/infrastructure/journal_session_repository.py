@@ -0,0 +1,212 @@
+import json
+import os
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+from symforge.domain.history import encode_history
+from symforge.domain.session import Session
+from symforge.infrastructure.durable_io import file_stamp
+from symforge.infrastructure.git_committer import Committer
+from symforge.infrastructure.session_repository import SessionRepository
+
+_CHUNK = 4096
+
+
+class JournalSessionRepository(SessionRepository):
+    """
+    Repositório event-sourced: cada transição acrescenta um registro ao journal
+    da sessão (<id>.journal, JSON lines) em vez de reescrever o documento.
+    A cada `snapshot_every` registros o estado completo é gravado em <id>.yml
+    (ou na extensão do formato configurado)
+    e o journal é reiniciado; `load` lê o snapshot e reaplica o journal.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        auto_commit: bool = False,
+        committer: Committer | None = None,
+        session_format: str = "yaml",
+        durability: str = "batch",
+        layout: str = "flat",
+        snapshot_every: int = 100,
+        cache_size: int = 0,
+    ):
+        super().__init__(
+            base_dir,
+            auto_commit=auto_commit,
+            committer=committer,
+            session_format=session_format,
+            durability=durability,
+            layout=layout,
+            cache_size=cache_size,
+        )
+        self.snapshot_every = snapshot_every
+        # Por sessão: último seq gravado, registros desde o snapshot e tamanho do histórico.
+        self._seq: dict[str, int] = {}
+        self._pending: dict[str, int] = {}
+        self._length: dict[str, int] = {}
+
+    def _write(self, session: Session, exclusive: bool = False) -> list[Path]:
+        if (
+            exclusive
+            or session.id not in self._seq
+            or self._pending[session.id] >= self.snapshot_every
+        ):
+            return self._write_snapshot(session, exclusive)
+
+        seq = self._seq[session.id] + 1
+        record: dict[str, Any] = {
+            "seq": seq,
+            "state": session.state.value,
+            "missing_artifacts": session.missing_artifacts,
+            "pending_decision": session.pending_decision,
+            "version": session.version,
+        }
+        if session.flow_source is not None:
+            record["flow_node"] = session.flow_node
+            record["call_stack"] = session.call_stack
+        synced = min(session.synced_history, self._length[session.id])
+        if synced < self._length[session.id]:
+            record["truncate"] = synced
+        if len(session.history) > synced:
+            record["append"] = encode_history(session.history[synced:])
+
+        path = self._journal_path(session.id)
+        self.files.append(path, json.dumps(record, ensure_ascii=False) + "\n")
+        self._seq[session.id] = seq
+        self._pending[session.id] += 1
+        self._length[session.id] = len(session.history)
+        return [path]
+
+    def _write_snapshot(self, session: Session, exclusive: bool = False) -> list[Path]:
+        seq = self._seq.get(session.id, 0)
+        data = self._to_dict(session)
+        # `journal_seq` antes do histórico: entra no cabeçalho (ver _stored_version).
+        history = data.pop("history")
+        data["journal_seq"] = seq
+        data["history"] = history
+        paths = self._write_document(session.id, data, exclusive)
+        journal = self._journal_path(session.id)
+        self.files.write(journal, b"")
+        self._seq[session.id] = seq
+        self._pending[session.id] = 0
+        self._length[session.id] = len(session.history)
+        return [*paths, journal]
+
+    def _read(self, session_id: str) -> dict[str, Any]:
+        data = super()._read(session_id)
+        seq = data.pop("journal_seq", 0)
+        history = list(data.get("history", []))
+        pending = 0
+        legacy = self._legacy.get(session_id, [])
+        directory = legacy[0].parent if legacy else self._session_dir(session_id)
+        journal = directory / f"{session_id}.journal"
+        if directory != self._session_dir(session_id):
+            # Sessão em outro layout: o próximo save grava um snapshot no
+            # diretório configurado e remove documento e journal antigos.
+            pending = self.snapshot_every
+            if journal.exists():
+                legacy.append(journal)
+        if journal.exists():
+            with journal.open(encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Registro final truncado por crash: ignora o restante e
+                        # força um snapshot no próximo save para descartá-lo.
+                        pending = self.snapshot_every
+                        break
+                    if record["seq"] <= seq:
+                        continue
+                    if "truncate" in record:
+                        del history[record["truncate"] :]
+                    history.extend(record.get("append", []))
+                    data["state"] = record["state"]
+                    data["missing_artifacts"] = record["missing_artifacts"]
+                    data["pending_decision"] = record["pending_decision"]
+                    data["version"] = record.get("version", data.get("version", 0))
+                    if "flow_node" in record:
+                        data["flow_node"] = record["flow_node"]
+                        data["call_stack"] = record.get("call_stack", [])
+                    seq = record["seq"]
+                    pending += 1
+        data["history"] = history
+        self._seq[session_id] = seq
+        self._pending[session_id] = pending
+        self._length[session_id] = len(history)
+        return data
+
+    def _stored_version(self, session_id: str) -> int:
+        """
+        Versão sem replay: cabeçalho do snapshot e último registro do journal.
+        Snapshots sem `journal_seq` no cabeçalho (gravados antes dele ir para lá)
+        ou registro final truncado caem na leitura completa.
+        """
+        try:
+            path, fmt = self._locate(session_id)
+        except FileNotFoundError:
+            return super()._stored_version(session_id)  # arquivada
+        with path.open("rb") as fp:
+            header = fmt.load_header(fp)
+        if header is None or "journal_seq" not in header:
+            return self._read(session_id).get("version", 0)
+        line = _last_line(path.parent / f"{session_id}.journal")
+        if not line:
+            return header["version"]
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return self._read(session_id).get("version", 0)
+        if record["seq"] <= header["journal_seq"]:
+            return header["version"]  # journal anterior ao snapshot
+        return record.get("version", header["version"])
+
+    def _stamp(self, session_id: str) -> Hashable | None:
+        # O estado depende do snapshot e do journal: os dois entram no carimbo.
+        stamp = super()._stamp(session_id)
+        if stamp is None:
+            return None
+        journals = [d / f"{session_id}.journal" for d in self._session_dirs(session_id)]
+        return (stamp, *(file_stamp(j) for j in journals))
+
+    def _read_header(self, session_id: str) -> dict[str, Any] | None:
+        # O estado atual depende do replay do journal; o snapshot sozinho pode estar defasado.
+        return None
+
+    def _session_paths(self, session_id: str) -> list[Path]:
+        journals = [
+            directory / f"{session_id}.journal" for directory in self._session_dirs(session_id)
+        ]
+        return [*super()._session_paths(session_id), *(j for j in journals if j.exists())]
+
+    def _sidecar_paths(self, session_id: str, directory: Path) -> list[Path]:
+        sidecars = super()._sidecar_paths(session_id, directory)
+        journal = directory / f"{session_id}.journal"
+        return [*sidecars, journal] if journal.exists() else sidecars
+
+    def _journal_path(self, session_id: str) -> Path:
+        return self._session_dir(session_id) / f"{session_id}.journal"
+
+
+def _last_line(path: Path) -> bytes:
+    """Última linha não vazia do arquivo, lida do fim em blocos (b"" se ausente)."""
+    try:
+        fp = path.open("rb")
+    except FileNotFoundError:
+        return b""
+    with fp:
+        pos = fp.seek(0, os.SEEK_END)
+        buffer = b""
+        while pos > 0:
+            size = min(_CHUNK, pos)
+            pos -= size
+            fp.seek(pos)
+            buffer = fp.read(size) + buffer
+            content = buffer.rstrip(b"\n")
+            cut = content.rfind(b"\n")
+            if cut >= 0:
+                return content[cut + 1 :]
+        return buffer.rstrip(b"\n")
@@ -0,0 +1,68 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from symforge.infrastructure.durable_io import atomic_write
+
+
+class ProcessCache:
+    """
+    Cache em disco de PROCESS.yml processados (.symforge/cache/processes/):
+    um arquivo JSON por conteúdo, `<sha256>.json`, com o documento lido e o flow
+    compilado (ou o erro de compilação). A chave é o hash dos bytes do arquivo,
+    então uma edição gera outra chave e só o arquivo alterado é recompilado;
+    VERSION entra no caminho e invalida tudo quando o formato muda.
+
+    Leituras defeituosas contam como ausência (o registro é refeito) e
+    documentos com valores fora do JSON (ex.: datas do YAML) ou com chaves que
+    não são strings (ex.: `true:` do YAML, que o JSON gravaria como "true" e
+    não como o "True" de `str()`) não são gravados: a leitura do cache tem de
+    devolver exatamente o documento interpretado.
+    O diretório pode ser apagado a qualquer momento.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: Path):
+        self.directory = directory / f"v{self.VERSION}"
+
+    @staticmethod
+    def digest(raw: bytes) -> str:
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        try:
+            return json.loads(self._path(digest).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, digest: str, record: dict[str, Any]) -> None:
+        if not _string_keys(record):
+            return
+        try:
+            payload = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            atomic_write(self._path(digest), payload.encode("utf-8"), fsync=False)
+        except OSError:
+            pass  # cache é opcional: falha de escrita não impede o comando
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.json"
+
+
+def _string_keys(value: Any) -> bool:
+    """Todas as chaves de mapeamentos (em qualquer nível) são strings."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if not all(isinstance(key, str) for key in item):
+                return False
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return True
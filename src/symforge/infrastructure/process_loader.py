@@ -0,0 +1,108 @@
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from symforge.domain.exceptions import InvalidFlowError, ProcessFileError
+from symforge.domain.flow import CompiledFlow, compile_flow
+from symforge.infrastructure.process_cache import ProcessCache
+from symforge.infrastructure.session_formats import YamlLoader
+
+
+@dataclass(frozen=True)
+class ProcessEntry:
+    """PROCESS.yml processado: documento lido e flow compilado, ou o erro de compilação."""
+
+    data: dict[str, Any]
+    flow: CompiledFlow | None
+    error: InvalidFlowError | None
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "data": self.data,
+            "flow": self.flow.to_record() if self.flow is not None else None,
+            "error": [self.error.process_id, self.error.reason] if self.error else None,
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "ProcessEntry":
+        flow = record.get("flow")
+        error = record.get("error")
+        return cls(
+            data=record["data"],
+            flow=CompiledFlow.from_record(flow) if flow is not None else None,
+            error=InvalidFlowError(*error) if error else None,
+        )
+
+
+class ProcessLoader:
+    """
+    Lê PROCESS.yml e compila o `flow`, uma vez por arquivo: o resultado fica em
+    memória, indexado pelo caminho resolvido, e é compartilhado por todas as
+    sessões do processo. Com `cache_dir`, o resultado também vai para o
+    ProcessCache, indexado pelo hash do conteúdo: invocações seguintes da CLI
+    leem o JSON gravado sem interpretar o YAML. Thread-safe.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache = ProcessCache(cache_dir) if cache_dir is not None else None
+        self._entries: dict[Path, ProcessEntry] = {}
+        self._lock = threading.Lock()
+
+    def document(self, path: Path) -> dict[str, Any]:
+        """Documento YAML do arquivo (mapeamento; vazio para arquivo sem conteúdo)."""
+        return self._entry(path).data
+
+    def load(self, path: Path) -> CompiledFlow:
+        """Flow compilado do arquivo; levanta InvalidFlowError se não compilar."""
+        entry = self._entry(path)
+        if entry.flow is None:
+            assert entry.error is not None
+            raise InvalidFlowError(entry.error.process_id, entry.error.reason)
+        return entry.flow
+
+    def _entry(self, path: Path) -> ProcessEntry:
+        key = path.resolve()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            with self._lock:
+                entry = self._entries.setdefault(key, entry)
+        return entry
+
+    def _read(self, path: Path) -> ProcessEntry:
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            raise ProcessFileError(str(path), "arquivo não encontrado") from None
+        digest = ""
+        if self.cache is not None:
+            digest = self.cache.digest(raw)
+            record = self.cache.get(digest)
+            if record is not None:
+                return ProcessEntry.from_record(record)
+        entry = self._compile(self._parse(path, raw))
+        if self.cache is not None:
+            self.cache.put(digest, entry.to_record())
+        return entry
+
+    @staticmethod
+    def _parse(path: Path, raw: bytes) -> dict[str, Any]:
+        try:
+            data = yaml.load(raw, Loader=YamlLoader)
+        except yaml.YAMLError as exc:
+            raise ProcessFileError(str(path), f"YAML inválido: {exc}") from None
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ProcessFileError(str(path), "documento não é um mapeamento")
+        return data
+
+    @staticmethod
+    def _compile(data: dict[str, Any]) -> ProcessEntry:
+        try:
+            return ProcessEntry(data, compile_flow(data), None)
+        except InvalidFlowError as exc:
+            return ProcessEntry(data, None, exc)
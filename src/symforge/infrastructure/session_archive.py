@@ -0,0 +1,89 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Posição de um documento de sessão dentro do pacote."""
+
+    offset: int
+    length: int
+    format: str
+    updated_at: float
+
+
+class SessionArchive:
+    """
+    Arquivo compactado de sessões encerradas: um pacote append-only
+    (archive.pack) com os documentos serializados em sequência e um índice
+    (archive.idx) com uma linha `id<TAB>offset<TAB>tamanho<TAB>formato<TAB>timestamp`
+    por documento. A última linha de um id prevalece; a leitura é um único
+    seek + read no pacote.
+    """
+
+    PACK_FILENAME = "archive.pack"
+    INDEX_FILENAME = "archive.idx"
+
+    def __init__(self, base_dir: Path):
+        self.pack_path = base_dir / self.PACK_FILENAME
+        self.index_path = base_dir / self.INDEX_FILENAME
+        self._entries: dict[str, ArchiveEntry] = {}
+        self._index_size = -1
+
+    def append(self, documents: list[tuple[str, str, bytes, float]], fsync: bool = False) -> None:
+        """
+        Acrescenta documentos (id, formato, bytes, updated_at) ao pacote.
+        O pacote é gravado antes do índice: um crash deixa no máximo bytes
+        órfãos no pacote, nunca uma entrada de índice apontando para o vazio.
+        """
+        if not documents:
+            return
+        lines: list[str] = []
+        with self.pack_path.open("ab") as pack:
+            offset = pack.seek(0, os.SEEK_END)
+            for session_id, fmt, payload, updated_at in documents:
+                pack.write(payload)
+                lines.append(f"{session_id}\t{offset}\t{len(payload)}\t{fmt}\t{updated_at!r}\n")
+                offset += len(payload)
+            if fsync:
+                pack.flush()
+                os.fsync(pack.fileno())
+        with self.index_path.open("a", encoding="utf-8") as index:
+            index.write("".join(lines))
+            if fsync:
+                index.flush()
+                os.fsync(index.fileno())
+
+    def read(self, session_id: str) -> tuple[str, bytes] | None:
+        """Retorna (formato, bytes) do documento arquivado, ou None se ausente."""
+        entry = self.entries().get(session_id)
+        if entry is None:
+            return None
+        with self.pack_path.open("rb") as pack:
+            pack.seek(entry.offset)
+            return entry.format, pack.read(entry.length)
+
+    def entries(self) -> dict[str, ArchiveEntry]:
+        """Índice em memória, relido apenas quando o arquivo de índice cresce."""
+        try:
+            size = self.index_path.stat().st_size
+        except FileNotFoundError:
+            return {}
+        if size != self._index_size:
+            self._entries = self._load_index()
+            self._index_size = size
+        return self._entries
+
+    def _load_index(self) -> dict[str, ArchiveEntry]:
+        entries: dict[str, ArchiveEntry] = {}
+        with self.index_path.open(encoding="utf-8") as fp:
+            for line in fp:
+                fields = line[:-1].split("\t")
+                if len(fields) != 5 or not line.endswith("\n"):
+                    continue  # linha truncada por escrita interrompida
+                session_id, offset, length, fmt, updated_at = fields
+                entries[session_id] = ArchiveEntry(
+                    int(offset), int(length), fmt, float(updated_at)
+                )
+        return entries
@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from symforge.domain.session import Session
+
+
+class SessionCache:
+    """
+    Cache LRU limitado de sessões, validado por carimbo: cada entrada guarda o
+    carimbo do armazenamento (ex.: inode/mtime/tamanho do arquivo) lido quando
+    a sessão foi carregada ou gravada. Um carimbo diferente na consulta indica
+    modificação externa e descarta a entrada. Devolve sempre cópias: quem
+    recebe a sessão pode alterá-la sem afetar o cache. Thread-safe.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[Hashable, Session]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str, stamp: Hashable | None) -> Session | None:
+        entry = self._lookup(session_id, stamp)
+        return entry.copy() if entry is not None else None
+
+    def version(self, session_id: str, stamp: Hashable | None) -> int | None:
+        entry = self._lookup(session_id, stamp)
+        return entry.version if entry is not None else None
+
+    def put(self, session: Session, stamp: Hashable | None) -> None:
+        if stamp is None:
+            self.discard(session.id)
+            return
+        snapshot = session.copy()
+        with self._lock:
+            self._entries[session.id] = (stamp, snapshot)
+            self._entries.move_to_end(session.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, session_id: str, stamp: Hashable | None) -> Session | None:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if stamp is None or entry[0] != stamp:
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return entry[1]
@@ -0,0 +1,138 @@
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from symforge.domain.session import Session, SessionSummary
+from symforge.domain.session_id import is_time_ordered, lower_bound
+from symforge.domain.states import SessionState
+from symforge.infrastructure.durable_io import atomic_write, file_lock
+
+_DELETED = "-"
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return value.encode("latin-1", "backslashreplace").decode("unicode_escape")
+
+
+class SessionCatalog:
+    """
+    Índice compacto (catalog.tsv) das sessões de um diretório: uma linha
+    `id<TAB>estado<TAB>timestamp<TAB>processo` por save, sem parse de YAML/JSON.
+    A última linha de um id prevalece e estado `-` remove o id. O arquivo é
+    compactado quando as linhas obsoletas superam as entradas vivas.
+
+    Appends e reescritas (compactação, rebuild) tomam o mesmo lock
+    (.locks/catalog.lock): a compactação relê o arquivo dentro dele, então uma linha
+    acrescentada por outro processo nunca se perde na troca do arquivo.
+    """
+
+    FILENAME = "catalog.tsv"
+    COMPACT_MIN_LINES = 1000
+
+    def __init__(self, base_dir: Path):
+        self.path = base_dir / self.FILENAME
+        self.lock_path = base_dir / ".locks" / "catalog.lock"
+
+    def record(self, session: Session, updated_at: float) -> None:
+        self._append(self._line(session, updated_at))
+
+    def remove(self, session_id: str) -> None:
+        self._append(f"{session_id}\t{_DELETED}\t0\t\n")
+
+    def query(
+        self,
+        state: SessionState | None = None,
+        process_name: str | None = None,
+        since: datetime | None = None,
+        created_since: datetime | None = None,
+    ) -> list[SessionSummary]:
+        wanted_state = SessionState(state).value if state is not None else None
+        wanted_process = _escape(process_name) if process_name is not None else None
+        min_ts = since.timestamp() if since is not None else None
+        min_id = lower_bound(created_since) if created_since is not None else None
+        results: list[SessionSummary] = []
+        for session_id, entry_state, updated_at, process in self._entries().values():
+            if min_id is not None and (session_id < min_id or not is_time_ordered(session_id)):
+                continue
+            if wanted_state is not None and entry_state != wanted_state:
+                continue
+            if wanted_process is not None and process != wanted_process:
+                continue
+            ts = float(updated_at)
+            if min_ts is not None and ts < min_ts:
+                continue
+            results.append(
+                SessionSummary(
+                    id=session_id,
+                    process_name=_unescape(process),
+                    state=SessionState(entry_state),
+                    updated_at=ts,
+                )
+            )
+        results.sort(key=lambda s: s.updated_at)
+        return results
+
+    def rebuild(self, entries: Iterable[tuple[Session, float]]) -> int:
+        lines = [self._line(session, updated_at) for session, updated_at in entries]
+        with file_lock(self.lock_path):
+            self._replace(lines)
+        return len(lines)
+
+    def _entries(self) -> dict[str, list[str]]:
+        lines = self._read_lines()
+        entries = self._parse(lines)
+        if self._needs_compaction(lines, entries):
+            with file_lock(self.lock_path):
+                # Relido sob o lock: inclui linhas acrescentadas desde a leitura acima.
+                lines = self._read_lines()
+                entries = self._parse(lines)
+                if self._needs_compaction(lines, entries):
+                    self._replace(["\t".join(fields) + "\n" for fields in entries.values()])
+        return entries
+
+    def _read_lines(self) -> list[str]:
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as fp:
+            return fp.readlines()
+
+    @staticmethod
+    def _parse(lines: list[str]) -> dict[str, list[str]]:
+        entries: dict[str, list[str]] = {}
+        for line in lines:
+            fields = line[:-1].split("\t")
+            if len(fields) != 4 or not line.endswith("\n"):
+                continue  # linha truncada por escrita interrompida
+            if fields[1] == _DELETED:
+                entries.pop(fields[0], None)
+            else:
+                entries[fields[0]] = fields
+        return entries
+
+    def _needs_compaction(self, lines: list[str], entries: dict[str, list[str]]) -> bool:
+        return len(lines) > self.COMPACT_MIN_LINES and len(lines) > 2 * len(entries)
+
+    def _line(self, session: Session, updated_at: float) -> str:
+        return (
+            f"{session.id}\t{session.state.value}\t{updated_at!r}\t"
+            f"{_escape(session.process_name)}\n"
+        )
+
+    def _append(self, line: str) -> None:
+        with file_lock(self.lock_path), self.path.open("a", encoding="utf-8") as fp:
+            fp.write(line)
+
+    def _replace(self, lines: list[str]) -> None:
+        """Troca o arquivo inteiro; chamado sob o lock do catálogo."""
+        atomic_write(self.path, "".join(lines).encode("utf-8"))
@@ -0,0 +1,125 @@
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+import yaml
+
+from symforge.domain.exceptions import StorageConfigError
+
+try:
+    import msgpack
+except ImportError:  # dependência opcional (formato binário)
+    msgpack = None
+
+# libyaml (C) quando disponível; fallback para a implementação pura em Python.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Chave gravada por último nos documentos: o cabeçalho (demais chaves) pode
+# ser lido sem percorrer o histórico.
+BODY_KEY = "history"
+_CHUNK = 4096
+
+
+@dataclass(frozen=True)
+class SessionFormat:
+    """
+    Codec de documentos de sessão: extensão do arquivo + (de)serialização em bytes.
+    `load_header` lê apenas as chaves anteriores a BODY_KEY a partir de um
+    arquivo aberto; retorna None quando o documento não permite leitura parcial.
+    """
+
+    name: str
+    extension: str
+    dump: Callable[[dict[str, Any]], bytes]
+    load: Callable[[bytes], dict[str, Any]]
+    load_header: Callable[[BinaryIO], dict[str, Any] | None]
+
+
+def _yaml_dump(data: dict[str, Any]) -> bytes:
+    # Listas sem coleções aninhadas em estilo flow: um evento do histórico por linha.
+    return yaml.dump(
+        data, Dumper=YamlDumper, sort_keys=False, default_flow_style=None
+    ).encode("utf-8")
+
+
+def _yaml_load(raw: bytes) -> dict[str, Any]:
+    return yaml.load(raw, Loader=YamlLoader)
+
+
+def _yaml_load_header(fp: BinaryIO) -> dict[str, Any] | None:
+    marker = f"{BODY_KEY}:".encode()
+    lines: list[bytes] = []
+    for line in fp:
+        if line.startswith(marker):
+            break
+        lines.append(line)
+    else:
+        return None  # sem histórico: documento inesperado, usa a leitura completa
+    return yaml.load(b"".join(lines), Loader=YamlLoader) or {}
+
+
+def _json_dump(data: dict[str, Any]) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_load(raw: bytes) -> dict[str, Any]:
+    return json.loads(raw)
+
+
+def _json_load_header(fp: BinaryIO) -> dict[str, Any] | None:
+    # Dentro de strings JSON as aspas são escapadas, então `,"history":` só
+    # ocorre como chave de primeiro nível.
+    marker = f',"{BODY_KEY}":'.encode()
+    buffer = b""
+    while True:
+        chunk = fp.read(_CHUNK)
+        if not chunk:
+            return None
+        start = max(0, len(buffer) - len(marker))
+        buffer += chunk
+        pos = buffer.find(marker, start)
+        if pos >= 0:
+            return json.loads(buffer[:pos] + b"}")
+
+
+def _msgpack_dump(data: dict[str, Any]) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_load(raw: bytes) -> dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False)
+
+
+def _msgpack_load_header(fp: BinaryIO) -> dict[str, Any] | None:
+    unpacker = msgpack.Unpacker(fp, raw=False, read_size=_CHUNK)
+    header: dict[str, Any] = {}
+    for _ in range(unpacker.read_map_header()):
+        key = unpacker.unpack()
+        if key == BODY_KEY:
+            break
+        header[key] = unpacker.unpack()
+    return header
+
+
+FORMATS: dict[str, SessionFormat] = {
+    "yaml": SessionFormat("yaml", ".yml", _yaml_dump, _yaml_load, _yaml_load_header),
+    "json": SessionFormat("json", ".json", _json_dump, _json_load, _json_load_header),
+    "msgpack": SessionFormat(
+        "msgpack", ".msgpack", _msgpack_dump, _msgpack_load, _msgpack_load_header
+    ),
+}
+
+
+def get_format(name: str) -> SessionFormat:
+    fmt = FORMATS.get(name)
+    if fmt is None:
+        raise StorageConfigError(f"formato '{name}' não suportado")
+    if name == "msgpack" and msgpack is None:
+        raise StorageConfigError("formato msgpack requer o pacote 'msgpack' instalado")
+    return fmt
+
+
+def available_formats() -> list[SessionFormat]:
+    return [fmt for name, fmt in FORMATS.items() if name != "msgpack" or msgpack is not None]
@@ -1,93 +1,729 @@
-import subprocess
-import uuid
+import errno
+import hashlib
+import os
+import time
+from collections.abc import Collection, Hashable, Iterable
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-import yaml
-
+from symforge.domain.exceptions import (
+    AutoCommitError,
+    SessionConflictError,
+    StorageConfigError,
+)
+from symforge.domain.history import decode_history, encode_history
 from symforge.domain.process_definition import ProcessDefinition
-from symforge.domain.session import Session
+from symforge.domain.session import LazySession, Session, SessionSummary
+from symforge.domain.session_id import new_session_id
 from symforge.domain.states import SessionState
+from symforge.infrastructure.durable_io import (
+    DurableWriter,
+    atomic_write,
+    file_lock,
+    file_stamp,
+)
+from symforge.infrastructure.git_committer import (
+    Committer,
+    GitCommitter,
+    find_git_root,
+    restore_paths,
+)
+from symforge.infrastructure.session_archive import SessionArchive
+from symforge.infrastructure.session_cache import SessionCache
+from symforge.infrastructure.session_catalog import SessionCatalog
+from symforge.infrastructure.session_formats import FORMATS, SessionFormat, get_format
+from symforge.infrastructure.step_commit_log import StepCommitLog
+
+LAYOUTS = ("flat", "sharded")
+# Arquivos locais do diretório de sessões, fora do Git (o .gitignore gerado ignora a si mesmo).
+# O catálogo é reconstruível com `sessions reindex`; o mapa passo → commit é um cache local.
+LOCAL_FILES = (".gitignore", ".locks/", SessionCatalog.FILENAME, f"*{StepCommitLog.SUFFIX}")
+# Chaves que precisam estar no cabeçalho para um load_lazy sem leitura completa.
+HEADER_KEYS = frozenset(
+    {
+        "id",
+        "process_name",
+        "state",
+        "version",
+        "pending_decision",
+        "required_artifacts",
+        "missing_artifacts",
+    }
+)
+_HEX = frozenset("0123456789abcdef")
+
+
+def _is_shard_name(name: str) -> bool:
+    return len(name) == 2 and set(name) <= _HEX
 
 
 class SessionRepository:
     """
-    Repositório simples em YAML para sessões.
-    Usa diretório base (ex.: .symforge/sessions) e cria arquivos por sessão.
-    Suporta auto-commit Git por transição de estado.
+    Repositório simples em arquivos para sessões (YAML por padrão; JSON ou
+    msgpack via `session_format`). Usa diretório base (ex.: .symforge/sessions)
+    e cria um arquivo por sessão; na leitura o formato é detectado pela extensão.
+    Cada save grava em temporário + rename atômico, com fsync conforme
+    `durability` (none | batch | always). Suporta auto-commit Git por transição.
+
+    Com `layout="sharded"` os arquivos ficam em <base>/<ab>/<cd>/, onde abcd é o
+    prefixo do SHA-1 do id; a leitura encontra a sessão em qualquer layout e o
+    próximo save a move para o layout configurado.
+
+    `compact` move sessões COMPLETED para um arquivo compactado (SessionArchive);
+    `load` continua encontrando-as por id quando não há arquivo solto.
+
+    `update` é compare-and-swap: sob um lock por sessão, compara `session.version`
+    com a versão persistida e levanta SessionConflictError se outro processo
+    gravou antes; caso contrário incrementa a versão e grava.
+
+    Com auto-commit imediato, cada item novo do histórico é associado ao commit
+    que o gravou (StepCommitLog); `step_commit` + `restore_files` permitem voltar
+    os arquivos do workspace ao estado daquele passo sem buscar no `git log`.
+
+    Backends alternativos (ex.: SQLite) estendem esta classe sobrescrevendo
+    `_write`/`_read`, mantendo o contrato create/update/load.
     """
 
-    def __init__(self, base_dir: Path, auto_commit: bool = False):
+    def __init__(
+        self,
+        base_dir: Path,
+        auto_commit: bool = False,
+        committer: Committer | None = None,
+        session_format: str = "yaml",
+        durability: str = "batch",
+        layout: str = "flat",
+        cache_size: int = 0,
+    ):
+        if layout not in LAYOUTS:
+            raise StorageConfigError(f"layout '{layout}' não suportado")
+        if cache_size < 0:
+            raise StorageConfigError("cache_size deve ser >= 0")
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._ignore_local_files()
         self.auto_commit = auto_commit
+        self.committer = committer
+        self.format = get_format(session_format)
+        self.files = DurableWriter(durability)
+        self.layout = layout
+        self.catalog = SessionCatalog(self.base_dir)
+        self.archive = SessionArchive(self.base_dir)
+        self.cache = SessionCache(cache_size) if cache_size else None
+        # Sessões lidas em outro formato/layout: os arquivos antigos são removidos no próximo save.
+        self._legacy: dict[str, list[Path]] = {}
+        self._repo_root: Path | None = None
+        # Com uma lista, falhas do auto-commit (a sessão já gravada) são
+        # registradas aqui em vez de levantadas; quem chama as reporta.
+        self.commit_errors: list[AutoCommitError] | None = None
+
+    MAX_ID_ATTEMPTS = 5
 
     def create(self, process: ProcessDefinition, missing: list[str] | None = None) -> Session:
-        session_id = uuid.uuid4().hex[:8]
+        """
+        Cria a sessão com id ordenável por tempo. A gravação é exclusiva: um id
+        já existente nunca é sobrescrito; em colisão, um novo id é gerado.
+        """
+        for attempt in range(self.MAX_ID_ATTEMPTS):
+            session = self._new_session(process, missing)
+            try:
+                self._save(session, exclusive=True)
+            except FileExistsError:
+                if attempt == self.MAX_ID_ATTEMPTS - 1:
+                    raise
+                continue
+            return session
+        raise AssertionError("unreachable")
+
+    def update(self, session: Session) -> None:
+        with self.transaction() as tx:
+            tx.update(session)
+
+    def transaction(self) -> "SessionTransaction":
+        """
+        Unidade de trabalho: `with repo.transaction() as tx:` acumula sessões
+        (tx.create/tx.update) e grava cada uma uma única vez ao sair do bloco,
+        com um único auto-commit. Uma exceção dentro do bloco descarta tudo.
+        """
+        return SessionTransaction(self)
+
+    def load(self, session_id: str) -> Session:
+        if self.cache is None:
+            return self._from_dict(self._read(session_id))
+        # Carimbo lido antes do documento: uma escrita concorrente no meio muda
+        # o carimbo e a próxima consulta relê.
+        stamp = self._stamp(session_id)
+        cached = self.cache.get(session_id, stamp)
+        if cached is not None:
+            return cached
+        session = self._from_dict(self._read(session_id))
+        self.cache.put(session, stamp)
+        return session
+
+    def load_lazy(self, session_id: str) -> Session:
+        """
+        Carrega apenas o cabeçalho da sessão (estado, processo, artefatos, versão);
+        o histórico é lido no primeiro acesso. Documentos sem cabeçalho legível
+        (ex.: gravados antes do histórico ir para o fim) são carregados por inteiro.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(session_id, self._stamp(session_id))
+            if cached is not None:
+                return cached
+        header = self._read_header(session_id)
+        if header is None:
+            return self.load(session_id)
+        return LazySession(
+            lambda: decode_history(self._read(session_id).get("history", [])),
+            id=header["id"],
+            process_name=header["process_name"],
+            state=SessionState(header["state"]),
+            required_artifacts=header["required_artifacts"],
+            missing_artifacts=header["missing_artifacts"],
+            pending_decision=header["pending_decision"],
+            flow_source=header.get("flow_source"),
+            flow_node=header.get("flow_node"),
+            call_stack=header.get("call_stack", []),
+            version=header["version"],
+        )
+
+    def query(
+        self,
+        state: SessionState | None = None,
+        process_name: str | None = None,
+        since: datetime | None = None,
+        created_since: datetime | None = None,
+    ) -> list[SessionSummary]:
+        """
+        Lista resumos de sessões a partir do catálogo, sem abrir os arquivos.
+        `created_since` compara o prefixo temporal do id (ids legados são excluídos).
+        """
+        return self.catalog.query(
+            state=state, process_name=process_name, since=since, created_since=created_since
+        )
+
+    def find(
+        self,
+        state: SessionState | None = None,
+        process_name: str | None = None,
+        since: datetime | None = None,
+        created_since: datetime | None = None,
+        lazy: bool = False,
+    ) -> list[Session]:
+        load = self.load_lazy if lazy else self.load
+        return [load(s.id) for s in self.query(state, process_name, since, created_since)]
+
+    def reindex(self) -> int:
+        """Reconstrói o catálogo a partir dos arquivos de sessão."""
+        entries = []
+        archived = self.archive.entries()
+        for session_id in self._session_ids():
+            session = self.load(session_id)
+            mtimes = [p.stat().st_mtime for p in self._session_paths(session_id)]
+            entries.append((session, max(mtimes) if mtimes else archived[session_id].updated_at))
+        return self.catalog.rebuild(entries)
+
+    def compact(self, before: datetime | None = None) -> int:
+        """
+        Move sessões COMPLETED (atualizadas antes de `before`, se informado) para o
+        arquivo compactado e remove seus arquivos soltos. Usa o catálogo para
+        selecionar as sessões. Retorna quantas foram compactadas.
+        """
+        loose = set(self._file_ids())
+        cutoff = before.timestamp() if before is not None else None
+        documents: list[tuple[str, str, bytes, float]] = []
+        versions: dict[str, int] = {}
+        for summary in self.query(state=SessionState.COMPLETED):
+            if summary.id not in loose or (cutoff is not None and summary.updated_at >= cutoff):
+                continue
+            data = self._read(summary.id)
+            versions[summary.id] = data.get("version", 0)
+            payload = self.format.dump(data)
+            documents.append((summary.id, self.format.name, payload, summary.updated_at))
+        self.archive.append(documents, fsync=self.files.durability != "none")
+
+        removed: list[Path] = []
+        compacted = 0
+        for session_id, version in versions.items():
+            with file_lock(self._lock_path(session_id)):
+                if self._current_version(session_id) != version:
+                    continue  # atualizada durante a compactação: a cópia solta prevalece
+                paths = self._session_paths(session_id)
+                for path in paths:
+                    path.unlink()
+                removed.extend(paths)
+                compacted += 1
+        if self.auto_commit and compacted:
+            self._git_commit(
+                [self.archive.pack_path, self.archive.index_path, *removed],
+                f"[symforge] {compacted} sessões compactadas",
+            )
+        return compacted
+
+    def purge(
+        self,
+        session_ids: Iterable[str],
+        states: Collection[SessionState] | None = None,
+        dry_run: bool = False,
+    ) -> list[str]:
+        """
+        Remove sessões soltas (documento, arquivos auxiliares, lock e entrada do
+        catálogo). Com `states`, o estado é conferido de novo sob o lock da sessão:
+        uma sessão retomada depois de selecionada é mantida. Sessões apenas
+        arquivadas são ignoradas. Retorna os ids removidos (ou que seriam, com `dry_run`).
+        """
+        loose = set(self._file_ids())
+        wanted = {SessionState(s).value for s in states} if states is not None else None
+        purged: list[str] = []
+        removed: list[Path] = []
+        for session_id in dict.fromkeys(session_ids):
+            if session_id not in loose:
+                continue
+            lock = self._lock_path(session_id)
+            with file_lock(lock):
+                if wanted is not None:
+                    header = self._read_header(session_id) or self._read(session_id)
+                    if header["state"] not in wanted:
+                        continue
+                purged.append(session_id)
+                if dry_run:
+                    continue
+                paths = self._session_paths(session_id) + [
+                    sidecar
+                    for directory in self._session_dirs(session_id)
+                    for sidecar in self._sidecar_paths(session_id, directory)
+                ]
+                for path in dict.fromkeys(paths):
+                    path.unlink(missing_ok=True)
+                    removed.append(path)
+                lock.unlink(missing_ok=True)
+            self.catalog.remove(session_id)
+            if self.cache is not None:
+                self.cache.discard(session_id)
+        if self.auto_commit and removed:
+            self._git_commit(removed, f"[symforge] {len(purged)} sessões removidas (gc)")
+        return purged
+
+    def migrate(self, session_format: str | None = None, layout: str | None = None) -> int:
+        """
+        Converte os arquivos de sessão para `session_format` e/ou os move para
+        `layout`; o que não for informado é mantido. Retorna quantas sessões mudaram.
+        """
+        target = get_format(session_format) if session_format else None
+        if layout is not None and layout not in LAYOUTS:
+            raise StorageConfigError(f"layout '{layout}' não suportado")
+        migrated = 0
+        for session_id in self._file_ids():
+            path, fmt = self._locate(session_id)
+            new_fmt = target or fmt
+            new_dir = self._session_dir(session_id, layout) if layout else path.parent
+            new_path = new_dir / f"{session_id}{new_fmt.extension}"
+            if new_path == path:
+                continue
+            new_dir.mkdir(parents=True, exist_ok=True)
+            if new_fmt is fmt:
+                os.replace(path, new_path)
+            else:
+                self.files.write(new_path, new_fmt.dump(fmt.load(path.read_bytes())))
+                path.unlink()
+            for sidecar in self._sidecar_paths(session_id, path.parent):
+                if sidecar.parent != new_dir:
+                    os.replace(sidecar, new_dir / sidecar.name)
+            migrated += 1
+        return migrated
+
+    def step_commit(self, session: Session, position: int) -> str | None:
+        """Commit registrado para o item `position` do histórico, ou None."""
+        event = session.history[position]
+        for directory in reversed(self._session_dirs(session.id)):
+            commit = StepCommitLog.for_session(directory, session.id).lookup(position, event)
+            if commit is not None:
+                return commit
+        return None
+
+    def restore_files(self, commit: str, paths: list[Path]) -> list[Path]:
+        """Restaura `paths` rastreados no Git para o conteúdo de `commit`."""
+        repo_root = self._git_root()
+        if repo_root is None:
+            raise AutoCommitError("workspace fora de um repositório Git")
+        return restore_paths(repo_root, commit, paths)
+
+    def flush(self) -> None:
+        """Aplica o fsync pendente (durability batch) e grava commits pendentes."""
+        self.files.sync()
+        if self.committer is not None:
+            try:
+                self.committer.flush()
+            except AutoCommitError as exc:
+                self._commit_failed(exc)
+
+    def close(self) -> None:
+        self.files.sync()
+        if self.committer is not None:
+            try:
+                self.committer.close()
+            except AutoCommitError as exc:
+                self._commit_failed(exc)
+
+    def _new_session(self, process: ProcessDefinition, missing: list[str] | None) -> Session:
         session = Session(
-            id=session_id,
+            id=new_session_id(),
             process_name=process.name,
             required_artifacts=process.required_artifacts,
+            flow_source=process.flow_source,
         )
         if missing:
             session.mark_awaiting_input(missing)
-        self._save(session)
         return session
 
-    def update(self, session: Session) -> None:
-        self._save(session)
+    def _save(self, session: Session, exclusive: bool = False) -> None:
+        synced = self._synced(session)
+        paths = self._persist(session, exclusive)
+        self._commit_saved([(session, synced)], paths)
+
+    @staticmethod
+    def _synced(session: Session) -> int:
+        """
+        Marca `synced_history` anterior ao save. Uma LazySession só conhece a
+        marca depois de ler o histórico; a leitura acontece aqui, antes da
+        gravação (que leria o histórico de qualquer forma).
+        """
+        len(session.history)
+        return session.synced_history
+
+    def _persist(self, session: Session, exclusive: bool = False) -> list[Path]:
+        """Grava e indexa a sessão, sem auto-commit; retorna os arquivos alterados."""
+        paths = self._write(session, exclusive)
+        session.synced_history = len(session.history)
+        self._index(session)
+        if self.cache is not None:
+            # Write-through: chamado sob o lock da sessão (ou em create exclusivo).
+            self.cache.put(session, self._stamp(session.id))
+        return paths
+
+    def _commit_saved(self, saved: list[tuple[Session, int]], paths: list[Path]) -> None:
+        """
+        Auto-commit de sessões gravadas juntas (cada uma com sua marca
+        `synced_history` anterior ao save) e registro do commit dos passos novos.
+        """
+        if not self.auto_commit or not saved:
+            return
+        lines = [f"session {s.id} -> {s.state.value}" for s, _ in saved]
+        if len(lines) == 1:
+            message = f"[symforge] {lines[0]}"
+        else:
+            body = "\n".join(f"- {line}" for line in lines)
+            message = f"[symforge] {len(lines)} sessões\n\n{body}"
+        commit = self._git_commit(list(dict.fromkeys(paths)), message)
+        if commit is None:
+            return
+        for session, synced in saved:
+            if len(session.history) > synced:
+                self._record_step_commit(session, synced, commit)
+
+    def _record_step_commit(self, session: Session, start: int, commit: str) -> None:
+        log = StepCommitLog.for_session(self._session_dir(session.id), session.id)
+        self.files.append(log.path, StepCommitLog.lines(start, session.history[start:], commit))
+
+    def _write(self, session: Session, exclusive: bool = False) -> list[Path]:
+        """
+        Persiste a sessão e retorna os arquivos alterados (usados no auto-commit).
+        Com `exclusive` (create), levanta FileExistsError se o id já existir.
+        """
+        return self._write_document(session.id, self._to_dict(session), exclusive)
+
+    def _write_document(
+        self, session_id: str, data: dict[str, Any], exclusive: bool = False
+    ) -> list[Path]:
+        path = self._document_path(session_id)
+        if self.layout != "flat":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        if exclusive and self._exists(session_id):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(path))
+        self.files.write(path, self.format.dump(data), exclusive=exclusive)
+        removed = [p for p in self._legacy.pop(session_id, []) if p != path]
+        for legacy in removed:
+            legacy.unlink(missing_ok=True)
+        return [path, *removed]
+
+    def _read(self, session_id: str) -> dict[str, Any]:
+        try:
+            path, fmt = self._locate(session_id)
+        except FileNotFoundError:
+            archived = self.archive.read(session_id)
+            if archived is None:
+                raise
+            fmt_name, payload = archived
+            return get_format(fmt_name).load(payload)
+        if path != self._document_path(session_id):
+            self._legacy[session_id] = [path]
+        return fmt.load(path.read_bytes())
+
+    def _read_header(self, session_id: str) -> dict[str, Any] | None:
+        """Lê só o cabeçalho do documento; None se exigir a leitura completa."""
+        try:
+            path, fmt = self._locate(session_id)
+        except FileNotFoundError:
+            return None  # arquivada ou inexistente: o load completo decide
+        with path.open("rb") as fp:
+            header = fmt.load_header(fp)
+        if header is None or not HEADER_KEYS <= header.keys():
+            return None
+        return header
 
-    def _save(self, session: Session) -> None:
-        path = self.base_dir / f"{session.id}.yml"
-        data = {
+    def _locate(self, session_id: str) -> tuple[Path, SessionFormat]:
+        """Encontra o arquivo da sessão, priorizando o layout e o formato configurados."""
+        for directory in self._session_dirs(session_id):
+            for fmt in (self.format, *FORMATS.values()):
+                path = directory / f"{session_id}{fmt.extension}"
+                if path.exists():
+                    return path, get_format(fmt.name)
+        missing = self._document_path(session_id)
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(missing))
+
+    def _exists(self, session_id: str) -> bool:
+        """Sessão presente em qualquer formato, layout ou no arquivo compactado."""
+        try:
+            self._locate(session_id)
+        except FileNotFoundError:
+            return session_id in self.archive.entries()
+        return True
+
+    def _document_path(self, session_id: str) -> Path:
+        return self._session_dir(session_id) / f"{session_id}{self.format.extension}"
+
+    def _session_dir(self, session_id: str, layout: str | None = None) -> Path:
+        if (layout or self.layout) == "flat":
+            return self.base_dir
+        # Hash em vez do próprio id: ids com prefixo temporal se concentrariam em poucos shards.
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+        return self.base_dir / digest[:2] / digest[2:4]
+
+    def _session_dirs(self, session_id: str) -> list[Path]:
+        """Diretórios candidatos da sessão: layout configurado primeiro."""
+        layouts = [self.layout, *(layout for layout in LAYOUTS if layout != self.layout)]
+        return [self._session_dir(session_id, layout) for layout in layouts]
+
+    def _session_ids(self) -> list[str]:
+        """Ids de sessões soltas e arquivadas."""
+        return sorted({*self._file_ids(), *self.archive.entries()})
+
+    def _file_ids(self) -> list[str]:
+        """Ids com documento solto no diretório (qualquer layout/formato)."""
+        extensions = {fmt.extension for fmt in FORMATS.values()}
+        ids: set[str] = set()
+        pending = [(self.base_dir, 0)]
+        while pending:
+            directory, depth = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if depth < 2 and _is_shard_name(entry.name):
+                            pending.append((Path(entry.path), depth + 1))
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext in extensions:
+                        ids.add(stem)
+        return sorted(ids)
+
+    def _sidecar_paths(self, session_id: str, directory: Path) -> list[Path]:
+        """Arquivos auxiliares da sessão em `directory` que acompanham o documento."""
+        log = StepCommitLog.for_session(directory, session_id)
+        return [log.path] if log.path.exists() else []
+
+    def _current_version(self, session_id: str) -> int:
+        if self.cache is not None:
+            version = self.cache.version(session_id, self._stamp(session_id))
+            if version is not None:
+                return version
+        return self._stored_version(session_id)
+
+    def _stored_version(self, session_id: str) -> int:
+        """Versão armazenada, lida do cabeçalho (sem o histórico) quando possível."""
+        header = self._read_header(session_id)
+        if header is not None:
+            return header["version"]
+        return self._read(session_id).get("version", 0)
+
+    def _stamp(self, session_id: str) -> Hashable | None:
+        """
+        Carimbo barato do estado armazenado da sessão (stat do documento, sem
+        leitura); muda a cada gravação. None se a sessão não existir.
+        """
+        try:
+            path, _ = self._locate(session_id)
+        except FileNotFoundError:
+            entry = self.archive.entries().get(session_id)
+            return None if entry is None else (entry.offset, entry.length)
+        return file_stamp(path)
+
+    def _ignore_local_files(self) -> None:
+        """
+        Gera o `.gitignore` do diretório de sessões com LOCAL_FILES: locks e
+        demais arquivos locais não aparecem como não rastreados no workspace.
+        """
+        path = self.base_dir / ".gitignore"
+        content = "".join(
+            ["# Gerado pelo symforge: arquivos locais das sessões.\n"]
+            + [f"{pattern}\n" for pattern in LOCAL_FILES]
+        ).encode("utf-8")
+        try:
+            if path.read_bytes() == content:
+                return
+        except FileNotFoundError:
+            pass
+        atomic_write(path, content)
+
+    def _lock_path(self, session_id: str) -> Path:
+        shard = self._session_dir(session_id).relative_to(self.base_dir)
+        return self.base_dir / ".locks" / shard / f"{session_id}.lock"
+
+    def _index(self, session: Session) -> None:
+        self.catalog.record(session, time.time())
+
+    def _session_paths(self, session_id: str) -> list[Path]:
+        """Arquivos existentes que compõem a sessão no disco."""
+        candidates = [
+            directory / f"{session_id}{fmt.extension}"
+            for directory in self._session_dirs(session_id)
+            for fmt in FORMATS.values()
+        ]
+        return [p for p in candidates if p.exists()]
+
+    def _to_dict(self, session: Session) -> dict[str, Any]:
+        data: dict[str, Any] = {
             "id": session.id,
             "process_name": session.process_name,
             "state": session.state.value,
+            "version": session.version,
+            "pending_decision": session.pending_decision,
             "required_artifacts": session.required_artifacts,
             "missing_artifacts": session.missing_artifacts,
-            "history": session.history,
-            "pending_decision": session.pending_decision,
         }
-        with path.open("w", encoding="utf-8") as fp:
-            yaml.safe_dump(data, fp)
-        if self.auto_commit:
-            self._git_commit(path, f"[symforge] session {session.id} -> {session.state.value}")
+        if session.flow_source is not None:
+            # Só sessões conduzidas por fluxo gravam a posição.
+            data["flow_source"] = session.flow_source
+            data["flow_node"] = session.flow_node
+            data["call_stack"] = session.call_stack
+        # Histórico por último: permite ler o cabeçalho sem percorrê-lo (load_lazy).
+        data["history"] = encode_history(session.history)
+        return data
 
-    def load(self, session_id: str) -> Session:
-        path = self.base_dir / f"{session_id}.yml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        return Session(
+    def _from_dict(self, data: dict[str, Any]) -> Session:
+        session = Session(
             id=data["id"],
             process_name=data["process_name"],
             state=SessionState(data["state"]),
             required_artifacts=data.get("required_artifacts", []),
             missing_artifacts=data.get("missing_artifacts", []),
-            history=data.get("history", []),
+            history=decode_history(data.get("history", [])),
             pending_decision=data.get("pending_decision", False),
+            flow_source=data.get("flow_source"),
+            flow_node=data.get("flow_node"),
+            call_stack=data.get("call_stack", []),
+            version=data.get("version", 0),
         )
+        session.synced_history = len(session.history)
+        return session
 
     def _git_root(self) -> Path | None:
-        current = self.base_dir.resolve()
-        for candidate in [current, *current.parents]:
-            if (candidate / ".git").exists():
-                return candidate
-        return None
+        """Raiz Git procurada a partir de base_dir (não do shard), memorizada após achada."""
+        if self._repo_root is None:
+            self._repo_root = find_git_root(self.base_dir)
+        return self._repo_root
 
-    def _git_commit(self, file_path: Path, message: str) -> None:
-        """Commit session file to git if in a git repository."""
-        repo_root = self._git_root()
-        if repo_root is None:
-            return
+    def _git_commit(self, file_paths: list[Path], message: str) -> str | None:
+        """Commit session files to git if in a git repository."""
+        if self.committer is None:
+            repo_root = self._git_root()
+            if repo_root is None:
+                return None
+            self.committer = GitCommitter(repo_root)
         try:
-            subprocess.run(
-                ["git", "-C", str(repo_root), "add", str(file_path.resolve())],
-                check=False,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "-C", str(repo_root), "commit", "-m", message],
-                check=False,
-                capture_output=True,
-            )
-        except Exception:
-            # Git indisponível ou sem configuração; não impede o fluxo.
-            pass
+            return self.committer.commit(file_paths, message)
+        except AutoCommitError as exc:
+            self._commit_failed(exc)
+            return None
+
+    def _commit_failed(self, error: AutoCommitError) -> None:
+        """Levanta `error`, ou o registra em `commit_errors` quando a lista existe."""
+        if self.commit_errors is None:
+            raise error
+        self.commit_errors.append(error)
+
+
+class SessionTransaction:
+    """
+    Unidade de trabalho sobre um SessionRepository. Sessões registradas com
+    `create`/`update` só são gravadas em `commit()`, uma vez cada, mesmo que
+    registradas várias vezes. No commit, os locks das sessões atualizadas são
+    tomados em ordem de id e todas as versões são conferidas antes da primeira
+    gravação: um conflito (SessionConflictError) não grava nenhuma sessão.
+    Com auto-commit, o lote inteiro vira um único commit Git.
+    """
+
+    def __init__(self, repo: SessionRepository):
+        self.repo = repo
+        self._sessions: dict[str, Session] = {}
+        self._new: set[str] = set()
+        self._done = False
+
+    def __enter__(self) -> "SessionTransaction":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def create(self, process: ProcessDefinition, missing: list[str] | None = None) -> Session:
+        """Nova sessão (id gerado agora), gravada de forma exclusiva no commit."""
+        session = self.repo._new_session(process, missing)
+        self._sessions[session.id] = session
+        self._new.add(session.id)
+        return session
+
+    def update(self, session: Session) -> None:
+        self._sessions[session.id] = session
+
+    def rollback(self) -> None:
+        """Descarta as sessões pendentes; nada foi gravado."""
+        self._sessions.clear()
+        self._new.clear()
+        self._done = True
+
+    def commit(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        repo = self.repo
+        sessions = list(self._sessions.values())
+        updated = sorted(s.id for s in sessions if s.id not in self._new)
+        with ExitStack() as locks:
+            for session_id in updated:
+                locks.enter_context(file_lock(repo._lock_path(session_id)))
+            for session_id in updated:
+                session = self._sessions[session_id]
+                current = repo._current_version(session_id)
+                if current != session.version:
+                    raise SessionConflictError(session_id, session.version, current)
+            saved: list[tuple[Session, int]] = []
+            paths: list[Path] = []
+            try:
+                for session in sessions:
+                    new = session.id in self._new
+                    synced = repo._synced(session)
+                    if not new:
+                        session.version += 1
+                    try:
+                        paths.extend(repo._persist(session, exclusive=new))
+                    except BaseException:
+                        if not new:
+                            session.version -= 1
+                        raise
+                    saved.append((session, synced))
+            finally:
+                # Mesmo após uma falha parcial, o que já foi gravado é commitado.
+                repo._commit_saved(saved, paths)
@@ -0,0 +1,231 @@
+import errno
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Hashable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from symforge.domain.exceptions import SessionNotFoundError, StorageConfigError
+from symforge.domain.session import Session, SessionSummary
+from symforge.domain.session_id import ID_LENGTH, lower_bound
+from symforge.domain.states import SessionState
+from symforge.infrastructure.git_committer import Committer
+from symforge.infrastructure.session_formats import BODY_KEY
+from symforge.infrastructure.session_repository import HEADER_KEYS, SessionRepository
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    process_name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_state ON sessions (state);
+CREATE INDEX IF NOT EXISTS idx_sessions_process_name ON sessions (process_name);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+"""
+
+_UPSERT = (
+    " ON CONFLICT(id) DO UPDATE SET process_name = excluded.process_name, "
+    "state = excluded.state, updated_at = excluded.updated_at, data = excluded.data"
+)
+
+
+class SqliteSessionRepository(SessionRepository):
+    """
+    Repositório de sessões em um único arquivo SQLite (ex.: .symforge/sessions/sessions.db).
+    Cada save é um upsert de uma linha; consultas por estado, processo e data de
+    atualização usam índices em vez de abrir um arquivo por sessão.
+    A atomicidade vem das transações do SQLite; `durability` vira PRAGMA synchronous.
+    A conexão é compartilhada entre threads (ex.: `status --all`) sob um lock.
+    """
+
+    DB_FILENAME = "sessions.db"
+    SYNCHRONOUS = {"none": "OFF", "batch": "NORMAL", "always": "FULL"}
+
+    def __init__(
+        self,
+        base_dir: Path,
+        auto_commit: bool = False,
+        committer: Committer | None = None,
+        durability: str = "batch",
+        cache_size: int = 0,
+    ):
+        super().__init__(
+            base_dir,
+            auto_commit=auto_commit,
+            committer=committer,
+            durability=durability,
+            cache_size=cache_size,
+        )
+        self.db_path = self.base_dir / self.DB_FILENAME
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._conn.execute(f"PRAGMA synchronous = {self.SYNCHRONOUS[durability]}")
+        self._conn.executescript(_SCHEMA)
+
+    def query(
+        self,
+        state: SessionState | None = None,
+        process_name: str | None = None,
+        since: datetime | None = None,
+        created_since: datetime | None = None,
+    ) -> list[SessionSummary]:
+        rows = self._select(
+            "id, process_name, state, updated_at", state, process_name, since, created_since
+        )
+        return [
+            SessionSummary(
+                id=row[0], process_name=row[1], state=SessionState(row[2]), updated_at=row[3]
+            )
+            for row in rows
+        ]
+
+    def find(
+        self,
+        state: SessionState | None = None,
+        process_name: str | None = None,
+        since: datetime | None = None,
+        created_since: datetime | None = None,
+        lazy: bool = False,
+    ) -> list[Session]:
+        """Lista sessões filtrando por estado, processo e/ou atualização desde `since`."""
+        if lazy:
+            rows = self._select("id", state, process_name, since, created_since)
+            return [self.load_lazy(row[0]) for row in rows]
+        rows = self._select("data", state, process_name, since, created_since)
+        return [self._from_dict(json.loads(row[0])) for row in rows]
+
+    def reindex(self) -> int:
+        """Os índices SQLite são mantidos a cada save; apenas conta as sessões."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def migrate(self, session_format: str | None = None, layout: str | None = None) -> int:
+        raise StorageConfigError("migração de formato/layout não se aplica ao backend sqlite")
+
+    def compact(self, before: datetime | None = None) -> int:
+        raise StorageConfigError("compactação não se aplica ao backend sqlite")
+
+    def purge(
+        self,
+        session_ids: Iterable[str],
+        states: Collection[SessionState] | None = None,
+        dry_run: bool = False,
+    ) -> list[str]:
+        """Remove as linhas em uma transação; o filtro de estado vai no próprio DELETE."""
+        condition = "id = ?"
+        params: list[Any] = []
+        if states is not None:
+            wanted = [SessionState(s).value for s in states]
+            condition += f" AND state IN ({', '.join('?' * len(wanted))})"
+            params = wanted
+        statement = "SELECT id" if dry_run else "DELETE"
+        purged: list[str] = []
+        with self._lock, self._conn:
+            for session_id in dict.fromkeys(session_ids):
+                cursor = self._conn.execute(
+                    f"{statement} FROM sessions WHERE {condition}", [session_id, *params]
+                )
+                matched = cursor.fetchone() is not None if dry_run else cursor.rowcount > 0
+                if matched:
+                    purged.append(session_id)
+        if not dry_run:
+            for session_id in purged:
+                for sidecar in self._sidecar_paths(session_id, self.base_dir):
+                    sidecar.unlink()
+            if self.auto_commit and purged:
+                self._git_commit([self.db_path], f"[symforge] {len(purged)} sessões removidas (gc)")
+        return purged
+
+    def close(self) -> None:
+        super().close()
+        self._conn.close()
+
+    def _select(
+        self,
+        columns: str,
+        state: SessionState | None,
+        process_name: str | None,
+        since: datetime | None,
+        created_since: datetime | None = None,
+    ) -> list[tuple]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if state is not None:
+            clauses.append("state = ?")
+            params.append(SessionState(state).value)
+        if process_name is not None:
+            clauses.append("process_name = ?")
+            params.append(process_name)
+        if since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(since.timestamp())
+        if created_since is not None:
+            # Faixa sobre a PRIMARY KEY: ids ordenáveis por tempo dispensam parse do documento.
+            clauses.append("id >= ? AND length(id) = ?")
+            params.extend([lower_bound(created_since), ID_LENGTH])
+        query = f"SELECT {columns} FROM sessions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY updated_at"
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def _index(self, session: Session) -> None:
+        """A própria tabela é o índice; não usa o catálogo."""
+
+    def _write(self, session: Session, exclusive: bool = False) -> list[Path]:
+        data = self._to_dict(session)
+        # Em create (exclusive) um id repetido viola a PRIMARY KEY em vez de sobrescrever.
+        upsert = "" if exclusive else _UPSERT
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO sessions (id, process_name, state, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?)" + upsert,
+                    (
+                        session.id,
+                        session.process_name,
+                        session.state.value,
+                        time.time(),
+                        json.dumps(data, ensure_ascii=False),
+                    ),
+                )
+        except sqlite3.IntegrityError as exc:
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), session.id) from exc
+        return [self.db_path]
+
+    def _read_header(self, session_id: str) -> dict[str, Any] | None:
+        # Recorta o JSON (separadores padrão do json.dumps) antes de `history`,
+        # a última chave, no próprio SQLite.
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT substr(data, 1, instr(data, ?) - 1) FROM sessions WHERE id = ?",
+                (f', "{BODY_KEY}": ', session_id),
+            ).fetchone()
+        if row is None or not row[0]:
+            return None
+        header = json.loads(row[0] + "}")
+        return header if HEADER_KEYS <= header.keys() else None
+
+    def _stamp(self, session_id: str) -> Hashable | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at, length(data) FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        return tuple(row) if row is not None else None
+
+    def _read(self, session_id: str) -> dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            raise SessionNotFoundError(session_id)
+        return json.loads(row[0])
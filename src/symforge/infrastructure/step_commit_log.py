@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+from symforge.domain.history import HistoryEvent
+
+
+class StepCommitLog:
+    """
+    Mapa passo → commit de uma sessão (<id>.commits, ao lado do documento):
+    uma linha `posição<TAB>commit<TAB>evento` por item do histórico gravado
+    com auto-commit, onde `evento` é o registro compacto em JSON. A última
+    linha de uma posição prevalece (após um reset as posições são reutilizadas);
+    o evento gravado é conferido na consulta, então linhas obsoletas nunca
+    apontam para o passo errado.
+    """
+
+    SUFFIX = ".commits"
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @classmethod
+    def for_session(cls, directory: Path, session_id: str) -> "StepCommitLog":
+        return cls(directory / f"{session_id}{cls.SUFFIX}")
+
+    @staticmethod
+    def lines(start: int, events: list[HistoryEvent | str], commit: str) -> str:
+        """Linhas que associam `events` (a partir da posição `start`) a `commit`."""
+        return "".join(
+            f"{start + offset}\t{commit}\t"
+            f"{json.dumps(HistoryEvent.coerce(event).to_record(), ensure_ascii=False)}\n"
+            for offset, event in enumerate(events)
+        )
+
+    def lookup(self, position: int, event: HistoryEvent | str) -> str | None:
+        """Commit registrado para `event` na `position`, ou None."""
+        try:
+            fp = self.path.open(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        wanted = str(position)
+        found: tuple[str, str] | None = None
+        with fp:
+            for line in fp:
+                fields = line[:-1].split("\t")
+                if len(fields) != 3 or not line.endswith("\n"):
+                    continue  # linha truncada por escrita interrompida
+                if fields[0] == wanted:
+                    found = (fields[1], fields[2])
+        if found is None:
+            return None
+        commit, record = found
+        if HistoryEvent.from_record(json.loads(record)) != HistoryEvent.coerce(event):
+            return None  # posição reutilizada sem auto-commit: registro obsoleto
+        return commit
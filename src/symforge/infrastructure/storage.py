@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.retention import RetentionPolicy
+from symforge.infrastructure.durable_io import DURABILITY_MODES
+from symforge.infrastructure.git_committer import (
+    CoalescingCommitter,
+    Committer,
+    FastImportCommitter,
+    GitCommitter,
+    find_git_root,
+)
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_repository import LAYOUTS, SessionRepository
+from symforge.infrastructure.sqlite_session_repository import SqliteSessionRepository
+
+BACKENDS = ("yaml", "sqlite", "journal")
+COMMIT_BACKENDS = ("git", "fast-import")
+
+
+@dataclass
+class StorageConfig:
+    """
+    Configuração do armazenamento de sessões.
+    Lida da seção `sessions` de .symforge/config.yml; ausente => defaults.
+    """
+
+    backend: str = "yaml"
+    format: str = "yaml"
+    durability: str = "batch"
+    layout: str = "flat"
+    snapshot_every: int = 100
+    commit_batch_size: int = 1
+    commit_window_ms: int = 0
+    commit_backend: str = "git"
+    commit_ref: str = FastImportCommitter.DEFAULT_REF
+    retention: RetentionPolicy = field(default_factory=RetentionPolicy)
+    cache_size: int = 0
+
+
+def load_storage_config(workspace: Path) -> StorageConfig:
+    config_path = workspace / ".symforge" / "config.yml"
+    if not config_path.exists():
+        return StorageConfig()
+    data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    sessions = data.get("sessions") or {}
+    if not isinstance(sessions, dict):
+        raise StorageConfigError("seção sessions deve ser um mapa")
+    defaults = StorageConfig()
+    return StorageConfig(
+        backend=sessions.get("backend", defaults.backend),
+        format=sessions.get("format", defaults.format),
+        durability=sessions.get("durability", defaults.durability),
+        layout=sessions.get("layout", defaults.layout),
+        snapshot_every=int(sessions.get("snapshot_every", defaults.snapshot_every)),
+        commit_batch_size=int(sessions.get("commit_batch_size", defaults.commit_batch_size)),
+        commit_window_ms=int(sessions.get("commit_window_ms", defaults.commit_window_ms)),
+        commit_backend=sessions.get("commit_backend", defaults.commit_backend),
+        commit_ref=sessions.get("commit_ref", defaults.commit_ref),
+        retention=_retention(sessions.get("retention")),
+        cache_size=int(sessions.get("cache_size", defaults.cache_size)),
+    )
+
+
+def _retention(value: object) -> RetentionPolicy:
+    if value is None:
+        return RetentionPolicy()
+    if not isinstance(value, dict):
+        raise StorageConfigError("sessions.retention deve ser um mapa ESTADO: dias")
+    return RetentionPolicy.parse(value)
+
+
+def create_session_repository(
+    base_dir: Path, config: StorageConfig | None = None, auto_commit: bool = False
+) -> SessionRepository:
+    config = config or StorageConfig()
+    if config.backend not in BACKENDS:
+        raise StorageConfigError(f"backend '{config.backend}' não suportado")
+    if config.durability not in DURABILITY_MODES:
+        raise StorageConfigError(f"durability '{config.durability}' não suportada")
+    if config.layout not in LAYOUTS:
+        raise StorageConfigError(f"layout '{config.layout}' não suportado")
+    if config.snapshot_every < 1:
+        raise StorageConfigError("snapshot_every deve ser >= 1")
+    if config.commit_batch_size < 1 or config.commit_window_ms < 0:
+        raise StorageConfigError("commit_batch_size deve ser >= 1 e commit_window_ms >= 0")
+    if config.cache_size < 0:
+        raise StorageConfigError("cache_size deve ser >= 0")
+    if config.commit_backend not in COMMIT_BACKENDS:
+        raise StorageConfigError(f"commit_backend '{config.commit_backend}' não suportado")
+    committer = _create_committer(base_dir, config) if auto_commit else None
+    if config.backend == "sqlite":
+        return SqliteSessionRepository(
+            base_dir,
+            auto_commit=auto_commit,
+            committer=committer,
+            durability=config.durability,
+            cache_size=config.cache_size,
+        )
+    if config.backend == "journal":
+        return JournalSessionRepository(
+            base_dir,
+            auto_commit=auto_commit,
+            committer=committer,
+            session_format=config.format,
+            durability=config.durability,
+            layout=config.layout,
+            snapshot_every=config.snapshot_every,
+            cache_size=config.cache_size,
+        )
+    return SessionRepository(
+        base_dir,
+        auto_commit=auto_commit,
+        committer=committer,
+        session_format=config.format,
+        durability=config.durability,
+        layout=config.layout,
+        cache_size=config.cache_size,
+    )
+
+
+def _create_committer(base_dir: Path, config: StorageConfig) -> Committer | None:
+    repo_root = find_git_root(base_dir)
+    if repo_root is None:
+        return None
+    committer: Committer
+    if config.commit_backend == "fast-import":
+        committer = FastImportCommitter(repo_root, ref=config.commit_ref)
+    else:
+        committer = GitCommitter(repo_root)
+    if config.commit_batch_size > 1:
+        committer = CoalescingCommitter(
+            committer, max_batch=config.commit_batch_size, window_ms=config.commit_window_ms
+        )
+    return committer
@@ -62,7 +62,9 @@ def fluxo_prossegue(ctx: dict):
 @then("a decisão fica registrada com ator e timestamp")
 def decisao_registrada(ctx: dict):
     session = ctx["session"]
-    assert any("decision:" in item for item in session.history)
+    decisions = session.decisions()
+    assert decisions
+    assert all(d.timestamp is not None for d in decisions)
 
 
 @given("que o symbiota não consegue processar o prompt ou provider falha")
@@ -138,7 +138,7 @@ class TestE2ESessionWorkflow:
 
         assert result.exit_code == 0
         session_id = result.output.strip()
-        assert len(session_id) == 8
+        assert len(session_id) == 26
 
         # Step 2: Check status
         result = runner.invoke([
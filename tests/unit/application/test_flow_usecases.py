@@ -0,0 +1,208 @@
+"""
+TDD Unit Tests for flow-driven sessions in RuntimeUseCases.
+
+Tests cover:
+- start() with a flow positions the session at the first node in a single write
+- advance() walks steps and decision branches
+- mark_decision() follows the flow branch when given the workspace
+- Flow position survives reload on every storage backend
+- Each PROCESS.yml is compiled once per runtime
+- Invalid flows fail before a session is created
+- Starting the shipped ForgeProcess only compiles the files it enters
+- The call stack survives reload on every storage backend
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import FlowTransitionError, InvalidFlowError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.states import SessionState
+from symforge.infrastructure.storage import StorageConfig
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+FLOW = {
+    "id": "demo",
+    "phases": [{"id": "main", "steps": [{"id": "draft"}, {"id": "publish"}]}],
+    "flow": [
+        {"id": "start", "type": "start", "next": "write"},
+        {"id": "write", "type": "step", "step_ref": "main.draft", "next": "review"},
+        {
+            "id": "review",
+            "type": "decision",
+            "decision": {
+                "branches": [
+                    {"when": "approved", "goto": "publish"},
+                    {"when": "needs_revision", "goto": "write"},
+                ]
+            },
+        },
+        {"id": "publish", "type": "step", "step_ref": "main.publish", "next": "end"},
+        {"id": "end", "type": "end"},
+    ],
+}
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    ws = tmp_path / "workspace"
+    (ws / "process").mkdir(parents=True)
+    (ws / "process" / "PROCESS.yml").write_text(yaml.safe_dump(FLOW), encoding="utf-8")
+    return ws
+
+
+def flow_process() -> ProcessDefinition:
+    return ProcessDefinition(name="demo", flow_source="process/PROCESS.yml")
+
+
+class TestFlowStart:
+    """Tests for starting flow-driven sessions."""
+
+    def test_start_positions_session_at_first_node(self, workspace: Path, monkeypatch):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+        writes: list[str] = []
+        original = runtime.repo._write
+
+        def tracking(session, exclusive=False):
+            writes.append(session.id)
+            return original(session, exclusive)
+
+        monkeypatch.setattr(runtime.repo, "_write", tracking)
+
+        session = runtime.start(flow_process(), workspace)
+
+        assert session.flow_node == "write"
+        assert writes == [session.id]
+        assert runtime.repo.load(session.id).flow_node == "write"
+
+    def test_invalid_flow_creates_no_session(self, workspace: Path):
+        (workspace / "process" / "PROCESS.yml").write_text("id: demo\nflow: []\n", encoding="utf-8")
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+
+        with pytest.raises(InvalidFlowError):
+            runtime.start(flow_process(), workspace)
+        assert runtime.repo.query() == []
+
+    def test_session_without_flow_has_no_position(self, workspace: Path):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+
+        session = runtime.start(ProcessDefinition(name="demo"), workspace)
+
+        assert session.flow_node is None
+        with pytest.raises(FlowTransitionError):
+            runtime.advance(session, workspace)
+
+
+class TestFlowAdvance:
+    """Tests for advancing sessions through the flow."""
+
+    @pytest.mark.parametrize("backend", ["yaml", "journal", "sqlite"])
+    def test_walk_to_end(self, workspace: Path, backend: str):
+        runtime = RuntimeUseCases(
+            workspace / ".symforge" / "sessions", storage=StorageConfig(backend=backend)
+        )
+        session_id = runtime.start(flow_process(), workspace).id
+
+        for value in (None, "needs_revision", None, "approved", None):
+            runtime.advance(runtime.repo.load(session_id), workspace, value)
+
+        session = runtime.repo.load(session_id)
+        assert session.flow_node == "end"
+        assert session.state == SessionState.COMPLETED
+        assert [str(e) for e in session.history] == [
+            "draft",
+            "decision:needs_revision",
+            "draft",
+            "decision:approved",
+            "publish",
+        ]
+
+    def test_mark_decision_follows_branch(self, workspace: Path):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+        session = runtime.start(flow_process(), workspace)
+        runtime.advance(session, workspace)
+
+        runtime.mark_decision(session, "approved", "alice", workspace)
+
+        loaded = runtime.repo.load(session.id)
+        assert loaded.flow_node == "publish"
+        assert loaded.decisions()[0].actor == "alice"
+
+    def test_flow_compiled_once(self, workspace: Path, monkeypatch):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+        parses: list[Path] = []
+        original = runtime.processes._parse
+
+        def tracking(path: Path, raw: bytes):
+            parses.append(path)
+            return original(path, raw)
+
+        monkeypatch.setattr(runtime.processes, "_parse", tracking)
+
+        first = runtime.start(flow_process(), workspace)
+        second = runtime.start(flow_process(), workspace)
+        runtime.advance(first, workspace)
+        runtime.advance(second, workspace)
+
+        assert len(parses) == 1
+        assert runtime.flow_options(first, workspace) == ["approved", "needs_revision"]
+
+
+class TestFlowCallStack:
+    """Tests for sub-process calls on the shipped ForgeProcess tree."""
+
+    @pytest.fixture
+    def forge_workspace(self, tmp_path: Path) -> Path:
+        ws = tmp_path / "forge"
+        shutil.copytree(REPO_ROOT / "process", ws / "process")
+        return ws
+
+    def track_parses(self, runtime: RuntimeUseCases, monkeypatch) -> list[str]:
+        parses: list[str] = []
+        original = runtime.processes._parse
+
+        def tracking(path: Path, raw: bytes):
+            parses.append(path.parent.name)
+            return original(path, raw)
+
+        monkeypatch.setattr(runtime.processes, "_parse", tracking)
+        return parses
+
+    def test_start_compiles_only_entered_processes(self, forge_workspace: Path, monkeypatch):
+        runtime = RuntimeUseCases(forge_workspace / ".symforge" / "sessions")
+        parses = self.track_parses(runtime, monkeypatch)
+
+        session = runtime.start(
+            ProcessDefinition(name="forgeprocess", flow_source="process/PROCESS.yml"),
+            forge_workspace,
+        )
+
+        assert parses == ["process", "mdd"]
+        assert session.call_stack == ["call_mdd"]
+        assert session.flow_node == "etapa_01"
+
+    @pytest.mark.parametrize("backend", ["yaml", "journal", "sqlite"])
+    def test_call_stack_survives_reload(self, forge_workspace: Path, backend: str):
+        runtime = RuntimeUseCases(
+            forge_workspace / ".symforge" / "sessions", storage=StorageConfig(backend=backend)
+        )
+        session_id = runtime.start(
+            ProcessDefinition(name="forgeprocess", flow_source="process/PROCESS.yml"),
+            forge_workspace,
+        ).id
+        # MDD: seis etapas, cada uma seguida de aprovação (a 5ª é a decisão do MVP).
+        for _ in range(5):
+            runtime.advance(runtime.repo.load(session_id), forge_workspace)
+            runtime.advance(runtime.repo.load(session_id), forge_workspace, "approved")
+        runtime.advance(runtime.repo.load(session_id), forge_workspace)
+
+        # return_approved → call_bdd: a pilha troca mdd por bdd.
+        session = runtime.repo.load(session_id)
+        assert session.call_stack == ["call_bdd"]
+        assert runtime.flow_options(session, forge_workspace) == []
+        assert [e.value for e in session.steps()][-1] == "etapa_06_handoff"
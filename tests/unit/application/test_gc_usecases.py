@@ -0,0 +1,136 @@
+"""
+TDD Unit Tests for session garbage collection.
+
+Tests cover:
+- gc removes expired sessions by state and age (catalog-driven)
+- Handoffs of collected sessions are removed from .symforge/handoffs
+- dry-run reports without deleting
+- Sessions resumed after selection are kept
+- Journal and SQLite backends
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import SessionNotFoundError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.retention import RetentionPolicy
+from symforge.domain.states import SessionState
+from symforge.infrastructure.storage import StorageConfig
+
+LATER = time.time() + 31 * 86400
+POLICY = RetentionPolicy.parse({"PAUSED": 30, "AWAITING_INPUT": 30})
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    return tmp_path
+
+
+def make_runtime(workspace: Path, backend: str = "yaml") -> RuntimeUseCases:
+    return RuntimeUseCases(
+        workspace / ".symforge" / "sessions", storage=StorageConfig(backend=backend)
+    )
+
+
+def paused_session(runtime: RuntimeUseCases, workspace: Path) -> str:
+    session = runtime.start(ProcessDefinition(name="demo"), workspace)
+    runtime.pause(session, workspace)
+    return session.id
+
+
+class TestGcSelection:
+    """Tests for which sessions are collected."""
+
+    def test_removes_expired_paused_and_awaiting_input(self, workspace: Path):
+        runtime = make_runtime(workspace)
+        paused = paused_session(runtime, workspace)
+        waiting = runtime.start(ProcessDefinition(name="demo", required_artifacts=["x.md"]), workspace)
+        running = runtime.start(ProcessDefinition(name="demo"), workspace)
+
+        report = runtime.gc(workspace, POLICY, now=LATER)
+
+        assert sorted(report.sessions) == sorted([paused, waiting.id])
+        assert [s.id for s in runtime.repo.query()] == [running.id]
+        with pytest.raises((FileNotFoundError, SessionNotFoundError)):
+            runtime.repo.load(paused)
+
+    def test_recent_sessions_are_kept(self, workspace: Path):
+        runtime = make_runtime(workspace)
+        paused_session(runtime, workspace)
+
+        report = runtime.gc(workspace, POLICY)
+
+        assert report.sessions == []
+        assert len(runtime.repo.query()) == 1
+
+    def test_resumed_session_is_not_purged(self, workspace: Path):
+        runtime = make_runtime(workspace)
+        session_id = paused_session(runtime, workspace)
+        session = runtime.repo.load(session_id)
+        session.mark_running()
+        runtime.repo.update(session)
+
+        purged = runtime.repo.purge([session_id], POLICY.states)
+
+        assert purged == []
+        assert runtime.repo.load(session_id).state == SessionState.RUNNING
+
+
+class TestGcHandoffs:
+    """Tests for handoff cleanup."""
+
+    def test_removes_handoffs_of_collected_sessions(self, workspace: Path):
+        runtime = make_runtime(workspace)
+        paused = paused_session(runtime, workspace)
+        other = runtime.start(ProcessDefinition(name="demo"), workspace)
+        kept = runtime.complete(other, workspace)
+
+        report = runtime.gc(workspace, POLICY, now=LATER)
+
+        assert len(report.handoffs) == 1
+        assert report.handoffs[0].name.startswith(paused)
+        assert not report.handoffs[0].exists()
+        assert kept.exists()
+
+
+class TestGcDryRun:
+    """Tests for dry-run mode."""
+
+    def test_dry_run_reports_without_deleting(self, workspace: Path):
+        runtime = make_runtime(workspace)
+        paused = paused_session(runtime, workspace)
+
+        report = runtime.gc(workspace, POLICY, dry_run=True, now=LATER)
+
+        assert report.sessions == [paused]
+        assert report.handoffs and all(p.exists() for p in report.handoffs)
+        assert runtime.repo.load(paused).state == SessionState.PAUSED
+
+
+class TestGcBackends:
+    """Tests for alternative storage backends."""
+
+    @pytest.mark.parametrize("backend", ["journal", "sqlite"])
+    def test_gc_removes_sessions(self, workspace: Path, backend: str):
+        runtime = make_runtime(workspace, backend)
+        paused = paused_session(runtime, workspace)
+        running = runtime.start(ProcessDefinition(name="demo"), workspace)
+
+        report = runtime.gc(workspace, POLICY, now=LATER)
+
+        assert report.sessions == [paused]
+        assert [s.id for s in runtime.repo.query()] == [running.id]
+        runtime.close()
+
+    def test_journal_files_are_removed(self, workspace: Path):
+        runtime = make_runtime(workspace, "journal")
+        paused = paused_session(runtime, workspace)
+
+        runtime.gc(workspace, POLICY, now=LATER)
+
+        sessions_dir = workspace / ".symforge" / "sessions"
+        assert not list(sessions_dir.glob(f"{paused}*"))
@@ -165,6 +165,19 @@ class TestHandoffWithHistory:
         assert "approved" in content
         assert "Decisões Registradas" in content
 
+    def test_handoff_lists_decision_actor(self, runtime: RuntimeUseCases, workspace: Path):
+        process = ProcessDefinition(name="test_process")
+        session = runtime.start(process, workspace)
+        session.mark_awaiting_decision()
+        runtime.repo.update(session)
+        runtime.mark_decision(session, "approved", actor="alice")
+
+        handoff_path = runtime.pause(session, workspace)
+        content = handoff_path.read_text(encoding="utf-8")
+
+        assert "- approved (alice)" in content
+        assert "decision:" not in content
+
     def test_handoff_contains_required_artifacts(self, runtime: RuntimeUseCases, workspace: Path):
         process = ProcessDefinition(name="test_process", required_artifacts=["doc.md", "spec.yml"])
         session = runtime.start(process, workspace)
@@ -6,14 +6,21 @@ Tests cover:
 - resume_after_input() - resume after missing artifacts provided
 - reset_step() - rollback to previous step
 - mark_decision() - HIL decision registration
+- with_retry() - reload and reapply on version conflicts
 - Error handling and edge cases
 """
 
+import threading
+
 import pytest
 from pathlib import Path
 
 from symforge.application.usecases.runtime import RuntimeUseCases
-from symforge.domain.exceptions import NoPendingDecisionError, StepNotFoundError
+from symforge.domain.exceptions import (
+    NoPendingDecisionError,
+    SessionConflictError,
+    StepNotFoundError,
+)
 from symforge.domain.process_definition import ProcessDefinition
 from symforge.domain.states import SessionState
 
@@ -361,3 +368,71 @@ class TestRuntimeEdgeCases:
 
         assert session.state == SessionState.AWAITING_INPUT
         assert sorted(session.missing_artifacts) == ["b.md", "d.md"]
+
+
+class TestRuntimeRetry:
+    """Tests for with_retry() optimistic concurrency helper."""
+
+    def test_retry_reapplies_operation_after_conflict(
+        self, runtime: RuntimeUseCases, workspace: Path
+    ):
+        session = runtime.start(ProcessDefinition(name="test"), workspace)
+        calls = []
+
+        def operation(s):
+            calls.append(s.version)
+            if len(calls) == 1:
+                concurrent = runtime.repo.load(session.id)
+                concurrent.add_step("concurrent")
+                runtime.repo.update(concurrent)
+            s.add_step("mine")
+            runtime.repo.update(s)
+            return s
+
+        result = runtime.with_retry(session.id, operation)
+
+        assert calls == [0, 1]
+        assert result.history == ["concurrent", "mine"]
+        assert runtime.repo.load(session.id).version == 2
+
+    def test_retry_gives_up_after_max_attempts(
+        self, runtime: RuntimeUseCases, workspace: Path, monkeypatch
+    ):
+        session = runtime.start(ProcessDefinition(name="test"), workspace)
+        monkeypatch.setattr(RuntimeUseCases, "MAX_ATTEMPTS", 3)
+
+        def always_stale(s):
+            runtime.repo.update(runtime.repo.load(session.id))
+            runtime.repo.update(s)
+
+        with pytest.raises(SessionConflictError):
+            runtime.with_retry(session.id, always_stale)
+
+    def test_parallel_workers_do_not_lose_updates(self, workspace: Path):
+        sessions_dir = workspace / ".symforge" / "sessions"
+        session = RuntimeUseCases(sessions_dir).start(ProcessDefinition(name="test"), workspace)
+
+        def worker(n: int) -> None:
+            runtime = RuntimeUseCases(sessions_dir)
+
+            def add_step(s):
+                s.add_step(f"step{n}")
+                runtime.repo.update(s)
+
+            runtime.with_retry(session.id, add_step)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        loaded = RuntimeUseCases(sessions_dir).repo.load(session.id)
+        assert sorted(map(str, loaded.history)) == [f"step{n}" for n in range(8)]
+        assert loaded.version == 8
+
+    def test_domain_errors_are_not_retried(self, runtime: RuntimeUseCases, workspace: Path):
+        session = runtime.start(ProcessDefinition(name="test"), workspace)
+
+        with pytest.raises(NoPendingDecisionError):
+            runtime.with_retry(session.id, lambda s: runtime.mark_decision(s, "ok"))
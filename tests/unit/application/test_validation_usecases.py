@@ -8,6 +8,9 @@ Tests cover:
 - validate_process with invalid YAML
 - validate_process with missing phases
 - validate_process with recursive artifact validation
+- validate_process with flow analysis across sub-processes
+- recursive validation following sub_phase, spec_file, templates and prompt_file
+  (shared references validated once, errors combined, nested PROCESS.yml checked)
 """
 
 import sys
@@ -234,6 +237,191 @@ class TestValidateProcessRecursive:
         assert result.is_valid
 
 
+class TestValidateProcessReferences:
+    """Tests for the recursive walk over referenced files."""
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        root = tmp_path / "process"
+        (root / "sub").mkdir(parents=True)
+        (root / "symbiotes").mkdir()
+        (root / "PROCESS.yml").write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: main\n"
+            "    spec_file: MAIN.md\n"
+            "    steps:\n"
+            "      - id: draft\n"
+            "        spec_file: draft.md\n"
+            "        outputs:\n"
+            "          - path: docs/out.md\n"
+            "            template: templates/out.md\n"
+            "  - id: sub\n"
+            "    sub_phase: sub/PROCESS.yml\n"
+            "symbiotes:\n"
+            "  - name: coach\n"
+            "    prompt_file: symbiotes/coach.md\n",
+            encoding="utf-8",
+        )
+        (root / "sub" / "PROCESS.yml").write_text(
+            "id: sub\n"
+            "phases:\n"
+            "  - id: s\n"
+            "    spec_file: SUB.md\n"
+            "    symbiotes:\n"
+            "      - name: coach\n"
+            "        prompt_file: ../symbiotes/coach.md\n",
+            encoding="utf-8",
+        )
+        (root / "templates").mkdir()
+        for rel in ("MAIN.md", "draft.md", "templates/out.md", "sub/SUB.md", "symbiotes/coach.md"):
+            (root / rel).write_text("# doc\n", encoding="utf-8")
+        return root / "PROCESS.yml"
+
+    def test_all_references_visited_once(self, validator: ValidateUseCases, tree: Path):
+        result = validator.validate_process(tree, recursive=True)
+
+        assert result.is_valid
+        assert result.details["references"] == {
+            "MAIN.md": "spec_file",
+            "draft.md": "spec_file",
+            "templates/out.md": "template",
+            "sub/PROCESS.yml": "sub_phase",
+            "symbiotes/coach.md": "prompt_file",
+            "sub/SUB.md": "spec_file",
+        }
+
+    def test_missing_references_combined(self, validator: ValidateUseCases, tree: Path):
+        (tree.parent / "draft.md").unlink()
+        (tree.parent / "sub" / "SUB.md").unlink()
+
+        result = validator.validate_process(tree, recursive=True)
+
+        assert not result.is_valid
+        assert result.errors == [
+            "PROCESS.yml: spec_file draft.md: arquivo não encontrado",
+            "sub/PROCESS.yml: spec_file SUB.md: arquivo não encontrado",
+        ]
+
+    def test_shared_missing_reference_reported_once(
+        self, validator: ValidateUseCases, tree: Path
+    ):
+        (tree.parent / "symbiotes" / "coach.md").unlink()
+
+        result = validator.validate_process(tree, recursive=True)
+
+        assert result.errors == [
+            "PROCESS.yml: prompt_file symbiotes/coach.md: arquivo não encontrado"
+        ]
+
+    def test_invalid_subprocess_reported(self, validator: ValidateUseCases, tree: Path):
+        (tree.parent / "sub" / "PROCESS.yml").write_text("id: sub\nphases: []\n", encoding="utf-8")
+
+        result = validator.validate_process(tree, recursive=True)
+
+        assert result.errors == [
+            "PROCESS.yml: sub_phase sub/PROCESS.yml: phases ausentes ou vazias"
+        ]
+        assert "sub/SUB.md" not in result.details["references"]
+
+    def test_reference_cycle_terminates(self, validator: ValidateUseCases, tree: Path):
+        sub = tree.parent / "sub" / "PROCESS.yml"
+        back = "subprocesses:\n  - id: back\n    path: ../PROCESS.yml\n"
+        sub.write_text(sub.read_text(encoding="utf-8") + back, encoding="utf-8")
+
+        result = validator.validate_process(tree, recursive=True)
+
+        assert result.is_valid
+        assert "PROCESS.yml" not in result.details["references"]
+
+    def test_single_worker_gives_same_report(self, tree: Path):
+        (tree.parent / "MAIN.md").unlink()
+
+        parallel = ValidateUseCases().validate_process(tree, recursive=True)
+        serial = ValidateUseCases(workers=1).validate_process(tree, recursive=True)
+
+        assert serial.errors == parallel.errors
+        assert serial.details["references"] == parallel.details["references"]
+
+
+class TestValidateProcessFlow:
+    """Tests for flow analysis (flow=True)."""
+
+    def _write(self, tmp_path: Path, call_target: str) -> Path:
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: main\n"
+            "    steps:\n"
+            "      - id: draft\n"
+            "  - id: sub\n"
+            "    sub_phase: sub/PROCESS.yml\n"
+            "flow:\n"
+            "  - {id: start, type: start, next: write}\n"
+            "  - {id: write, type: step, step_ref: main.draft, next: call_sub}\n"
+            "  - {id: call_sub, type: call, subprocess_id: sub,\n"
+            f"     on_return: {{done: {call_target}}}}}\n"
+            "  - {id: end, type: end}\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "PROCESS.yml").write_text(
+            "id: sub\n"
+            "phases:\n"
+            "  - id: s\n"
+            "flow:\n"
+            "  - {id: start, type: start, next: return_done}\n"
+            "  - {id: return_done, type: return, return_status: done}\n",
+            encoding="utf-8",
+        )
+        return process_file
+
+    def test_flow_report_in_details(self, validator: ValidateUseCases, tmp_path: Path):
+        process_file = self._write(tmp_path, "end")
+
+        result = validator.validate_process(process_file, flow=True)
+
+        assert result.is_valid
+        report = result.details["flow"]
+        assert report.files == ["PROCESS.yml", "sub/PROCESS.yml"]
+        assert report.nodes == 6
+
+    def test_flow_errors_fail_validation(self, validator: ValidateUseCases, tmp_path: Path):
+        process_file = self._write(tmp_path, "write")
+
+        result = validator.validate_process(process_file, flow=True)
+
+        assert not result.is_valid
+        assert "PROCESS.yml: 'start' sem caminho até um end" in result.errors
+
+    def test_flow_not_analyzed_by_default(self, validator: ValidateUseCases, tmp_path: Path):
+        process_file = self._write(tmp_path, "write")
+
+        result = validator.validate_process(process_file)
+
+        assert result.is_valid
+        assert "flow" not in result.details
+
+    def test_malformed_flow_not_analyzed_by_default(
+        self, validator: ValidateUseCases, tmp_path: Path
+    ):
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: main\n"
+            "flow:\n"
+            "  - {id: start, type: start, next: review}\n"
+            "  - {id: review, type: decision, decision: texto}\n",
+            encoding="utf-8",
+        )
+
+        result = validator.validate_process(process_file)
+
+        assert result.is_valid
+
+
 class TestValidationResult:
     """Tests for ValidationResult dataclass."""
 
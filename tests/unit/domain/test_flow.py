@@ -0,0 +1,412 @@
+"""
+TDD Unit Tests for compiled process flows (compile_flow, FlowEngine).
+
+Tests cover:
+- Compilation into integer-indexed tables (next, branches, resolved step_refs)
+- Serializable record round trip (process cache)
+- Invalid flows: dangling targets, unknown types, unresolved step_refs, start count,
+  malformed decision/branches/on_return
+- Engine transitions: steps, decisions, end/return
+- Call stack: call pushes a frame, return pops it and follows on_return
+- Sub-processes are loaded only when a call first reaches them
+- Rejected transitions (wrong value, wrong state, finished flow)
+- Every PROCESS.yml shipped in process/ compiles
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from symforge.domain.exceptions import FlowTransitionError, InvalidFlowError
+from symforge.domain.flow import (
+    CALL,
+    DECISION,
+    NO_NODE,
+    STEP,
+    CompiledFlow,
+    FlowEngine,
+    compile_flow,
+)
+from symforge.domain.session import Session
+from symforge.domain.states import SessionState
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+PROCESS = {
+    "id": "demo",
+    "phases": [
+        {"id": "main", "steps": [{"id": "draft"}, {"id": "publish"}]},
+        {"id": "publishing", "sub_phase": "publishing/PROCESS.yml"},
+    ],
+    "flow": [
+        {"id": "start", "type": "start", "next": "write"},
+        {"id": "write", "type": "step", "step_ref": "main.draft", "next": "review"},
+        {
+            "id": "review",
+            "type": "decision",
+            "decision": {
+                "branches": [
+                    {"when": "approved", "goto": "call_pub"},
+                    {"when": "needs_revision", "goto": "write"},
+                ]
+            },
+        },
+        {
+            "id": "call_pub",
+            "type": "call",
+            "subprocess_id": "publishing",
+            "on_return": {"done": "publish", "failed": "end_failed"},
+        },
+        {"id": "publish", "type": "step", "step_ref": "main.publish", "next": "end_ok"},
+        {"id": "end_ok", "type": "end"},
+        {"id": "end_failed", "type": "return", "return_status": "failed"},
+    ],
+}
+
+PUBLISHING = {
+    "id": "publishing",
+    "phases": [{"id": "pub", "steps": [{"id": "render"}]}],
+    "subprocesses": [{"id": "proof", "path": "proof/PROCESS.yml"}],
+    "flow": [
+        {"id": "start", "type": "start", "next": "render"},
+        {"id": "render", "type": "step", "step_ref": "pub.render", "next": "check"},
+        {
+            "id": "check",
+            "type": "decision",
+            "decision": {
+                "branches": [
+                    {"when": "ok", "goto": "return_done"},
+                    {"when": "proof", "goto": "call_proof"},
+                    {"when": "abort", "goto": "return_failed"},
+                ]
+            },
+        },
+        {
+            "id": "call_proof",
+            "type": "call",
+            "subprocess_id": "proof",
+            "on_return": {"fine": "return_done"},
+        },
+        {"id": "return_done", "type": "return", "return_status": "done"},
+        {"id": "return_failed", "type": "return", "return_status": "failed"},
+    ],
+}
+
+PROOF = {
+    "id": "proof",
+    "flow": [
+        {"id": "start", "type": "start", "next": "return_fine"},
+        {"id": "return_fine", "type": "return", "return_status": "fine"},
+    ],
+}
+
+SOURCES = {
+    "process/PROCESS.yml": PROCESS,
+    "process/publishing/PROCESS.yml": PUBLISHING,
+    "process/publishing/proof/PROCESS.yml": PROOF,
+}
+
+
+def with_flow(*nodes: dict) -> dict:
+    return {**PROCESS, "flow": [PROCESS["flow"][0], *nodes]}
+
+
+def started_at(node: dict) -> dict:
+    """Flow em que o start aponta direto para `node`."""
+    return {**PROCESS, "flow": [{"id": "start", "type": "start", "next": node["id"]}, node]}
+
+
+def new_session() -> Session:
+    return Session(id="s1", process_name="demo", flow_source="process/PROCESS.yml")
+
+
+class Loader:
+    """Compila os fluxos de SOURCES sob demanda, registrando cada carga."""
+
+    def __init__(self, sources: dict[str, dict] = SOURCES):
+        self.sources = sources
+        self.loaded: list[str] = []
+        self.flows: dict[str, CompiledFlow] = {}
+
+    def __call__(self, path: str) -> CompiledFlow:
+        if path not in self.flows:
+            self.loaded.append(path)
+            self.flows[path] = compile_flow(self.sources[path])
+        return self.flows[path]
+
+
+def new_engine(loader: Loader | None = None) -> FlowEngine:
+    return FlowEngine("process/PROCESS.yml", loader or Loader())
+
+
+class TestCompileFlow:
+    """Tests for compile_flow."""
+
+    def test_tables_are_indexed_by_node_number(self):
+        flow = compile_flow(PROCESS)
+
+        write = flow.node("write")
+        review = flow.node("review")
+        assert flow.ids[flow.start] == "start"
+        assert flow.kinds[write] == STEP
+        assert flow.next[write] == review
+        assert flow.steps[write] == "draft"
+        assert flow.kinds[review] == DECISION
+        assert dict(flow.branches[review]) == {
+            "approved": flow.node("call_pub"),
+            "needs_revision": write,
+        }
+        assert flow.next[review] == NO_NODE
+
+    def test_call_and_return_nodes(self):
+        flow = compile_flow(PROCESS)
+
+        call = flow.node("call_pub")
+        assert flow.kinds[call] == CALL
+        assert flow.subprocesses[call] == "publishing"
+        assert flow.calls[call] == "publishing/PROCESS.yml"
+        assert dict(flow.branches[call]) == {
+            "done": flow.node("publish"),
+            "failed": flow.node("end_failed"),
+        }
+        assert flow.return_status[flow.node("end_failed")] == "failed"
+
+    def test_compiled_flow_is_immutable(self):
+        flow = compile_flow(PROCESS)
+
+        with pytest.raises(TypeError):
+            flow.branches[flow.node("review")]["other"] = 0  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            flow.start = 3  # type: ignore[misc]
+
+    def test_record_roundtrip(self):
+        flow = compile_flow(PROCESS)
+
+        restored = CompiledFlow.from_record(flow.to_record())
+
+        assert restored == flow
+        assert restored.node("publish") == flow.node("publish")
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"id": "demo"},
+            with_flow({"id": "write", "type": "step", "step_ref": "main.draft", "next": "nowhere"}),
+            with_flow({"id": "write", "type": "loop"}),
+            with_flow({"id": "write", "type": "step", "step_ref": "main.unknown", "next": "start"}),
+            with_flow({"id": "review", "type": "decision", "decision": {"branches": []}}),
+            with_flow({"id": "call", "type": "call", "on_return": {"ok": "start"}}),
+            with_flow(
+                {"id": "call", "type": "call", "subprocess_id": "x", "on_return": {"ok": "start"}}
+            ),
+            {**PROCESS, "flow": PROCESS["flow"][1:]},
+            {**PROCESS, "flow": [*PROCESS["flow"], PROCESS["flow"][1]]},
+            started_at({"id": "review", "type": "decision", "decision": "texto"}),
+            started_at({"id": "review", "type": "decision", "decision": {"branches": ["ok"]}}),
+            started_at({"id": "review", "type": "decision", "decision": {"branches": "ok"}}),
+            started_at(
+                {
+                    "id": "call",
+                    "type": "call",
+                    "subprocess_id": "publishing",
+                    "on_return": ["start"],
+                }
+            ),
+            {**PROCESS, "phases": [{"id": "main", "steps": 3}], "subprocesses": 3},
+        ],
+        ids=[
+            "no-flow",
+            "dangling-next",
+            "unknown-type",
+            "unknown-step-ref",
+            "decision-without-branches",
+            "call-without-subprocess",
+            "call-to-undeclared-subprocess",
+            "no-start",
+            "duplicate-id",
+            "scalar-decision",
+            "branch-not-mapping",
+            "branches-not-list",
+            "on-return-not-mapping",
+            "scalar-steps-and-subprocesses",
+        ],
+    )
+    def test_invalid_flow_raises_error(self, data: dict):
+        with pytest.raises(InvalidFlowError):
+            compile_flow(data)
+
+    @pytest.mark.parametrize(
+        "path",
+        sorted(REPO_ROOT.glob("process/**/PROCESS.yml")),
+        ids=lambda p: str(p.relative_to(REPO_ROOT)),
+    )
+    def test_shipped_processes_compile(self, path: Path):
+        flow = compile_flow(yaml.safe_load(path.read_text(encoding="utf-8")))
+
+        assert len(flow) > 1
+
+
+class TestFlowEngine:
+    """Tests for FlowEngine transitions."""
+
+    def test_enter_skips_start_node(self):
+        session = new_session()
+
+        new_engine().enter(session)
+
+        assert session.flow_node == "write"
+        assert session.state == SessionState.RUNNING
+
+    def test_step_then_decision(self):
+        engine = new_engine()
+        session = new_session()
+        engine.enter(session)
+
+        engine.advance(session, actor="alice")
+
+        assert session.flow_node == "review"
+        assert session.state == SessionState.AWAITING_DECISION
+        assert session.steps()[0].value == "draft"
+        assert session.steps()[0].actor == "alice"
+        assert engine.options(session) == ["approved", "needs_revision"]
+
+    def test_decision_branch_loops_back(self):
+        engine = new_engine()
+        session = new_session()
+        engine.enter(session)
+        engine.advance(session)
+
+        engine.advance(session, "needs_revision")
+
+        assert session.flow_node == "write"
+        assert session.state == SessionState.RUNNING
+        assert [d.value for d in session.decisions()] == ["needs_revision"]
+
+    def test_full_run_through_subprocess(self):
+        engine = new_engine()
+        session = new_session()
+        engine.enter(session)
+
+        engine.advance(session)
+        engine.advance(session, "approved")
+        assert (session.call_stack, session.flow_node) == (["call_pub"], "render")
+        assert session.state == SessionState.RUNNING
+        engine.advance(session)
+        assert engine.options(session) == ["ok", "proof", "abort"]
+        engine.advance(session, "ok")
+        assert (session.call_stack, session.flow_node) == ([], "publish")
+        engine.advance(session)
+
+        assert session.flow_node == "end_ok"
+        assert session.state == SessionState.COMPLETED
+        assert [str(e) for e in session.history] == [
+            "draft",
+            "decision:approved",
+            "render",
+            "decision:ok",
+            "publish",
+        ]
+
+    def test_subprocesses_loaded_on_first_call(self):
+        loader = Loader()
+        engine = new_engine(loader)
+        session = new_session()
+        engine.enter(session)
+        engine.advance(session)
+
+        assert loader.loaded == ["process/PROCESS.yml"]
+        engine.advance(session, "approved")
+        assert loader.loaded == ["process/PROCESS.yml", "process/publishing/PROCESS.yml"]
+
+    def test_nested_call_returns_through_every_frame(self):
+        engine = new_engine()
+        session = new_session()
+        session.flow_node = "check"
+        session.call_stack = ["call_pub"]
+        session.mark_awaiting_decision()
+
+        engine.advance(session, "proof")
+
+        # proof retorna "fine" direto; publishing retorna "done" ao raiz.
+        assert (session.call_stack, session.flow_node) == ([], "publish")
+        assert session.state == SessionState.RUNNING
+
+    def test_frames_follow_call_stack(self):
+        engine = new_engine()
+        session = new_session()
+        session.flow_node = "render"
+        session.call_stack = ["call_pub"]
+
+        assert [source for source, _ in engine.frames(session)] == [
+            "process/PROCESS.yml",
+            "process/publishing/PROCESS.yml",
+        ]
+
+    def test_return_routes_status_to_caller(self):
+        engine = new_engine()
+        session = new_session()
+        session.flow_node = "check"
+        session.call_stack = ["call_pub"]
+        session.mark_awaiting_decision()
+
+        engine.advance(session, "abort")
+
+        assert (session.call_stack, session.flow_node) == ([], "end_failed")
+        assert session.state == SessionState.COMPLETED
+
+    def test_return_without_on_return_raises_error(self):
+        sub = {**PUBLISHING, "flow": [*PUBLISHING["flow"][:-1], {
+            "id": "return_failed", "type": "return", "return_status": "unknown"
+        }]}
+        engine = new_engine(Loader({**SOURCES, "process/publishing/PROCESS.yml": sub}))
+        session = new_session()
+        session.flow_node = "check"
+        session.call_stack = ["call_pub"]
+        session.mark_awaiting_decision()
+
+        with pytest.raises(InvalidFlowError, match="unknown"):
+            engine.advance(session, "abort")
+
+    def test_unknown_branch_value_raises_error(self):
+        engine = new_engine()
+        session = new_session()
+        engine.enter(session)
+        engine.advance(session)
+
+        with pytest.raises(FlowTransitionError, match="approved, needs_revision"):
+            engine.advance(session, "maybe")
+        assert session.flow_node == "review"
+        assert session.decisions() == []
+
+    def test_step_requires_running_state(self):
+        engine = new_engine()
+        session = new_session()
+        session.mark_awaiting_input(["doc.md"])
+        engine.enter(session)
+
+        assert session.flow_node == "write"
+        with pytest.raises(FlowTransitionError):
+            engine.advance(session)
+
+    def test_step_rejects_value(self):
+        engine = new_engine()
+        session = new_session()
+        engine.enter(session)
+
+        with pytest.raises(FlowTransitionError):
+            engine.advance(session, "approved")
+
+    def test_finished_flow_rejects_advance(self):
+        engine = new_engine()
+        session = new_session()
+        session.flow_node = "end_ok"
+
+        with pytest.raises(FlowTransitionError):
+            engine.advance(session)
+
+    def test_session_without_flow_raises_error(self):
+        engine = new_engine()
+
+        with pytest.raises(FlowTransitionError):
+            engine.advance(Session(id="s1", process_name="demo"))
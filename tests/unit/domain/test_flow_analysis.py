@@ -0,0 +1,275 @@
+"""
+TDD Unit Tests for static flow analysis (analyze_flow).
+
+Tests cover:
+- Every file reached by calls is loaded once and counted in the report
+- Every structural error is reported at once, prefixed with its file
+- Malformed decisions (scalar, branches that are not a list of mappings)
+- Missing or unreadable sub-process files
+- Unreachable nodes (warning), including on_return statuses never returned
+- Return statuses without on_return in the caller
+- Nodes without a path to an end (loops with no exit)
+- Loops made only of automatic transitions (start/call/return)
+- The shipped process/ tree analyzes clean
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+
+from symforge.domain.exceptions import ProcessFileError
+from symforge.domain.flow_analysis import analyze_flow
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+ROOT = {
+    "id": "demo",
+    "phases": [
+        {"id": "main", "steps": [{"id": "draft"}]},
+        {"id": "sub", "sub_phase": "sub/PROCESS.yml"},
+    ],
+    "flow": [
+        {"id": "start", "type": "start", "next": "write"},
+        {"id": "write", "type": "step", "step_ref": "main.draft", "next": "review"},
+        {
+            "id": "review",
+            "type": "decision",
+            "decision": {
+                "branches": [
+                    {"when": "approved", "goto": "call_sub"},
+                    {"when": "again", "goto": "write"},
+                ]
+            },
+        },
+        {
+            "id": "call_sub",
+            "type": "call",
+            "subprocess_id": "sub",
+            "on_return": {"done": "end", "failed": "write"},
+        },
+        {"id": "end", "type": "end"},
+    ],
+}
+
+SUB = {
+    "id": "sub",
+    "phases": [{"id": "s", "steps": [{"id": "check"}]}],
+    "flow": [
+        {"id": "start", "type": "start", "next": "check"},
+        {
+            "id": "check",
+            "type": "decision",
+            "decision": {
+                "branches": [
+                    {"when": "ok", "goto": "return_done"},
+                    {"when": "bad", "goto": "return_failed"},
+                ]
+            },
+        },
+        {"id": "return_done", "type": "return", "return_status": "done"},
+        {"id": "return_failed", "type": "return", "return_status": "failed"},
+    ],
+}
+
+
+class Loader:
+    """Devolve os documentos de `sources`, registrando cada leitura."""
+
+    def __init__(self, **overrides: dict):
+        self.sources = {"PROCESS.yml": ROOT, "sub/PROCESS.yml": SUB, **overrides}
+        self.loaded: list[str] = []
+
+    def __call__(self, path: str) -> dict:
+        self.loaded.append(path)
+        if path not in self.sources:
+            raise ProcessFileError(path, "arquivo não encontrado")
+        return self.sources[path]
+
+
+def edited(data: dict, node_id: str, **fields) -> dict:
+    data = copy.deepcopy(data)
+    for node in data["flow"]:
+        if node["id"] == node_id:
+            node.update(fields)
+    return data
+
+
+def appended(data: dict, *nodes: dict) -> dict:
+    return {**data, "flow": [*data["flow"], *nodes]}
+
+
+class TestAnalyzeFlow:
+    """Tests for the graph built across files."""
+
+    def test_valid_tree(self):
+        loader = Loader()
+
+        report = analyze_flow("PROCESS.yml", loader)
+
+        assert report.is_valid
+        assert report.warnings == []
+        assert report.files == ["PROCESS.yml", "sub/PROCESS.yml"]
+        assert loader.loaded == report.files
+        assert report.nodes == 9
+        assert report.edges == 10
+
+    def test_shared_subprocess_loaded_once(self):
+        root = appended(
+            edited(ROOT, "call_sub", on_return={"done": "again", "failed": "write"}),
+            {
+                "id": "again",
+                "type": "call",
+                "subprocess_id": "sub",
+                "on_return": {"done": "end", "failed": "end"},
+            },
+        )
+        loader = Loader(**{"PROCESS.yml": root})
+
+        report = analyze_flow("PROCESS.yml", loader)
+
+        assert report.is_valid
+        assert loader.loaded == ["PROCESS.yml", "sub/PROCESS.yml"]
+
+    def test_all_structural_errors_reported(self):
+        root = appended(
+            edited(edited(ROOT, "write", next="nowhere"), "review", decision={"branches": []}),
+            {"id": "end", "type": "end"},
+            {"id": "loop", "type": "loop"},
+            {"id": "other", "type": "step", "step_ref": "main.unknown", "next": "end"},
+        )
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.errors[:5] == [
+            "PROCESS.yml: nó 'end' duplicado",
+            "PROCESS.yml: 'write' aponta para nó inexistente 'nowhere'",
+            "PROCESS.yml: 'review' sem desvios",
+            "PROCESS.yml: 'loop' com tipo desconhecido 'loop'",
+            "PROCESS.yml: 'other' com step_ref desconhecido 'main.unknown'",
+        ]
+
+    @pytest.mark.parametrize("decision", ["texto", {"branches": "ok"}, {"branches": ["ok"]}])
+    def test_malformed_decision_reported(self, decision):
+        root = edited(ROOT, "review", decision=decision)
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert "PROCESS.yml: 'review' sem desvios" in report.errors
+
+    def test_missing_subprocess_file(self):
+        loader = Loader()
+        del loader.sources["sub/PROCESS.yml"]
+
+        report = analyze_flow("PROCESS.yml", loader)
+
+        assert report.errors == ["sub/PROCESS.yml: arquivo não encontrado"]
+        assert report.files == ["PROCESS.yml"]
+
+    def test_undeclared_subprocess(self):
+        root = edited(ROOT, "call_sub", subprocess_id="ghost")
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.errors == [
+            "PROCESS.yml: 'call_sub' chama subprocesso não declarado 'ghost'"
+        ]
+
+    def test_root_without_start_stops_analysis(self):
+        root = {**ROOT, "flow": ROOT["flow"][1:]}
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.errors == ["PROCESS.yml: esperado um nó start, encontrados 0"]
+        assert report.nodes == 0
+
+
+class TestFlowReachability:
+    """Tests for reachability, dead ends and loops."""
+
+    def test_unreachable_node_is_warning(self):
+        root = appended(ROOT, {"id": "orphan", "type": "end"})
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.is_valid
+        assert report.warnings == ["PROCESS.yml: 'orphan' inalcançável a partir do start"]
+
+    def test_continuation_needs_matching_return(self):
+        sub = edited(SUB, "check", decision={"branches": [{"when": "ok", "goto": "return_done"}]})
+        sub = {**sub, "flow": sub["flow"][:-1]}
+        root = appended(
+            edited(ROOT, "call_sub", on_return={"done": "end", "failed": "cleanup"}),
+            {"id": "cleanup", "type": "end"},
+        )
+
+        report = analyze_flow(
+            "PROCESS.yml", Loader(**{"PROCESS.yml": root, "sub/PROCESS.yml": sub})
+        )
+
+        assert report.is_valid
+        assert report.warnings == [
+            "PROCESS.yml: 'call_sub': on_return 'failed' nunca retornado por sub/PROCESS.yml",
+            "PROCESS.yml: 'cleanup' inalcançável a partir do start",
+        ]
+
+    def test_unhandled_return_status_is_error(self):
+        root = edited(ROOT, "call_sub", on_return={"done": "end"})
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.errors == [
+            "PROCESS.yml: 'call_sub' sem on_return para o status 'failed' de sub/PROCESS.yml"
+        ]
+
+    def test_loop_without_exit_is_error(self):
+        root = edited(
+            ROOT,
+            "review",
+            decision={"branches": [{"when": "again", "goto": "write"}]},
+        )
+
+        report = analyze_flow("PROCESS.yml", Loader(**{"PROCESS.yml": root}))
+
+        assert report.errors == [
+            "PROCESS.yml: 'start' sem caminho até um end",
+            "PROCESS.yml: 'write' sem caminho até um end",
+            "PROCESS.yml: 'review' sem caminho até um end",
+        ]
+
+    def test_automatic_loop_is_error(self):
+        sub = edited(SUB, "start", next="call_back")
+        sub = appended(
+            {**sub, "phases": [*sub["phases"], {"id": "back", "sub_phase": "loop/PROCESS.yml"}]},
+            {
+                "id": "call_back",
+                "type": "call",
+                "subprocess_id": "back",
+                "on_return": {"again": "call_back", "done": "check"},
+            },
+        )
+        back = {
+            "id": "back",
+            "flow": [
+                {"id": "start", "type": "start", "next": "return_again"},
+                {"id": "return_again", "type": "return", "return_status": "again"},
+                {"id": "return_done", "type": "return", "return_status": "done"},
+            ],
+        }
+        loader = Loader(**{"sub/PROCESS.yml": sub, "sub/loop/PROCESS.yml": back})
+
+        report = analyze_flow("PROCESS.yml", loader)
+
+        assert "sub/PROCESS.yml: 'call_back' em laço sem passos ou decisões" in report.errors
+
+    def test_shipped_process_tree_is_clean(self):
+        root = REPO_ROOT / "process"
+
+        report = analyze_flow(
+            "PROCESS.yml", lambda path: yaml.safe_load((root / path).read_text(encoding="utf-8"))
+        )
+
+        assert report.errors == []
+        assert report.warnings == []
+        assert len(report.files) == len(list(root.glob("**/PROCESS.yml")))
@@ -0,0 +1,110 @@
+"""
+TDD Unit Tests for typed history events.
+
+Tests cover:
+- Step and decision constructors (timestamp and actor)
+- Compatibility with the legacy string form ("decision:<x>")
+- Compact record encoding/decoding, including legacy strings
+- Session filters (steps/decisions) and reset over typed events
+"""
+
+from symforge.domain.history import (
+    DECISION,
+    STEP,
+    HistoryEvent,
+    decode_history,
+    encode_history,
+)
+from symforge.domain.session import Session
+
+
+class TestHistoryEventConstruction:
+    """Tests for event constructors."""
+
+    def test_step_has_timestamp_and_actor(self):
+        event = HistoryEvent.step("analise", actor="alice")
+
+        assert event.kind == STEP
+        assert event.value == "analise"
+        assert event.timestamp is not None
+        assert event.actor == "alice"
+
+    def test_decision_kind(self):
+        event = HistoryEvent.decision("approved")
+
+        assert event.kind == DECISION
+        assert event.is_decision
+        assert event.actor is None
+
+    def test_events_are_slotted(self):
+        assert not hasattr(HistoryEvent.step("x"), "__dict__")
+
+
+class TestHistoryEventLegacyCompatibility:
+    """Tests for the legacy string form."""
+
+    def test_str_is_legacy_form(self):
+        assert str(HistoryEvent.step("passo1")) == "passo1"
+        assert str(HistoryEvent.decision("approved")) == "decision:approved"
+
+    def test_equals_legacy_string(self):
+        history = [HistoryEvent.step("passo1"), HistoryEvent.decision("ok")]
+
+        assert "passo1" in history
+        assert "decision:ok" in history
+        assert history.index("decision:ok") == 1
+
+    def test_parse_legacy_strings(self):
+        assert HistoryEvent.parse("decision:approved") == HistoryEvent(DECISION, "approved")
+        assert HistoryEvent.parse("passo1") == HistoryEvent(STEP, "passo1")
+
+
+class TestHistoryRecords:
+    """Tests for the compact on-disk encoding."""
+
+    def test_record_round_trip(self):
+        event = HistoryEvent(DECISION, "approved", 1700000000.123, "alice")
+
+        assert event.to_record() == ["d", "approved", 1700000000.123, "alice"]
+        assert HistoryEvent.from_record(event.to_record()) == event
+
+    def test_record_omits_trailing_empty_fields(self):
+        assert HistoryEvent(STEP, "passo1").to_record() == ["s", "passo1"]
+        assert HistoryEvent(STEP, "passo1", 1.5).to_record() == ["s", "passo1", 1.5]
+
+    def test_step_named_like_decision_round_trips(self):
+        event = HistoryEvent(STEP, "decision:x", 1.0)
+
+        assert decode_history(encode_history([event]))[0].kind == STEP
+
+    def test_decode_mixes_legacy_strings_and_records(self):
+        history = decode_history(["passo1", "decision:ok", ["s", "passo2", 2.0]])
+
+        assert [e.kind for e in history] == [STEP, DECISION, STEP]
+        assert history[2].timestamp == 2.0
+
+    def test_encode_accepts_legacy_strings(self):
+        assert encode_history(["passo1", "decision:ok"]) == [["s", "passo1"], ["d", "ok"]]
+
+
+class TestSessionHistoryFilters:
+    """Tests for Session.steps/decisions over typed and raw items."""
+
+    def test_filters_by_kind(self):
+        session = Session(id="s1", process_name="demo")
+        session.add_step("passo1")
+        session.register_decision("approved", actor="bob")
+        session.history.append("decision:legacy")
+
+        assert session.steps() == ["passo1"]
+        assert [d.value for d in session.decisions()] == ["approved", "legacy"]
+        assert session.decisions()[0].actor == "bob"
+
+    def test_reset_to_typed_step(self):
+        session = Session(id="s1", process_name="demo")
+        for step in ("a", "b", "c"):
+            session.add_step(step)
+
+        session.reset_to("b")
+
+        assert session.history == ["a", "b"]
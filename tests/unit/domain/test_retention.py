@@ -0,0 +1,60 @@
+"""
+TDD Unit Tests for session retention policies.
+
+Tests cover:
+- Parsing {STATE: days} mappings (config and CLI)
+- Validation of states and TTL values
+- Expiration by state and age
+"""
+
+import pytest
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.retention import RetentionPolicy
+from symforge.domain.session import SessionSummary
+from symforge.domain.states import SessionState
+
+DAY = 86400.0
+
+
+def summary(state: SessionState, updated_at: float) -> SessionSummary:
+    return SessionSummary(id="s1", process_name="demo", state=state, updated_at=updated_at)
+
+
+class TestRetentionParsing:
+    """Tests for RetentionPolicy.parse."""
+
+    def test_parse_states_and_days(self):
+        policy = RetentionPolicy.parse({"PAUSED": 30, "awaiting_input": "7.5"})
+
+        assert policy.ttl_days == {
+            SessionState.PAUSED: 30.0,
+            SessionState.AWAITING_INPUT: 7.5,
+        }
+        assert policy.states == {SessionState.PAUSED, SessionState.AWAITING_INPUT}
+
+    def test_unknown_state_raises(self):
+        with pytest.raises(StorageConfigError):
+            RetentionPolicy.parse({"ABANDONED": 1})
+
+    def test_negative_or_invalid_days_raise(self):
+        with pytest.raises(StorageConfigError):
+            RetentionPolicy.parse({"PAUSED": -1})
+        with pytest.raises(StorageConfigError):
+            RetentionPolicy.parse({"PAUSED": "muito"})
+
+
+class TestRetentionExpiration:
+    """Tests for RetentionPolicy.expired."""
+
+    def test_expired_after_ttl(self):
+        policy = RetentionPolicy.parse({"PAUSED": 30})
+        now = 100 * DAY
+
+        assert policy.expired(summary(SessionState.PAUSED, now - 31 * DAY), now)
+        assert not policy.expired(summary(SessionState.PAUSED, now - 29 * DAY), now)
+
+    def test_state_outside_policy_never_expires(self):
+        policy = RetentionPolicy.parse({"PAUSED": 0})
+
+        assert not policy.expired(summary(SessionState.RUNNING, 0.0), 100 * DAY)
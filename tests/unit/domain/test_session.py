@@ -7,12 +7,14 @@ Tests cover:
 - Decision registration
 - Reset/rollback behavior
 - Edge cases and invariants
+- LazySession history materialization
+- Step position index (incremental, in-place truncation)
 """
 
 import pytest
 
 from symforge.domain.exceptions import StepNotFoundError
-from symforge.domain.session import Session
+from symforge.domain.session import LazySession, Session
 from symforge.domain.states import SessionState
 
 
@@ -121,7 +123,7 @@ class TestSessionDecisionRegistration:
 
         assert "decision:first_decision" in session.history
         assert "decision:second_decision" in session.history
-        assert len([h for h in session.history if h.startswith("decision:")]) == 2
+        assert len(session.decisions()) == 2
 
 
 class TestSessionHistory:
@@ -272,3 +274,128 @@ class TestSessionEdgeCases:
 
         # Should reset to first occurrence
         assert session.history == ["step1"]
+
+
+class TestSessionStepIndex:
+    """Tests for the step-id → position index used by can_reset/reset_to."""
+
+    def test_reset_truncates_in_place(self):
+        session = Session(id="abc123", process_name="demo")
+        for step in ("a", "b", "c"):
+            session.add_step(step)
+        history = session.history
+
+        session.reset_to("b")
+
+        assert session.history is history
+        assert history == ["a", "b"]
+
+    def test_index_follows_appends_after_reset(self):
+        session = Session(id="abc123", process_name="demo")
+        for step in ("a", "b", "c"):
+            session.add_step(step)
+        session.reset_to("a")
+
+        assert not session.can_reset("c")
+        session.add_step("c")
+        session.add_step("b")
+        session.reset_to("b")
+
+        assert session.history == ["a", "c", "b"]
+
+    def test_index_sees_raw_appends_and_decisions(self):
+        session = Session(id="abc123", process_name="demo")
+        session.add_step("a")
+        assert session.can_reset("a")
+        session.history.append("legacy")
+        session.register_decision("ok")
+
+        assert session.can_reset("legacy")
+        assert session.can_reset("decision:ok")
+
+    def test_index_rebuilt_when_history_replaced(self):
+        session = Session(id="abc123", process_name="demo")
+        session.add_step("a")
+        assert session.can_reset("a")
+
+        session.history = ["x", "y"]
+
+        assert not session.can_reset("a")
+        session.reset_to("x")
+        assert session.history == ["x"]
+
+    def test_duplicate_removed_by_reset_keeps_first_position(self):
+        session = Session(id="abc123", process_name="demo")
+        for step in ("a", "b", "a", "c"):
+            session.add_step(step)
+
+        session.reset_to("b")
+
+        assert session.can_reset("a")
+        assert not session.can_reset("c")
+
+    def test_long_history_reset(self):
+        session = Session(id="abc123", process_name="demo")
+        for n in range(5000):
+            session.add_step(f"step{n}")
+
+        session.reset_to("step4000")
+
+        assert len(session.history) == 4001
+        assert session.can_reset("step4000")
+        assert not session.can_reset("step4001")
+
+
+class TestSessionSyncedHistory:
+    """Tests for the persisted-history watermark used by incremental repositories."""
+
+    def test_reset_lowers_synced_watermark(self):
+        session = Session(id="abc123", process_name="demo")
+        for step in ("a", "b", "c"):
+            session.add_step(step)
+        session.synced_history = 3
+
+        session.reset_to("a")
+
+        assert session.synced_history == 1
+
+    def test_synced_watermark_not_part_of_equality(self):
+        a = Session(id="abc123", process_name="demo")
+        b = Session(id="abc123", process_name="demo")
+        b.synced_history = 5
+
+        assert a == b
+
+
+class TestLazySession:
+    """Tests for LazySession history materialization."""
+
+    def test_history_loaded_once_on_access(self):
+        calls = []
+
+        def load_history():
+            calls.append(1)
+            return ["a", "b"]
+
+        session = LazySession(load_history, id="s1", process_name="p")
+
+        assert session.history_loaded is False
+        assert session.history == ["a", "b"]
+        assert session.history == ["a", "b"]
+        assert calls == [1]
+        assert session.synced_history == 2
+
+    def test_header_fields_do_not_load_history(self):
+        session = LazySession(lambda: pytest.fail("history loaded"), id="s1", process_name="p")
+
+        session.mark_paused()
+
+        assert session.state == SessionState.PAUSED
+        assert session.history_loaded is False
+
+    def test_mutation_materializes_history(self):
+        session = LazySession(lambda: ["a"], id="s1", process_name="p")
+
+        session.add_step("b")
+
+        assert session.history == ["a", "b"]
@@ -0,0 +1,83 @@
+"""
+TDD Unit Tests for time-ordered session ids.
+
+Tests cover:
+- Id format (26 chars, Crockford base32)
+- Ordering by creation time and monotonicity within a millisecond
+- Timestamp decoding and lower bounds for range scans
+"""
+
+from datetime import datetime
+
+from symforge.domain.session_id import (
+    ALPHABET,
+    ID_LENGTH,
+    SessionIdGenerator,
+    is_time_ordered,
+    lower_bound,
+    new_session_id,
+    session_id_time,
+)
+
+
+class TestSessionIdFormat:
+    """Tests for id shape."""
+
+    def test_id_has_fixed_length_and_alphabet(self):
+        session_id = new_session_id()
+
+        assert len(session_id) == ID_LENGTH
+        assert set(session_id) <= set(ALPHABET)
+        assert is_time_ordered(session_id)
+
+    def test_legacy_hex_id_is_not_time_ordered(self):
+        assert not is_time_ordered("6c24fb98")
+        assert session_id_time("6c24fb98") is None
+
+
+class TestSessionIdOrdering:
+    """Tests for ordering guarantees."""
+
+    def test_ids_sort_by_creation_time(self):
+        generator = SessionIdGenerator()
+
+        earlier = generator.new(now=1_700_000_000.000)
+        later = generator.new(now=1_700_000_000.001)
+
+        assert earlier < later
+
+    def test_ids_are_monotonic_within_same_millisecond(self):
+        generator = SessionIdGenerator()
+
+        ids = [generator.new(now=1_700_000_000.0) for _ in range(1000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 1000
+
+    def test_clock_going_backwards_keeps_order(self):
+        generator = SessionIdGenerator()
+
+        first = generator.new(now=1_700_000_001.0)
+        second = generator.new(now=1_700_000_000.0)
+
+        assert first < second
+
+
+class TestSessionIdTime:
+    """Tests for decoding and bounds."""
+
+    def test_decodes_creation_time(self):
+        generator = SessionIdGenerator()
+        created = datetime(2026, 1, 2, 3, 4, 5)
+
+        session_id = generator.new(now=created.timestamp())
+
+        assert session_id_time(session_id) == created
+
+    def test_lower_bound_splits_ids_by_time(self):
+        generator = SessionIdGenerator()
+        cutoff = datetime(2026, 1, 1)
+        before = generator.new(now=cutoff.timestamp() - 0.001)
+        at = generator.new(now=cutoff.timestamp())
+
+        assert before < lower_bound(cutoff) <= at
@@ -0,0 +1,135 @@
+"""
+TDD Unit Tests for atomic writes and durability modes.
+
+Tests cover:
+- atomic_write replacing files via temp + rename
+- Failed writes leaving the previous content intact
+- DurableWriter fsync policy (none/batch/always)
+- Repositories and handoffs using atomic writes
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.infrastructure import durable_io
+from symforge.infrastructure.durable_io import DurableWriter, atomic_write
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.storage import StorageConfig, create_session_repository
+
+
+@pytest.fixture
+def fsync_calls(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    real_fsync = os.fsync
+
+    def recording_fsync(fd: int) -> None:
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(durable_io.os, "fsync", recording_fsync)
+    return calls
+
+
+class TestAtomicWrite:
+    """Tests for temp + rename writes."""
+
+    def test_replaces_content(self, tmp_path: Path):
+        target = tmp_path / "session.yml"
+        target.write_bytes(b"old")
+
+        atomic_write(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path: Path, monkeypatch):
+        target = tmp_path / "session.yml"
+        target.write_bytes(b"old")
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(durable_io.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            atomic_write(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestDurableWriter:
+    """Tests for fsync policies."""
+
+    def test_none_never_fsyncs(self, tmp_path: Path, fsync_calls: list[int]):
+        writer = DurableWriter("none")
+
+        writer.write(tmp_path / "a", b"x")
+        writer.append(tmp_path / "b", "y")
+        writer.sync()
+
+        assert fsync_calls == []
+
+    def test_always_fsyncs_each_write(self, tmp_path: Path, fsync_calls: list[int]):
+        writer = DurableWriter("always")
+
+        writer.write(tmp_path / "a", b"x")
+
+        assert len(fsync_calls) == 2  # arquivo + diretório
+
+    def test_batch_defers_fsync_to_sync(self, tmp_path: Path, fsync_calls: list[int]):
+        writer = DurableWriter("batch")
+        writer.write(tmp_path / "a", b"x")
+        writer.write(tmp_path / "a", b"y")
+        writer.append(tmp_path / "b", "z")
+        assert fsync_calls == []
+
+        writer.sync()
+
+        assert len(fsync_calls) == 3  # a, b + diretório
+        writer.sync()
+        assert len(fsync_calls) == 3
+
+    def test_unknown_mode_raises_error(self):
+        with pytest.raises(StorageConfigError):
+            DurableWriter("sometimes")
+
+
+class TestRepositoryDurability:
+    """Tests for durability wiring in repositories and runtime."""
+
+    def test_save_leaves_no_temp_files(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", durability="always")
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        assert not [p for p in repo.base_dir.iterdir() if p.suffix == ".tmp"]
+        assert repo.load(session.id).id == session.id
+
+    def test_flush_syncs_batched_writes(self, tmp_path: Path, fsync_calls: list[int]):
+        repo = SessionRepository(tmp_path / "sessions", durability="batch")
+        repo.create(ProcessDefinition(name="test"))
+        assert fsync_calls == []
+
+        repo.flush()
+
+        assert fsync_calls
+
+    def test_factory_rejects_invalid_durability(self, tmp_path: Path):
+        with pytest.raises(StorageConfigError):
+            create_session_repository(tmp_path, StorageConfig(durability="maybe"))
+
+    def test_handoff_written_atomically(self, tmp_path: Path):
+        runtime = RuntimeUseCases(
+            tmp_path / ".symforge" / "sessions", storage=StorageConfig(durability="always")
+        )
+        session = runtime.start(ProcessDefinition(name="test"), tmp_path)
+
+        handoff = runtime.pause(session, tmp_path)
+
+        assert handoff.read_text(encoding="utf-8").startswith("# Handoff: test")
+        assert list(handoff.parent.iterdir()) == [handoff]
@@ -0,0 +1,326 @@
+"""
+TDD Unit Tests for auto-commit backends.
+
+Tests cover:
+- CoalescingCommitter batching by count and time window
+- Failures of the background window flush surface on the next commit/flush
+- Explicit flush/close (also flushing the inner committer)
+- RuntimeUseCases.start producing a single commit when batching
+- FastImportCommitter streaming commits into a dedicated ref, written at flush
+  or when the queue reaches its commit/byte limit
+- RuntimeUseCases.flush publishing batched fast-import commits without closing
+- Concurrent fast-import writers chain their commits; failed imports raise errors
+"""
+
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import AutoCommitError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.infrastructure.git_committer import CoalescingCommitter, FastImportCommitter
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.storage import StorageConfig
+
+
+def init_git_repo(path: Path) -> None:
+    for args in (
+        ["init"],
+        ["config", "user.email", "test@test.com"],
+        ["config", "user.name", "Test User"],
+    ):
+        subprocess.run(["git", *args], cwd=path, capture_output=True, check=True)
+
+
+def get_commit_count(path: Path) -> int:
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD"], cwd=path, capture_output=True, text=True
+    )
+    return int(result.stdout.strip()) if result.returncode == 0 else 0
+
+
+class RecordingCommitter:
+    def __init__(self):
+        self.commits: list[tuple[list[Path], str]] = []
+        self.flushes = 0
+        self.closed = False
+
+    def commit(self, paths: list[Path], message: str) -> None:
+        self.commits.append((paths, message))
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FailingCommitter(RecordingCommitter):
+    def commit(self, paths: list[Path], message: str) -> None:
+        super().commit(paths, message)
+        raise AutoCommitError("git commit-tree: sem identidade")
+
+
+def wait_for_window(inner: RecordingCommitter, timeout: float = 2) -> None:
+    """Espera o timer da janela gravar o lote e terminar."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and (
+        not inner.commits
+        or any(isinstance(t, threading.Timer) and t.is_alive() for t in threading.enumerate())
+    ):
+        time.sleep(0.01)
+
+
+class TestCoalescingCommitter:
+    """Tests for commit batching."""
+
+    def test_flushes_when_batch_is_full(self):
+        inner = RecordingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=2)
+
+        committer.commit([Path("a.yml")], "first")
+        assert inner.commits == []
+        committer.commit([Path("b.yml")], "second")
+
+        assert len(inner.commits) == 1
+        paths, message = inner.commits[0]
+        assert paths == [Path("a.yml"), Path("b.yml")]
+        assert "first" in message and "second" in message
+
+    def test_deduplicates_paths(self):
+        inner = RecordingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=10)
+
+        committer.commit([Path("a.yml")], "one")
+        committer.commit([Path("a.yml")], "two")
+        committer.flush()
+
+        assert inner.commits[0][0] == [Path("a.yml")]
+
+    def test_single_message_kept_verbatim(self):
+        inner = RecordingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=10)
+
+        committer.commit([Path("a.yml")], "[symforge] session x -> RUNNING")
+        committer.close()
+
+        assert inner.commits == [([Path("a.yml")], "[symforge] session x -> RUNNING")]
+        assert inner.closed
+
+    def test_flush_flushes_inner_committer(self):
+        inner = RecordingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=2)
+
+        committer.commit([Path("a.yml")], "one")
+        committer.commit([Path("b.yml")], "two")
+        assert inner.flushes == 0
+        committer.flush()
+
+        assert (len(inner.commits), inner.flushes) == (1, 1)
+
+    def test_flush_without_pending_is_noop(self):
+        inner = RecordingCommitter()
+        CoalescingCommitter(inner, max_batch=10).flush()
+
+        assert inner.commits == []
+
+    def test_window_expiry_flushes_in_background(self):
+        inner = RecordingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=100, window_ms=20)
+
+        committer.commit([Path("a.yml")], "one")
+        deadline = time.monotonic() + 2
+        while not inner.commits and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(inner.commits) == 1
+        assert committer.pending == 0
+
+    def test_window_failure_raised_on_next_flush(self):
+        inner = FailingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=100, window_ms=20)
+
+        committer.commit([Path("a.yml")], "one")
+        wait_for_window(inner)
+
+        with pytest.raises(AutoCommitError, match="sem identidade"):
+            committer.flush()
+        committer.flush()  # reportada uma única vez
+
+    def test_window_failure_raised_on_next_commit(self):
+        inner = FailingCommitter()
+        committer = CoalescingCommitter(inner, max_batch=100, window_ms=20)
+        committer.commit([Path("a.yml")], "one")
+        wait_for_window(inner)
+
+        with pytest.raises(AutoCommitError):
+            committer.commit([Path("b.yml")], "two")
+
+        assert committer.pending == 1  # a transição nova continua no lote
+
+
+class TestRuntimeCommitBatching:
+    """Tests for batched auto-commit through RuntimeUseCases."""
+
+    def test_start_produces_single_commit(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        runtime = RuntimeUseCases(
+            tmp_path / ".symforge" / "sessions",
+            auto_commit=True,
+            storage=StorageConfig(commit_batch_size=50),
+        )
+
+        runtime.start(ProcessDefinition(name="test"), tmp_path)
+        assert get_commit_count(tmp_path) == 0
+        runtime.close()
+
+        assert get_commit_count(tmp_path) == 1
+
+    def test_batch_spans_several_transitions(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        runtime = RuntimeUseCases(
+            tmp_path / ".symforge" / "sessions",
+            auto_commit=True,
+            storage=StorageConfig(commit_batch_size=50),
+        )
+
+        session = runtime.start(ProcessDefinition(name="test"), tmp_path)
+        runtime.pause(session, tmp_path)
+        runtime.close()
+
+        assert get_commit_count(tmp_path) == 1
+
+    def test_default_config_commits_immediately(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        runtime = RuntimeUseCases(tmp_path / ".symforge" / "sessions", auto_commit=True)
+
+        runtime.start(ProcessDefinition(name="test"), tmp_path)
+
+        assert get_commit_count(tmp_path) == 1
+
+
+def ref_log(path: Path, ref: str) -> list[str]:
+    result = subprocess.run(
+        ["git", "log", "--format=%s", ref], cwd=path, capture_output=True, text=True
+    )
+    return result.stdout.splitlines() if result.returncode == 0 else []
+
+
+class TestFastImportCommitter:
+    """Tests for the batched git fast-import writer."""
+
+    def test_transitions_are_committed_to_dedicated_ref(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        repo = SessionRepository(
+            tmp_path / ".symforge" / "sessions",
+            auto_commit=True,
+            committer=FastImportCommitter(tmp_path),
+        )
+
+        session = repo.create(ProcessDefinition(name="test"))
+        session.mark_awaiting_decision()
+        repo.update(session)
+        repo.close()
+
+        messages = ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)
+        assert len(messages) == 2
+        assert "AWAITING_DECISION" in messages[0]
+        assert get_commit_count(tmp_path) == 0  # HEAD intocado
+
+    def test_committed_blob_matches_session_file(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        repo = SessionRepository(
+            tmp_path / ".symforge" / "sessions",
+            auto_commit=True,
+            committer=FastImportCommitter(tmp_path),
+        )
+        session = repo.create(ProcessDefinition(name="test"))
+        repo.flush()
+
+        rel = f".symforge/sessions/{session.id}.yml"
+        shown = subprocess.run(
+            ["git", "show", f"{FastImportCommitter.DEFAULT_REF}:{rel}"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert shown.stdout == (tmp_path / rel).read_text(encoding="utf-8")
+        repo.close()
+
+    def test_new_runtime_continues_existing_ref(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        storage = StorageConfig(commit_backend="fast-import")
+        sessions_dir = tmp_path / ".symforge" / "sessions"
+
+        first = RuntimeUseCases(sessions_dir, auto_commit=True, storage=storage)
+        session = first.start(ProcessDefinition(name="test"), tmp_path)
+        first.close()
+        second = RuntimeUseCases(sessions_dir, auto_commit=True, storage=storage)
+        second.pause(second.repo.load(session.id), tmp_path)
+        second.close()
+
+        assert len(ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)) == 2
+
+    def test_concurrent_runtimes_keep_every_transition(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        storage = StorageConfig(commit_backend="fast-import")
+        sessions_dir = tmp_path / ".symforge" / "sessions"
+
+        def run() -> None:
+            runtime = RuntimeUseCases(sessions_dir, auto_commit=True, storage=storage)
+            runtime.start(ProcessDefinition(name="test"), tmp_path)
+            runtime.close()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: run(), range(8)))
+
+        assert len(ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)) == 8
+
+    def test_full_queue_is_written_without_flush(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        committer = FastImportCommitter(tmp_path, max_pending=2)
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.txt").write_text(name, encoding="utf-8")
+            committer.commit([tmp_path / f"{name}.txt"], f"[symforge] {name}")
+
+        messages = ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)
+        assert messages == ["[symforge] b", "[symforge] a"]
+        committer.close()
+        assert len(ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)) == 3
+
+    def test_queue_bytes_limit_triggers_write(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        committer = FastImportCommitter(tmp_path, max_pending_bytes=1024)
+        (tmp_path / "big.txt").write_text("x" * 2048, encoding="utf-8")
+
+        committer.commit([tmp_path / "big.txt"], "[symforge] big")
+
+        assert ref_log(tmp_path, FastImportCommitter.DEFAULT_REF) == ["[symforge] big"]
+
+    def test_runtime_flush_publishes_batched_commits(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        runtime = RuntimeUseCases(
+            tmp_path / ".symforge" / "sessions",
+            auto_commit=True,
+            storage=StorageConfig(commit_backend="fast-import", commit_batch_size=5),
+        )
+        runtime.start(ProcessDefinition(name="test"), tmp_path)
+
+        runtime.flush()
+
+        assert len(ref_log(tmp_path, FastImportCommitter.DEFAULT_REF)) == 1
+        runtime.close()
+
+    def test_failed_import_raises_error(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        committer = FastImportCommitter(tmp_path, ref="refs/symforge/bad..ref")
+        (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+        committer.commit([tmp_path / "a.txt"], "[symforge] a")
+
+        with pytest.raises(AutoCommitError, match="fast-import"):
+            committer.close()
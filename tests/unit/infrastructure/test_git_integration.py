@@ -202,3 +202,53 @@ class TestGitEdgeCases:
 
         commit_count = get_commit_count(tmp_path)
         assert commit_count == 0
+
+
+class TestGitPrivateIndexCommits:
+    """Tests for commits built on private index files with compare-and-swap."""
+
+    def test_commit_does_not_include_unrelated_staged_files(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        (tmp_path / "other.txt").write_text("staged by the user")
+        subprocess.run(["git", "add", "other.txt"], cwd=tmp_path, check=True)
+        repo = SessionRepository(tmp_path / ".symforge" / "sessions", auto_commit=True)
+
+        repo.create(ProcessDefinition(name="test"))
+
+        files = subprocess.run(
+            ["git", "ls-tree", "-r", "--name-only", "HEAD"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert "other.txt" not in files
+
+    def test_commit_leaves_shared_index_lock_untouched(self, tmp_path: Path):
+        init_git_repo(tmp_path)
+        lock = tmp_path / ".git" / "index.lock"
+        lock.write_text("")  # outro processo segurando o índice compartilhado
+        repo = SessionRepository(tmp_path / ".symforge" / "sessions", auto_commit=True)
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        assert session.id in get_last_commit_message(tmp_path)
+        assert lock.exists()
+
+    def test_parallel_commits_are_not_lost(self, tmp_path: Path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        init_git_repo(tmp_path)
+        sessions_dir = tmp_path / ".symforge" / "sessions"
+        process = ProcessDefinition(name="test")
+
+        def run_session(_: int) -> None:
+            repo = SessionRepository(sessions_dir, auto_commit=True)
+            session = repo.create(process)
+            for step in ("a", "b"):
+                session.add_step(step)
+                repo.update(session)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(run_session, range(6)))
+
+        assert get_commit_count(tmp_path) == 18
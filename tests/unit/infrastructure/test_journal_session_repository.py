@@ -0,0 +1,202 @@
+"""
+TDD Unit Tests for JournalSessionRepository (event-sourced persistence).
+
+Tests cover:
+- One appended journal record per transition
+- Snapshot + replay on load
+- Reset (history truncation) encoded in the journal
+- Periodic snapshots and torn trailing records
+- Version counter replayed from the journal
+- Version checks read the snapshot header and last record, without replay
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from symforge.domain.exceptions import SessionConflictError
+from symforge.domain.history import decode_history
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.states import SessionState
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+
+
+def journal_lines(repo: JournalSessionRepository, session_id: str) -> list[dict]:
+    path = repo.base_dir / f"{session_id}.journal"
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJournalAppend:
+    """Tests for append-only saves."""
+
+    def test_create_writes_snapshot(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        assert (repo.base_dir / f"{session.id}.yml").exists()
+        assert journal_lines(repo, session.id) == []
+
+    def test_update_appends_only_new_history(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+
+        session.add_step("step1")
+        repo.update(session)
+        session.add_step("step2")
+        repo.update(session)
+
+        records = journal_lines(repo, session.id)
+        assert [decode_history(r["append"]) for r in records] == [["step1"], ["step2"]]
+
+    def test_snapshot_is_not_rewritten_on_update(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        snapshot = repo.base_dir / f"{session.id}.yml"
+        before = snapshot.read_text(encoding="utf-8")
+
+        session.add_step("step1")
+        repo.update(session)
+
+        assert snapshot.read_text(encoding="utf-8") == before
+
+
+class TestJournalReplay:
+    """Tests for load via snapshot + replay."""
+
+    def test_load_replays_journal(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        session.mark_awaiting_decision()
+        repo.update(session)
+        session.register_decision("approved")
+        repo.update(session)
+
+        loaded = JournalSessionRepository(tmp_path / "sessions").load(session.id)
+
+        assert loaded.history == ["step1", "decision:approved"]
+        assert loaded.state == SessionState.RUNNING
+        assert loaded.pending_decision is False
+
+    def test_reset_is_journaled_as_truncation(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        for step in ("a", "b", "c"):
+            session.add_step(step)
+        repo.update(session)
+
+        session.reset_to("a")
+        session.add_step("x")
+        session.add_step("c")
+        repo.update(session)
+
+        assert journal_lines(repo, session.id)[-1]["truncate"] == 1
+        loaded = JournalSessionRepository(tmp_path / "sessions").load(session.id)
+        assert loaded.history == ["a", "x", "c"]
+
+    def test_version_is_replayed_from_journal(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        stale = JournalSessionRepository(tmp_path / "sessions").load(session.id)
+        session.add_step("step1")
+        repo.update(session)
+
+        assert JournalSessionRepository(tmp_path / "sessions").load(session.id).version == 1
+        with pytest.raises(SessionConflictError):
+            repo.update(stale)
+
+    def test_save_after_load_keeps_appending(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+
+        other = JournalSessionRepository(tmp_path / "sessions")
+        loaded = other.load(session.id)
+        loaded.add_step("step2")
+        other.update(loaded)
+
+        assert decode_history(journal_lines(other, session.id)[-1]["append"]) == ["step2"]
+        assert other.load(session.id).history == ["step1", "step2"]
+
+
+class TestJournalVersionCheck:
+    """Tests for the compare-and-swap version read."""
+
+    def test_update_does_not_replay_journal(self, tmp_path: Path, monkeypatch):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        for i in range(3):
+            session.add_step(f"step{i}")
+            repo.update(session)
+        reads: list[str] = []
+        monkeypatch.setattr(repo, "_read", lambda session_id: reads.append(session_id))
+
+        session.add_step("step3")
+        repo.update(session)
+
+        assert reads == []
+        assert JournalSessionRepository(tmp_path / "sessions").load(session.id).version == 4
+
+    def test_stale_journal_after_snapshot_is_ignored(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions", snapshot_every=2)
+        session = repo.create(ProcessDefinition(name="test"))
+        stale_record = None
+        for i in range(3):
+            session.add_step(f"step{i}")
+            repo.update(session)
+            stale_record = stale_record or journal_lines(repo, session.id)[-1]
+        # Crash entre o snapshot e o truncamento do journal: sobra um registro antigo.
+        (repo.base_dir / f"{session.id}.journal").write_text(
+            json.dumps(stale_record) + "\n", encoding="utf-8"
+        )
+
+        session.add_step("step3")
+        repo.update(session)
+
+        assert repo.load(session.id).version == 4
+
+    def test_torn_last_record_falls_back_to_replay(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        stale = JournalSessionRepository(tmp_path / "sessions").load(session.id)
+        session.add_step("step1")
+        repo.update(session)
+        with (repo.base_dir / f"{session.id}.journal").open("a", encoding="utf-8") as fp:
+            fp.write('{"seq": 2, "sta')
+
+        with pytest.raises(SessionConflictError):
+            JournalSessionRepository(tmp_path / "sessions").update(stale)
+
+
+class TestJournalSnapshots:
+    """Tests for periodic snapshots."""
+
+    def test_snapshot_every_n_records(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions", snapshot_every=2)
+        session = repo.create(ProcessDefinition(name="test"))
+        for i in range(3):
+            session.add_step(f"step{i}")
+            repo.update(session)
+
+        snapshot = yaml.safe_load((repo.base_dir / f"{session.id}.yml").read_text(encoding="utf-8"))
+        assert decode_history(snapshot["history"]) == ["step0", "step1", "step2"]
+        assert journal_lines(repo, session.id) == []
+
+    def test_torn_trailing_record_is_ignored(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+        with (repo.base_dir / f"{session.id}.journal").open("a", encoding="utf-8") as fp:
+            fp.write('{"seq": 2, "sta')
+
+        reader = JournalSessionRepository(tmp_path / "sessions")
+        loaded = reader.load(session.id)
+        loaded.add_step("step2")
+        reader.update(loaded)
+
+        assert reader.load(session.id).history == ["step1", "step2"]
@@ -0,0 +1,123 @@
+"""
+TDD Unit Tests for header-only (lazy) session loading.
+
+Tests cover:
+- load_lazy reading only the document header
+- History materialized on first access and on save
+- Fallback to full load for legacy documents and the journal backend
+- SQLite header extraction and status --brief
+"""
+
+from pathlib import Path
+
+import yaml
+
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.session import LazySession
+from symforge.domain.states import SessionState
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.sqlite_session_repository import SqliteSessionRepository
+
+
+def session_with_history(repo: SessionRepository, steps: int) -> str:
+    session = repo.create(ProcessDefinition(name="test", required_artifacts=["doc.md"]))
+    for i in range(steps):
+        session.add_step(f"step{i}")
+    session.mark_awaiting_decision()
+    repo.update(session)
+    return session.id
+
+
+class TestLoadLazy:
+    """Tests for SessionRepository.load_lazy()."""
+
+    def test_header_fields_without_reading_history(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 50)
+        reads = []
+        original_read = repo._read
+        monkeypatch.setattr(repo, "_read", lambda sid: reads.append(sid) or original_read(sid))
+
+        session = repo.load_lazy(session_id)
+
+        assert isinstance(session, LazySession)
+        assert session.state == SessionState.AWAITING_DECISION
+        assert session.required_artifacts == ["doc.md"]
+        assert session.version == 1
+        assert not session.history_loaded
+        assert reads == []
+
+    def test_history_loaded_on_first_access(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 3)
+
+        session = repo.load_lazy(session_id)
+
+        assert session.history == ["step0", "step1", "step2"]
+        assert session.history_loaded
+
+    def test_update_of_lazy_session_keeps_history(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 3)
+
+        session = repo.load_lazy(session_id)
+        session.register_decision("ok")
+        repo.update(session)
+
+        assert repo.load(session_id).history == ["step0", "step1", "step2", "decision:ok"]
+
+    def test_save_without_touching_history_preserves_it(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 3)
+
+        session = repo.load_lazy(session_id)
+        session.mark_paused()
+        repo.update(session)
+
+        assert repo.load(session_id).history == ["step0", "step1", "step2"]
+
+    def test_legacy_sorted_document_falls_back_to_full_load(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 2)
+        path = repo.base_dir / f"{session_id}.yml"
+        path.write_text(yaml.dump(yaml.safe_load(path.read_text(encoding="utf-8"))), encoding="utf-8")
+
+        session = repo.load_lazy(session_id)
+
+        assert not isinstance(session, LazySession)
+        assert session.history == ["step0", "step1"]
+
+    def test_find_lazy(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session_with_history(repo, 2)
+
+        sessions = repo.find(state=SessionState.AWAITING_DECISION, lazy=True)
+
+        assert len(sessions) == 1
+        assert not sessions[0].history_loaded
+
+
+class TestLazyBackends:
+    """Tests for backend-specific header reads."""
+
+    def test_journal_returns_replayed_session(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 2)
+
+        session = repo.load_lazy(session_id)
+
+        assert session.state == SessionState.AWAITING_DECISION
+        assert session.history == ["step0", "step1"]
+
+    def test_sqlite_header_is_cut_before_history(self, tmp_path: Path):
+        repo = SqliteSessionRepository(tmp_path / "sessions")
+        session_id = session_with_history(repo, 2)
+
+        header = repo._read_header(session_id)
+        session = repo.load_lazy(session_id)
+
+        assert "history" not in header
+        assert session.state == SessionState.AWAITING_DECISION
+        assert session.history == ["step0", "step1"]
+        repo.close()
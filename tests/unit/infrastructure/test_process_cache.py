@@ -0,0 +1,176 @@
+"""
+TDD Unit Tests for the process-definition cache (ProcessCache, ProcessLoader).
+
+Tests cover:
+- A second loader with the same cache directory skips YAML parsing
+- Only edited files are parsed again (key = content hash)
+- Compilation errors are cached and raised again
+- Corrupted cache files are ignored and rewritten
+- Documents with non-JSON values or non-string keys are not cached
+- A warm (cached) validate --flow gives the same report as a cold one
+- Loaders without a cache directory write nothing
+"""
+
+from pathlib import Path
+
+import pytest
+
+from symforge.domain.exceptions import InvalidFlowError, ProcessFileError
+from symforge.domain.flow_analysis import analyze_flow
+from symforge.infrastructure.process_cache import ProcessCache
+from symforge.infrastructure.process_loader import ProcessLoader
+
+PROCESS = """\
+id: demo
+phases:
+  - id: main
+    steps:
+      - id: draft
+  - id: sub
+    sub_phase: sub/PROCESS.yml
+flow:
+  - {id: start, type: start, next: write}
+  - {id: write, type: step, step_ref: main.draft, next: call_sub}
+  - {id: call_sub, type: call, subprocess_id: sub, on_return: {done: end}}
+  - {id: end, type: end}
+"""
+
+SUB = """\
+id: sub
+flow:
+  - {id: start, type: start, next: return_done}
+  - {id: return_done, type: return, return_status: done}
+"""
+
+
+@pytest.fixture
+def process_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "process"
+    (root / "sub").mkdir(parents=True)
+    (root / "PROCESS.yml").write_text(PROCESS, encoding="utf-8")
+    (root / "sub" / "PROCESS.yml").write_text(SUB, encoding="utf-8")
+    return root
+
+
+def track_parses(loader: ProcessLoader, monkeypatch) -> list[str]:
+    parses: list[str] = []
+    original = loader._parse
+
+    def tracking(path: Path, raw: bytes):
+        parses.append(path.parent.name)
+        return original(path, raw)
+
+    monkeypatch.setattr(loader, "_parse", tracking)
+    return parses
+
+
+class TestProcessCache:
+    """Tests for cache hits and invalidation."""
+
+    def test_second_loader_skips_parsing(self, tmp_path: Path, process_dir: Path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        first = ProcessLoader(cache_dir).load(process_dir / "PROCESS.yml")
+        loader = ProcessLoader(cache_dir)
+        parses = track_parses(loader, monkeypatch)
+
+        flow = loader.load(process_dir / "PROCESS.yml")
+
+        assert parses == []
+        assert flow == first
+        assert flow.calls[flow.node("call_sub")] == "sub/PROCESS.yml"
+        assert loader.document(process_dir / "PROCESS.yml")["id"] == "demo"
+
+    def test_only_edited_file_is_parsed(self, tmp_path: Path, process_dir: Path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        warm = ProcessLoader(cache_dir)
+        warm.load(process_dir / "PROCESS.yml")
+        warm.load(process_dir / "sub" / "PROCESS.yml")
+        (process_dir / "sub" / "PROCESS.yml").write_text(
+            SUB.replace("id: sub", "id: sub_v2"), encoding="utf-8"
+        )
+        loader = ProcessLoader(cache_dir)
+        parses = track_parses(loader, monkeypatch)
+
+        loader.load(process_dir / "PROCESS.yml")
+        sub = loader.load(process_dir / "sub" / "PROCESS.yml")
+
+        assert parses == ["sub"]
+        assert sub.process_id == "sub_v2"
+
+    def test_compile_error_is_cached(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "PROCESS.yml"
+        path.write_text("id: broken\nflow: []\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        with pytest.raises(InvalidFlowError):
+            ProcessLoader(cache_dir).load(path)
+        loader = ProcessLoader(cache_dir)
+        parses = track_parses(loader, monkeypatch)
+
+        with pytest.raises(InvalidFlowError, match="flow ausente"):
+            loader.load(path)
+        assert parses == []
+        assert loader.document(path)["id"] == "broken"
+
+    def test_corrupted_entry_is_rewritten(self, tmp_path: Path, process_dir: Path):
+        cache_dir = tmp_path / "cache"
+        path = process_dir / "PROCESS.yml"
+        ProcessLoader(cache_dir).load(path)
+        cache = ProcessCache(cache_dir)
+        entry = cache.directory / f"{cache.digest(path.read_bytes())}.json"
+        entry.write_text("{truncated", encoding="utf-8")
+
+        flow = ProcessLoader(cache_dir).load(path)
+
+        assert flow.process_id == "demo"
+        assert cache.get(cache.digest(path.read_bytes())) is not None
+
+    def test_non_json_document_is_not_cached(self, tmp_path: Path, process_dir: Path):
+        path = process_dir / "PROCESS.yml"
+        path.write_text(PROCESS + "created_at: 2025-12-02\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        ProcessLoader(cache_dir).load(path)
+
+        assert not any(ProcessCache(cache_dir).directory.glob("*.json"))
+
+    def test_non_string_keys_are_not_cached(self, tmp_path: Path, process_dir: Path):
+        path = process_dir / "PROCESS.yml"
+        path.write_text(
+            PROCESS.replace("on_return: {done: end}", "on_return: {true: end, false: end}"),
+            encoding="utf-8",
+        )
+        cache_dir = tmp_path / "cache"
+
+        cold = ProcessLoader(cache_dir).load(path)
+
+        assert not any(ProcessCache(cache_dir).directory.glob("*.json"))
+        assert ProcessLoader(cache_dir).load(path) == cold
+
+    def test_warm_flow_analysis_matches_cold(self, tmp_path: Path, process_dir: Path):
+        (process_dir / "PROCESS.yml").write_text(
+            PROCESS.replace("on_return: {done: end}", "on_return: {true: end, false: end}"),
+            encoding="utf-8",
+        )
+        (process_dir / "sub" / "PROCESS.yml").write_text(
+            SUB.replace("return_status: done", "return_status: true"), encoding="utf-8"
+        )
+        cache_dir = tmp_path / "cache"
+
+        def analyze() -> list[str]:
+            loader = ProcessLoader(cache_dir)
+            report = analyze_flow("PROCESS.yml", lambda key: loader.document(process_dir / key))
+            return report.errors
+
+        cold = analyze()
+        warm = analyze()
+
+        assert cold == warm == []
+
+    def test_loader_without_cache_writes_nothing(self, tmp_path: Path, process_dir: Path):
+        ProcessLoader().load(process_dir / "PROCESS.yml")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["process"]
+
+    def test_missing_file_raises_error(self, tmp_path: Path):
+        with pytest.raises(ProcessFileError):
+            ProcessLoader(tmp_path / "cache").load(tmp_path / "PROCESS.yml")
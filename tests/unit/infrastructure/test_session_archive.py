@@ -0,0 +1,135 @@
+"""
+TDD Unit Tests for the packed session archive.
+
+Tests cover:
+- SessionArchive append/read via offset index
+- Torn index lines and index reload
+- SessionRepository.compact moving COMPLETED sessions into the archive
+- Transparent load, update and reindex of archived sessions
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.states import SessionState
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_archive import SessionArchive
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.sqlite_session_repository import SqliteSessionRepository
+
+
+def completed_session(repo: SessionRepository, steps: list[str]) -> str:
+    session = repo.create(ProcessDefinition(name="test"))
+    for step in steps:
+        session.add_step(step)
+    session.mark_completed()
+    repo.update(session)
+    return session.id
+
+
+class TestSessionArchive:
+    """Tests for the pack + offset index."""
+
+    def test_append_and_read(self, tmp_path: Path):
+        archive = SessionArchive(tmp_path)
+
+        archive.append([("a", "json", b'{"id":"a"}', 1.0), ("b", "yaml", b"id: b\n", 2.0)])
+
+        assert archive.read("a") == ("json", b'{"id":"a"}')
+        assert archive.read("b") == ("yaml", b"id: b\n")
+        assert archive.read("c") is None
+
+    def test_later_entry_wins(self, tmp_path: Path):
+        archive = SessionArchive(tmp_path)
+        archive.append([("a", "json", b"old", 1.0)])
+        archive.append([("a", "json", b"new", 2.0)])
+
+        assert archive.read("a") == ("json", b"new")
+
+    def test_torn_index_line_is_ignored(self, tmp_path: Path):
+        archive = SessionArchive(tmp_path)
+        archive.append([("a", "json", b"data", 1.0)])
+        with archive.index_path.open("a", encoding="utf-8") as fp:
+            fp.write("b\t4\t")
+
+        assert list(archive.entries()) == ["a"]
+
+    def test_sees_appends_from_other_instances(self, tmp_path: Path):
+        reader = SessionArchive(tmp_path)
+        assert reader.read("a") is None
+
+        SessionArchive(tmp_path).append([("a", "json", b"data", 1.0)])
+
+        assert reader.read("a") == ("json", b"data")
+
+
+class TestRepositoryCompact:
+    """Tests for SessionRepository.compact()."""
+
+    def test_compact_moves_only_completed_sessions(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        done = completed_session(repo, ["a", "b"])
+        running = repo.create(ProcessDefinition(name="test")).id
+
+        assert repo.compact() == 1
+
+        assert not (repo.base_dir / f"{done}.yml").exists()
+        assert (repo.base_dir / f"{running}.yml").exists()
+        loaded = repo.load(done)
+        assert loaded.history == ["a", "b"]
+        assert loaded.state == SessionState.COMPLETED
+
+    def test_compact_is_idempotent(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        completed_session(repo, [])
+        repo.compact()
+
+        assert repo.compact() == 0
+
+    def test_compact_respects_cutoff(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        completed_session(repo, [])
+
+        assert repo.compact(before=datetime.now() - timedelta(days=1)) == 0
+        assert repo.compact(before=datetime.now() + timedelta(seconds=1)) == 1
+
+    def test_archived_sessions_are_listed_and_reindexed(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        done = completed_session(repo, [])
+        repo.compact()
+
+        assert repo.reindex() == 1
+        assert [s.id for s in repo.query(state=SessionState.COMPLETED)] == [done]
+
+    def test_update_after_compact_writes_loose_file(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        done = completed_session(repo, ["a"])
+        repo.compact()
+
+        session = repo.load(done)
+        session.reset_to("a")
+        repo.update(session)
+
+        assert (repo.base_dir / f"{done}.yml").exists()
+        assert SessionRepository(tmp_path / "sessions").load(done).state == SessionState.RUNNING
+
+    def test_journal_session_is_archived_with_replayed_state(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        done = completed_session(repo, ["a", "b"])
+
+        repo.compact()
+
+        assert not list(repo.base_dir.glob(f"{done}.*"))
+        loaded = JournalSessionRepository(tmp_path / "sessions").load(done)
+        assert loaded.history == ["a", "b"]
+
+    def test_sqlite_compact_raises_error(self, tmp_path: Path):
+        repo = SqliteSessionRepository(tmp_path / "sessions")
+
+        with pytest.raises(StorageConfigError):
+            repo.compact()
+        repo.close()
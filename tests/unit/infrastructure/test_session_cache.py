@@ -0,0 +1,218 @@
+"""
+TDD Unit Tests for the write-through session cache (SessionCache).
+
+Tests cover:
+- Cache hits skip the storage read
+- Write-through: a load after update is served from the cache
+- Returned sessions are independent copies
+- External writes (another repository instance) invalidate the entry
+- Version conflicts are still detected with a warm cache
+- LRU bound and eviction
+- Journal and SQLite backends
+- cache_size from config, disabled by default
+"""
+
+from pathlib import Path
+
+import pytest
+
+from symforge.domain.exceptions import SessionConflictError, StorageConfigError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.session import Session
+from symforge.domain.states import SessionState
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_cache import SessionCache
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.sqlite_session_repository import SqliteSessionRepository
+from symforge.infrastructure.storage import (
+    StorageConfig,
+    create_session_repository,
+    load_storage_config,
+)
+
+
+def count_reads(repo: SessionRepository, monkeypatch) -> list[str]:
+    reads: list[str] = []
+    original = repo._read
+
+    def tracking(session_id):
+        reads.append(session_id)
+        return original(session_id)
+
+    monkeypatch.setattr(repo, "_read", tracking)
+    return reads
+
+
+BACKENDS = [
+    lambda base: SessionRepository(base, cache_size=8),
+    lambda base: JournalSessionRepository(base, cache_size=8),
+    lambda base: SqliteSessionRepository(base, cache_size=8),
+]
+
+
+class TestCacheHits:
+    """Tests for reads served from the cache."""
+
+    def test_repeated_load_reads_once(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions", cache_size=8)
+        session = repo.create(ProcessDefinition(name="demo"))
+        repo.cache.clear()
+        reads = count_reads(repo, monkeypatch)
+
+        repo.load(session.id)
+        repo.load(session.id)
+        repo.load_lazy(session.id)
+
+        assert reads == [session.id]
+
+    def test_load_after_update_is_served_from_cache(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions", cache_size=8)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+        reads = count_reads(repo, monkeypatch)
+
+        loaded = repo.load(session.id)
+
+        assert reads == []
+        assert loaded.history == ["a"]
+        assert loaded.version == session.version
+
+    def test_returned_sessions_are_copies(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", cache_size=8)
+        session = repo.create(ProcessDefinition(name="demo"))
+
+        first = repo.load(session.id)
+        first.add_step("local")
+        first.required_artifacts.append("x.md")
+        session.add_step("also-local")
+
+        second = repo.load(session.id)
+        assert second.history == []
+        assert second.required_artifacts == []
+
+    def test_disabled_by_default(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+        reads = count_reads(repo, monkeypatch)
+
+        repo.load(session.id)
+        repo.load(session.id)
+
+        assert repo.cache is None
+        assert reads == [session.id, session.id]
+
+
+class TestCacheInvalidation:
+    """Tests for external modifications."""
+
+    @pytest.mark.parametrize("make_repo", BACKENDS)
+    def test_external_update_is_visible(self, tmp_path: Path, make_repo):
+        repo = make_repo(tmp_path / "sessions")
+        other = make_repo(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+        repo.load(session.id)
+
+        external = other.load(session.id)
+        external.add_step("elsewhere")
+        other.update(external)
+
+        loaded = repo.load(session.id)
+        assert loaded.history == ["elsewhere"]
+        assert loaded.version == external.version
+
+    @pytest.mark.parametrize("make_repo", BACKENDS)
+    def test_conflict_detected_with_warm_cache(self, tmp_path: Path, make_repo):
+        repo = make_repo(tmp_path / "sessions")
+        other = make_repo(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+        stale = repo.load(session.id)
+
+        external = other.load(session.id)
+        external.mark_paused()
+        other.update(external)
+
+        stale.add_step("late")
+        with pytest.raises(SessionConflictError):
+            repo.update(stale)
+
+    def test_purge_discards_entry(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", cache_size=8)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.mark_paused()
+        repo.update(session)
+
+        repo.purge([session.id])
+
+        assert len(repo.cache) == 0
+        with pytest.raises(FileNotFoundError):
+            repo.load(session.id)
+
+
+class TestSessionCache:
+    """Tests for the LRU structure."""
+
+    def test_evicts_least_recently_used(self):
+        cache = SessionCache(2)
+        sessions = [Session(id=f"s{i}", process_name="demo") for i in range(3)]
+        cache.put(sessions[0], 1)
+        cache.put(sessions[1], 1)
+        cache.get(sessions[0].id, 1)
+
+        cache.put(sessions[2], 1)
+
+        assert len(cache) == 2
+        assert cache.get(sessions[1].id, 1) is None
+        assert cache.get(sessions[0].id, 1) is not None
+
+    def test_stamp_mismatch_drops_entry(self):
+        cache = SessionCache(2)
+        session = Session(id="s1", process_name="demo")
+        cache.put(session, ("a",))
+
+        assert cache.get(session.id, ("b",)) is None
+        assert len(cache) == 0
+
+    def test_put_without_stamp_discards(self):
+        cache = SessionCache(2)
+        session = Session(id="s1", process_name="demo")
+        cache.put(session, 1)
+
+        cache.put(session, None)
+
+        assert len(cache) == 0
+
+
+class TestCacheConfig:
+    """Tests for the cache_size setting."""
+
+    def test_cache_size_from_config(self, tmp_path: Path):
+        config_dir = tmp_path / ".symforge"
+        config_dir.mkdir()
+        (config_dir / "config.yml").write_text("sessions:\n  cache_size: 32\n", encoding="utf-8")
+
+        config = load_storage_config(tmp_path)
+        repo = create_session_repository(tmp_path / "sessions", config)
+
+        assert config.cache_size == 32
+        assert repo.cache is not None and repo.cache.max_size == 32
+
+    @pytest.mark.parametrize("backend", ["journal", "sqlite"])
+    def test_cache_size_passed_to_backends(self, tmp_path: Path, backend: str):
+        repo = create_session_repository(
+            tmp_path / "sessions", StorageConfig(backend=backend, cache_size=4)
+        )
+
+        assert repo.cache is not None
+
+    def test_negative_cache_size_raises_error(self, tmp_path: Path):
+        with pytest.raises(StorageConfigError):
+            create_session_repository(tmp_path / "sessions", StorageConfig(cache_size=-1))
+
+    def test_state_survives_cache_roundtrip(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", cache_size=8)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.mark_paused()
+        repo.update(session)
+
+        assert repo.load(session.id).state == SessionState.PAUSED
@@ -0,0 +1,167 @@
+"""
+TDD Unit Tests for SessionCatalog and catalog-backed queries.
+
+Tests cover:
+- Catalog updated on every save
+- query() by state, process and update time without opening session files
+- reindex() rebuilding the catalog from session files
+- Compaction, torn lines and field escaping
+- Compaction keeps lines appended concurrently (re-read under the catalog lock)
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.session import Session
+from symforge.domain.states import SessionState
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_catalog import SessionCatalog
+from symforge.infrastructure.session_repository import SessionRepository
+
+
+class TestCatalogMaintenance:
+    """Tests for catalog updates on save."""
+
+    def test_save_appends_catalog_entry(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        lines = repo.catalog.path.read_text(encoding="utf-8").splitlines()
+        assert lines[-1].split("\t")[0] == session.id
+
+    def test_latest_entry_wins(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+
+        session.mark_paused()
+        repo.update(session)
+
+        summaries = repo.query()
+        assert len(summaries) == 1
+        assert summaries[0].state == SessionState.PAUSED
+
+    def test_removed_entries_are_hidden(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+
+        repo.catalog.remove(session.id)
+
+        assert repo.query() == []
+
+
+class TestCatalogQuery:
+    """Tests for catalog queries."""
+
+    def test_query_by_state_and_process(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        a = repo.create(ProcessDefinition(name="a"))
+        a.mark_awaiting_decision()
+        repo.update(a)
+        repo.create(ProcessDefinition(name="a"))
+        repo.create(ProcessDefinition(name="b"))
+
+        found = repo.query(state=SessionState.AWAITING_DECISION, process_name="a")
+
+        assert [s.id for s in found] == [a.id]
+
+    def test_query_does_not_open_session_files(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        (repo.base_dir / f"{session.id}.yml").write_text(": not yaml", encoding="utf-8")
+
+        assert [s.id for s in repo.query()] == [session.id]
+
+    def test_query_since(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        repo.create(ProcessDefinition(name="test"))
+
+        assert repo.query(since=datetime.now() + timedelta(minutes=1)) == []
+        assert len(repo.query(since=datetime.now() - timedelta(minutes=1))) == 1
+
+    def test_find_loads_full_sessions(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+
+        assert repo.find()[0].history == ["step1"]
+
+
+class TestCatalogReindex:
+    """Tests for rebuilding the catalog from files."""
+
+    def test_reindex_restores_deleted_catalog(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        ids = {repo.create(ProcessDefinition(name="test")).id for _ in range(3)}
+        repo.catalog.path.unlink()
+
+        count = repo.reindex()
+
+        assert count == 3
+        assert {s.id for s in repo.query()} == ids
+
+    def test_reindex_replays_journal_sessions(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.mark_paused()
+        repo.update(session)
+        repo.catalog.path.unlink()
+
+        repo.reindex()
+
+        assert repo.query()[0].state == SessionState.PAUSED
+
+
+class TestCatalogCompaction:
+    """Tests for catalog file housekeeping."""
+
+    def test_compacts_obsolete_lines(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(SessionCatalog, "COMPACT_MIN_LINES", 5)
+        catalog = SessionCatalog(tmp_path)
+        session = Session(id="abc", process_name="demo")
+        for i in range(10):
+            catalog.record(session, float(i))
+
+        catalog.query()
+
+        assert len(catalog.path.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_compaction_keeps_concurrent_append(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(SessionCatalog, "COMPACT_MIN_LINES", 5)
+        catalog = SessionCatalog(tmp_path)
+        session = Session(id="abc", process_name="demo")
+        for i in range(10):
+            catalog.record(session, float(i))
+        original = catalog._read_lines
+        calls = []
+
+        def read_then_append() -> list[str]:
+            lines = original()
+            if not calls:
+                # Outro processo acrescenta uma sessão logo após a primeira leitura.
+                SessionCatalog(tmp_path).record(Session(id="new", process_name="demo"), 20.0)
+            calls.append(len(lines))
+            return lines
+
+        monkeypatch.setattr(catalog, "_read_lines", read_then_append)
+        catalog.query()
+
+        assert [s.id for s in SessionCatalog(tmp_path).query()] == ["abc", "new"]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_ignores_torn_lines(self, tmp_path: Path):
+        catalog = SessionCatalog(tmp_path)
+        catalog.record(Session(id="abc", process_name="demo"), 1.0)
+        with catalog.path.open("a", encoding="utf-8") as fp:
+            fp.write("x\tRUNNING\t2.0")
+
+        assert [s.id for s in catalog.query()] == ["abc"]
+
+    def test_process_names_with_separators_roundtrip(self, tmp_path: Path):
+        catalog = SessionCatalog(tmp_path)
+        name = "proc\tcom\\barra\ne acentuação"
+        catalog.record(Session(id="abc", process_name=name), 1.0)
+
+        assert catalog.query(process_name=name)[0].process_name == name
@@ -0,0 +1,149 @@
+"""
+TDD Unit Tests for session serialization formats.
+
+Tests cover:
+- YAML (libyaml when available), JSON and msgpack codecs
+- Format auto-detection on load
+- Migration between formats
+- Header-only decoding (keys before `history`)
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_formats import FORMATS, get_format
+from symforge.infrastructure.session_repository import SessionRepository
+
+SAMPLE = {"id": "abc", "history": ["passo_com_acentuação", "decision:ok"], "pending_decision": False}
+
+
+class TestCodecs:
+    """Tests for format codecs."""
+
+    @pytest.mark.parametrize("name", ["yaml", "json"])
+    def test_roundtrip(self, name: str):
+        fmt = get_format(name)
+
+        assert fmt.load(fmt.dump(SAMPLE)) == SAMPLE
+
+    def test_msgpack_roundtrip(self):
+        pytest.importorskip("msgpack")
+        fmt = get_format("msgpack")
+
+        assert fmt.load(fmt.dump(SAMPLE)) == SAMPLE
+
+    def test_unknown_format_raises_error(self):
+        with pytest.raises(StorageConfigError):
+            get_format("xml")
+
+
+HEADER_FIRST = {"id": "abc", "state": "RUNNING", "history": ["a"] * 1000}
+
+
+class TestHeaderDecoding:
+    """Tests for SessionFormat.load_header."""
+
+    @pytest.mark.parametrize("name", ["yaml", "json"])
+    def test_header_stops_before_history(self, name: str):
+        fmt = get_format(name)
+
+        header = fmt.load_header(io.BytesIO(fmt.dump(HEADER_FIRST)))
+
+        assert header == {"id": "abc", "state": "RUNNING"}
+
+    def test_msgpack_header(self):
+        pytest.importorskip("msgpack")
+        fmt = get_format("msgpack")
+
+        assert fmt.load_header(io.BytesIO(fmt.dump(HEADER_FIRST))) == {
+            "id": "abc",
+            "state": "RUNNING",
+        }
+
+    def test_json_header_ignores_marker_inside_strings(self):
+        fmt = get_format("json")
+        data = {"id": ',"history":', "history": []}
+
+        assert fmt.load_header(io.BytesIO(fmt.dump(data))) == {"id": ',"history":'}
+
+    def test_yaml_header_of_legacy_sorted_document_is_partial(self):
+        fmt = get_format("yaml")
+        legacy = yaml.dump({"history": ["a"], "id": "abc"}).encode("utf-8")
+
+        assert "id" not in fmt.load_header(io.BytesIO(legacy))
+
+
+class TestRepositoryFormats:
+    """Tests for repositories writing/reading each format."""
+
+    def test_json_repository_writes_json_file(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", session_format="json")
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        data = json.loads((repo.base_dir / f"{session.id}.json").read_text(encoding="utf-8"))
+        assert data["id"] == session.id
+        assert not (repo.base_dir / f"{session.id}.yml").exists()
+
+    def test_load_detects_other_format(self, tmp_path: Path):
+        yaml_repo = SessionRepository(tmp_path / "sessions")
+        session = yaml_repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        yaml_repo.update(session)
+
+        loaded = SessionRepository(tmp_path / "sessions", session_format="json").load(session.id)
+
+        assert loaded.history == ["step1"]
+
+    def test_save_replaces_file_in_old_format(self, tmp_path: Path):
+        session = SessionRepository(tmp_path / "sessions").create(ProcessDefinition(name="test"))
+        json_repo = SessionRepository(tmp_path / "sessions", session_format="json")
+
+        loaded = json_repo.load(session.id)
+        json_repo.update(loaded)
+
+        assert (json_repo.base_dir / f"{session.id}.json").exists()
+        assert not (json_repo.base_dir / f"{session.id}.yml").exists()
+
+    def test_journal_snapshot_uses_configured_format(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions", session_format="json")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+
+        assert (repo.base_dir / f"{session.id}.json").exists()
+        assert repo.load(session.id).history == ["step1"]
+
+
+class TestMigrate:
+    """Tests for converting existing stores."""
+
+    def test_migrate_converts_all_sessions(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        ids = [repo.create(ProcessDefinition(name="test")).id for _ in range(3)]
+
+        migrated = repo.migrate("json")
+
+        assert migrated == 3
+        for session_id in ids:
+            assert (repo.base_dir / f"{session_id}.json").exists()
+            assert not (repo.base_dir / f"{session_id}.yml").exists()
+            assert repo.load(session_id).id == session_id
+
+    def test_migrate_is_idempotent(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", session_format="json")
+        repo.create(ProcessDefinition(name="test"))
+
+        assert repo.migrate("json") == 0
+
+    def test_all_formats_have_distinct_extensions(self):
+        extensions = [fmt.extension for fmt in FORMATS.values()]
+
+        assert len(extensions) == len(set(extensions))
@@ -0,0 +1,139 @@
+"""
+TDD Unit Tests for the sharded session directory layout.
+
+Tests cover:
+- Sharded writes under two-level hash prefix directories
+- Transparent reads across flat and sharded layouts
+- Layout migration (including journal files)
+- Auto-commit of sharded session files
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from symforge.domain.exceptions import StorageConfigError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.infrastructure.journal_session_repository import JournalSessionRepository
+from symforge.infrastructure.session_repository import SessionRepository
+
+
+def shard_files(base_dir: Path) -> list[Path]:
+    return sorted(p for p in base_dir.glob("??/??/*") if p.is_file())
+
+
+class TestShardedLayout:
+    """Tests for reading and writing the sharded layout."""
+
+    def test_create_writes_into_shard_directory(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", layout="sharded")
+
+        session = repo.create(ProcessDefinition(name="test"))
+
+        files = shard_files(repo.base_dir)
+        assert [p.name for p in files] == [f"{session.id}.yml"]
+        assert not (repo.base_dir / f"{session.id}.yml").exists()
+
+    def test_roundtrip_and_listing(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", layout="sharded")
+        ids = sorted(repo.create(ProcessDefinition(name="test")).id for _ in range(5))
+
+        assert repo._session_ids() == ids
+        assert repo.reindex() == 5
+        assert all(repo.load(session_id).id == session_id for session_id in ids)
+
+    def test_reads_flat_session_and_moves_it_on_save(self, tmp_path: Path):
+        flat = SessionRepository(tmp_path / "sessions")
+        session = flat.create(ProcessDefinition(name="test"))
+        sharded = SessionRepository(tmp_path / "sessions", layout="sharded")
+
+        loaded = sharded.load(session.id)
+        loaded.add_step("step1")
+        sharded.update(loaded)
+
+        assert not (flat.base_dir / f"{session.id}.yml").exists()
+        assert [p.name for p in shard_files(flat.base_dir)] == [f"{session.id}.yml"]
+        assert flat.load(session.id).history == ["step1"]
+
+    def test_unknown_layout_raises_error(self, tmp_path: Path):
+        with pytest.raises(StorageConfigError):
+            SessionRepository(tmp_path / "sessions", layout="nested")
+
+
+class TestLayoutMigration:
+    """Tests for migrate(layout=...)."""
+
+    def test_migrate_to_sharded_and_back(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        ids = [repo.create(ProcessDefinition(name="test")).id for _ in range(3)]
+
+        assert repo.migrate(layout="sharded") == 3
+        assert len(shard_files(repo.base_dir)) == 3
+        assert repo.migrate(layout="sharded") == 0
+
+        assert repo.migrate(layout="flat") == 3
+        assert shard_files(repo.base_dir) == []
+        assert all((repo.base_dir / f"{i}.yml").exists() for i in ids)
+
+    def test_migrate_layout_keeps_format(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions", session_format="json")
+        repo.create(ProcessDefinition(name="test"))
+
+        repo.migrate(layout="sharded")
+
+        assert [p.suffix for p in shard_files(repo.base_dir)] == [".json"]
+
+    def test_migrate_moves_journal(self, tmp_path: Path):
+        repo = JournalSessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+
+        repo.migrate(layout="sharded")
+
+        assert sorted(p.suffix for p in shard_files(repo.base_dir)) == [".journal", ".yml"]
+        sharded = JournalSessionRepository(tmp_path / "sessions", layout="sharded")
+        assert sharded.load(session.id).history == ["step1"]
+
+    def test_journal_switches_layout_on_next_save(self, tmp_path: Path):
+        flat = JournalSessionRepository(tmp_path / "sessions")
+        session = flat.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        flat.update(session)
+
+        sharded = JournalSessionRepository(tmp_path / "sessions", layout="sharded")
+        loaded = sharded.load(session.id)
+        loaded.add_step("step2")
+        sharded.update(loaded)
+
+        assert not list(flat.base_dir.glob(f"{session.id}.*"))
+        reader = JournalSessionRepository(tmp_path / "sessions", layout="sharded")
+        assert reader.load(session.id).history == ["step1", "step2"]
+
+
+class TestShardedAutoCommit:
+    """Tests for auto-commit with nested shard directories."""
+
+    def test_commit_includes_shard_file_and_legacy_removal(self, tmp_path: Path):
+        for args in (
+            ["init"],
+            ["config", "user.email", "test@test.com"],
+            ["config", "user.name", "Test User"],
+        ):
+            subprocess.run(["git", *args], cwd=tmp_path, capture_output=True, check=True)
+        sessions_dir = tmp_path / ".symforge" / "sessions"
+        session = SessionRepository(sessions_dir, auto_commit=True).create(
+            ProcessDefinition(name="test")
+        )
+
+        sharded = SessionRepository(sessions_dir, auto_commit=True, layout="sharded")
+        sharded.update(sharded.load(session.id))
+
+        tracked = subprocess.run(
+            ["git", "ls-files"], cwd=tmp_path, capture_output=True, text=True
+        ).stdout.splitlines()
+        assert len(tracked) == 1
+        assert tracked[0].startswith(".symforge/sessions/")
+        assert tracked[0].endswith(f"/{session.id}.yml")
+        assert tracked[0] != f".symforge/sessions/{session.id}.yml"
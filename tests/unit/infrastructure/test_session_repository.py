@@ -7,14 +7,23 @@ Tests cover:
 - State serialization/deserialization
 - History and artifacts persistence
 - Edge cases (file not found, corrupted data)
+- Optimistic concurrency (version compare-and-swap, version read from the header)
+- Exclusive create (id collisions never overwrite) and created-since queries
+- Typed history events (compact records, legacy string documents)
+- Generated .gitignore keeps local files (locks, catalog) out of `git status`
 """
 
+import subprocess
+
 import pytest
 import yaml
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from symforge.domain.exceptions import SessionConflictError
 from symforge.domain.process_definition import ProcessDefinition
 from symforge.domain.states import SessionState
+from symforge.infrastructure import session_repository
 from symforge.infrastructure.session_repository import SessionRepository
 
 
@@ -36,6 +45,32 @@ class TestSessionRepositoryCreation:
 
         assert sessions_dir.exists()
 
+    def test_local_files_are_ignored_by_git(self, tmp_path: Path):
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        repo = SessionRepository(tmp_path / ".symforge" / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        repo.update(session)
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=all"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert status.splitlines() == [f"?? .symforge/sessions/{session.id}.yml"]
+
+    def test_outdated_gitignore_is_rewritten(self, tmp_path: Path):
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        (sessions_dir / ".gitignore").write_text("antigo\n", encoding="utf-8")
+
+        SessionRepository(sessions_dir)
+
+        patterns = (sessions_dir / ".gitignore").read_text(encoding="utf-8").splitlines()
+        assert ".locks/" in patterns
+        assert "antigo" not in patterns
+
 
 class TestSessionCreate:
     """Tests for session creation."""
@@ -47,7 +82,7 @@ class TestSessionCreate:
         session = repo.create(process)
 
         assert session.id is not None
-        assert len(session.id) == 8  # hex[:8]
+        assert len(session.id) == 26  # ULID (ordenável por tempo)
 
     def test_create_sets_process_name(self, tmp_path: Path):
         repo = SessionRepository(tmp_path / "sessions")
@@ -135,6 +170,43 @@ class TestSessionUpdate:
         loaded = repo.load(session.id)
         assert "decision:approved" in loaded.history
 
+    def test_update_persists_event_metadata(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+
+        session.mark_awaiting_decision()
+        session.register_decision("approved", actor="alice")
+        repo.update(session)
+
+        loaded = repo.load(session.id)
+        assert loaded.history == session.history
+        assert loaded.decisions()[0].actor == "alice"
+
+    def test_history_is_stored_as_compact_records(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("step1")
+        repo.update(session)
+
+        data = yaml.safe_load((repo.base_dir / f"{session.id}.yml").read_text(encoding="utf-8"))
+        code, value, timestamp = data["history"][0]
+        assert (code, value) == ("s", "step1")
+        assert timestamp == session.history[0].timestamp
+
+    def test_legacy_string_history_is_readable(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        path = repo.base_dir / f"{session.id}.yml"
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data["history"] = ["step1", "decision:approved"]
+        path.write_text(yaml.dump(data), encoding="utf-8")
+
+        loaded = repo.load(session.id)
+
+        assert loaded.steps() == ["step1"]
+        assert [d.value for d in loaded.decisions()] == ["approved"]
+        assert loaded.decisions()[0].timestamp is None
+
     def test_update_persists_missing_artifacts(self, tmp_path: Path):
         sessions_dir = tmp_path / "sessions"
         repo = SessionRepository(sessions_dir)
@@ -314,3 +386,110 @@ class TestSessionRepositoryEdgeCases:
         assert loaded2.history == ["step_b"]
         assert loaded1.process_name == "process_a"
         assert loaded2.process_name == "process_b"
+
+
+class TestSessionVersioning:
+    """Tests for compare-and-swap updates."""
+
+    def test_update_increments_version(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        assert session.version == 0
+
+        repo.update(session)
+        repo.update(session)
+
+        assert session.version == 2
+        assert repo.load(session.id).version == 2
+
+    def test_stale_update_raises_conflict(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        first = repo.load(session.id)
+        second = repo.load(session.id)
+
+        first.add_step("a")
+        repo.update(first)
+        second.add_step("b")
+        with pytest.raises(SessionConflictError) as exc:
+            repo.update(second)
+
+        assert exc.value.expected_version == 0
+        assert exc.value.actual_version == 1
+        assert second.version == 0
+        assert repo.load(session.id).history == ["a"]
+
+    @pytest.mark.parametrize("session_format", ["yaml", "json"])
+    def test_version_check_reads_only_header(
+        self, tmp_path: Path, session_format: str, monkeypatch
+    ):
+        repo = SessionRepository(tmp_path / "sessions", session_format=session_format)
+        session = repo.create(ProcessDefinition(name="test"))
+        session.add_step("a")
+        repo.update(session)
+        reads: list[str] = []
+        monkeypatch.setattr(repo, "_read", lambda session_id: reads.append(session_id))
+
+        session.add_step("b")
+        repo.update(session)
+
+        assert reads == []
+        assert SessionRepository(tmp_path / "sessions").load(session.id).version == 2
+
+    def test_legacy_document_without_version(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="test"))
+        path = repo.base_dir / f"{session.id}.yml"
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        del data["version"]
+        path.write_text(yaml.dump(data), encoding="utf-8")
+
+        loaded = repo.load(session.id)
+        repo.update(loaded)
+
+        assert repo.load(session.id).version == 1
+
+
+class TestSessionIds:
+    """Tests for time-ordered ids and exclusive create."""
+
+    def test_ids_sort_by_creation_order(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+
+        ids = [repo.create(ProcessDefinition(name="test")).id for _ in range(20)]
+
+        assert ids == sorted(ids)
+
+    def test_colliding_id_is_regenerated(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        existing = repo.create(ProcessDefinition(name="original"))
+        ids = iter([existing.id, "01jzzzzzzzzzzzzzzzzzzzzzzz"])
+        monkeypatch.setattr(session_repository, "new_session_id", lambda: next(ids))
+
+        created = repo.create(ProcessDefinition(name="other"))
+
+        assert created.id == "01jzzzzzzzzzzzzzzzzzzzzzzz"
+        assert repo.load(existing.id).process_name == "original"
+
+    def test_collision_with_other_format_is_detected(self, tmp_path: Path, monkeypatch):
+        existing = SessionRepository(tmp_path / "sessions", session_format="json").create(
+            ProcessDefinition(name="original")
+        )
+        repo = SessionRepository(tmp_path / "sessions")
+        monkeypatch.setattr(session_repository, "new_session_id", lambda: existing.id)
+
+        with pytest.raises(FileExistsError):
+            repo.create(ProcessDefinition(name="other"))
+        assert repo.load(existing.id).process_name == "original"
+
+    def test_query_created_since(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        old = repo.create(ProcessDefinition(name="test"))
+        cutoff = datetime.now() + timedelta(seconds=1)
+        future = iter(["zzzzzzzzzzzzzzzzzzzzzzzzzz"])
+        monkeypatch.setattr(session_repository, "new_session_id", lambda: next(future))
+        new = repo.create(ProcessDefinition(name="test"))
+
+        assert [s.id for s in repo.query(created_since=cutoff)] == [new.id]
+        assert {s.id for s in repo.query()} == {old.id, new.id}
+
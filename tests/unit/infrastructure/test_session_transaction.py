@@ -0,0 +1,180 @@
+"""
+TDD Unit Tests for the session unit of work (SessionRepository.transaction).
+
+Tests cover:
+- Each registered session is written exactly once at commit
+- Sessions created inside a transaction
+- Version conflicts abort the whole transaction before any write
+- Exceptions inside the block discard pending sessions
+- Single auto-commit for multi-session transactions
+- Journal and SQLite backends
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import SessionConflictError
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.states import SessionState
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.storage import StorageConfig, create_session_repository
+
+
+def count_writes(repo: SessionRepository, monkeypatch) -> list[str]:
+    writes: list[str] = []
+    original = repo._write
+
+    def tracking(session, exclusive=False):
+        writes.append(session.id)
+        return original(session, exclusive)
+
+    monkeypatch.setattr(repo, "_write", tracking)
+    return writes
+
+
+def commit_count(path: Path) -> int:
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD"], cwd=path, capture_output=True, text=True
+    )
+    return int(result.stdout.strip()) if result.returncode == 0 else 0
+
+
+class TestTransactionWrites:
+    """Tests for write-once semantics."""
+
+    def test_session_written_once_at_commit(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+        writes = count_writes(repo, monkeypatch)
+
+        with repo.transaction() as tx:
+            session.add_step("a")
+            tx.update(session)
+            session.mark_paused()
+            tx.update(session)
+            assert writes == []
+
+        assert writes == [session.id]
+        loaded = repo.load(session.id)
+        assert loaded.version == 1
+        assert loaded.state == SessionState.PAUSED
+        assert loaded.history == ["a"]
+
+    def test_create_inside_transaction(self, tmp_path: Path, monkeypatch):
+        repo = SessionRepository(tmp_path / "sessions")
+        writes = count_writes(repo, monkeypatch)
+
+        with repo.transaction() as tx:
+            session = tx.create(ProcessDefinition(name="demo"), missing=["doc.md"])
+            session.add_step("a")
+            tx.update(session)
+
+        assert writes == [session.id]
+        loaded = repo.load(session.id)
+        assert loaded.version == 0
+        assert loaded.state == SessionState.AWAITING_INPUT
+        assert loaded.history == ["a"]
+
+    def test_multiple_sessions(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        sessions = [repo.create(ProcessDefinition(name="demo")) for _ in range(3)]
+
+        with repo.transaction() as tx:
+            for session in sessions:
+                session.mark_paused()
+                tx.update(session)
+
+        assert {s.state for s in repo.query()} == {SessionState.PAUSED}
+
+
+class TestTransactionAtomicity:
+    """Tests for conflict and rollback behavior."""
+
+    def test_conflict_writes_nothing(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        a = repo.create(ProcessDefinition(name="demo"))
+        b = repo.create(ProcessDefinition(name="demo"))
+        stale = repo.load(b.id)
+        repo.update(repo.load(b.id))
+
+        with pytest.raises(SessionConflictError):
+            with repo.transaction() as tx:
+                a.mark_paused()
+                tx.update(a)
+                stale.mark_paused()
+                tx.update(stale)
+
+        assert repo.load(a.id).state == SessionState.RUNNING
+        assert a.version == 0
+
+    def test_exception_in_block_discards(self, tmp_path: Path):
+        repo = SessionRepository(tmp_path / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+
+        with pytest.raises(RuntimeError):
+            with repo.transaction() as tx:
+                session.mark_paused()
+                tx.update(session)
+                new = tx.create(ProcessDefinition(name="demo"))
+                raise RuntimeError("boom")
+
+        assert repo.load(session.id).state == SessionState.RUNNING
+        assert [s.id for s in repo.query()] == [session.id]
+        assert new.id not in {s.id for s in repo.query()}
+
+
+class TestTransactionAutoCommit:
+    """Tests for a single git commit per transaction."""
+
+    def test_single_commit_for_batch(self, tmp_path: Path):
+        for args in (["init"], ["config", "user.email", "t@t"], ["config", "user.name", "T"]):
+            subprocess.run(["git", *args], cwd=tmp_path, capture_output=True, check=True)
+        repo = SessionRepository(tmp_path / "sessions", auto_commit=True)
+        sessions = [repo.create(ProcessDefinition(name="demo")) for _ in range(3)]
+        before = commit_count(tmp_path)
+
+        with repo.transaction() as tx:
+            for session in sessions:
+                session.add_step("a")
+                tx.update(session)
+
+        assert commit_count(tmp_path) == before + 1
+        head = repo.step_commit(sessions[0], 0)
+        assert head is not None
+        assert all(repo.step_commit(s, 0) == head for s in sessions)
+
+
+class TestTransactionBackends:
+    """Tests for alternative backends."""
+
+    @pytest.mark.parametrize("backend", ["journal", "sqlite"])
+    def test_transaction_persists(self, tmp_path: Path, backend: str):
+        repo = create_session_repository(tmp_path / "sessions", StorageConfig(backend=backend))
+        existing = repo.create(ProcessDefinition(name="demo"))
+
+        with repo.transaction() as tx:
+            created = tx.create(ProcessDefinition(name="demo"))
+            existing.add_step("a")
+            tx.update(existing)
+
+        assert repo.load(existing.id).history == ["a"]
+        assert repo.load(created.id).version == 0
+        repo.close()
+
+
+class TestRuntimeBatch:
+    """Tests for batch use cases built on transactions."""
+
+    def test_pause_many(self, tmp_path: Path):
+        runtime = RuntimeUseCases(tmp_path / ".symforge" / "sessions")
+        ids = [runtime.start(ProcessDefinition(name="demo"), tmp_path).id for _ in range(3)]
+
+        handoffs = runtime.with_retry_many(
+            ids, lambda sessions: runtime.pause_many(sessions, tmp_path)
+        )
+
+        assert len(handoffs) == 3 and all(p.exists() for p in handoffs)
+        assert all(runtime.repo.load(i).state == SessionState.PAUSED for i in ids)
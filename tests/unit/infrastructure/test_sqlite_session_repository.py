@@ -0,0 +1,180 @@
+"""
+TDD Unit Tests for SqliteSessionRepository and storage backend selection.
+
+Tests cover:
+- create/update/load contract over a single SQLite file
+- Indexed queries by state, process and update time
+- Backend selection via .symforge/config.yml
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from symforge.domain.exceptions import (
+    SessionConflictError,
+    SessionNotFoundError,
+    StorageConfigError,
+)
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.domain.states import SessionState
+from symforge.infrastructure import session_repository
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.sqlite_session_repository import SqliteSessionRepository
+from symforge.infrastructure.storage import (
+    StorageConfig,
+    create_session_repository,
+    load_storage_config,
+)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> SqliteSessionRepository:
+    return SqliteSessionRepository(tmp_path / "sessions")
+
+
+class TestSqliteContract:
+    """Tests for the create/update/load contract."""
+
+    def test_create_persists_single_db_file(self, repo: SqliteSessionRepository):
+        session = repo.create(ProcessDefinition(name="test"))
+
+        assert repo.db_path.exists()
+        assert not (repo.base_dir / f"{session.id}.yml").exists()
+
+    def test_update_and_load_roundtrip(self, repo: SqliteSessionRepository):
+        session = repo.create(ProcessDefinition(name="test", required_artifacts=["doc.md"]))
+        session.add_step("step1")
+        session.mark_awaiting_decision()
+        session.register_decision("aprovação")
+        repo.update(session)
+
+        loaded = repo.load(session.id)
+
+        assert loaded.process_name == "test"
+        assert loaded.required_artifacts == ["doc.md"]
+        assert loaded.history == ["step1", "decision:aprovação"]
+        assert loaded.state == SessionState.RUNNING
+
+    def test_update_is_single_row_upsert(self, repo: SqliteSessionRepository):
+        session = repo.create(ProcessDefinition(name="test"))
+        for i in range(3):
+            session.add_step(f"step{i}")
+            repo.update(session)
+
+        count = sqlite3.connect(repo.db_path).execute("SELECT COUNT(*) FROM sessions").fetchone()
+        assert count[0] == 1
+
+    def test_stale_update_raises_conflict(self, repo: SqliteSessionRepository):
+        session = repo.create(ProcessDefinition(name="test"))
+        stale = repo.load(session.id)
+        repo.update(session)
+
+        with pytest.raises(SessionConflictError):
+            repo.update(stale)
+        assert repo.load(session.id).version == 1
+
+    def test_create_never_overwrites_existing_row(
+        self, repo: SqliteSessionRepository, monkeypatch
+    ):
+        existing = repo.create(ProcessDefinition(name="original"))
+        monkeypatch.setattr(session_repository, "new_session_id", lambda: existing.id)
+
+        with pytest.raises(FileExistsError):
+            repo.create(ProcessDefinition(name="other"))
+        assert repo.load(existing.id).process_name == "original"
+
+    def test_load_nonexistent_session_raises_error(self, repo: SqliteSessionRepository):
+        with pytest.raises(SessionNotFoundError):
+            repo.load("nonexistent")
+
+
+class TestSqliteFind:
+    """Tests for indexed queries."""
+
+    def test_find_by_state(self, repo: SqliteSessionRepository):
+        waiting = repo.create(ProcessDefinition(name="test"))
+        waiting.mark_awaiting_decision()
+        repo.update(waiting)
+        repo.create(ProcessDefinition(name="test"))
+
+        found = repo.find(state=SessionState.AWAITING_DECISION)
+
+        assert [s.id for s in found] == [waiting.id]
+
+    def test_find_by_process_name(self, repo: SqliteSessionRepository):
+        repo.create(ProcessDefinition(name="a"))
+        b = repo.create(ProcessDefinition(name="b"))
+
+        found = repo.find(process_name="b")
+
+        assert [s.id for s in found] == [b.id]
+
+    def test_find_since(self, repo: SqliteSessionRepository):
+        repo.create(ProcessDefinition(name="test"))
+
+        assert len(repo.find(since=datetime.now() - timedelta(minutes=1))) == 1
+        assert repo.find(since=datetime.now() + timedelta(minutes=1)) == []
+
+    def test_find_created_since_uses_id_range(self, repo: SqliteSessionRepository):
+        session = repo.create(ProcessDefinition(name="test"))
+
+        assert [s.id for s in repo.query(created_since=datetime.now() - timedelta(hours=1))] == [
+            session.id
+        ]
+        assert repo.query(created_since=datetime.now() + timedelta(hours=1)) == []
+
+    def test_queries_use_indexes(self, repo: SqliteSessionRepository):
+        plan = repo._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM sessions WHERE state = ?", ("RUNNING",)
+        ).fetchall()
+
+        assert any("idx_sessions_state" in str(row) for row in plan)
+
+
+class TestStorageSelection:
+    """Tests for backend configuration."""
+
+    def test_default_backend_is_yaml(self, tmp_path: Path):
+        repo = create_session_repository(tmp_path / "sessions")
+
+        assert type(repo) is SessionRepository
+
+    def test_sqlite_backend_from_config(self, tmp_path: Path):
+        config_dir = tmp_path / ".symforge"
+        config_dir.mkdir()
+        (config_dir / "config.yml").write_text("sessions:\n  backend: sqlite\n", encoding="utf-8")
+
+        config = load_storage_config(tmp_path)
+        repo = create_session_repository(tmp_path / "sessions", config)
+
+        assert config.backend == "sqlite"
+        assert isinstance(repo, SqliteSessionRepository)
+
+    def test_retention_from_config(self, tmp_path: Path):
+        config_dir = tmp_path / ".symforge"
+        config_dir.mkdir()
+        (config_dir / "config.yml").write_text(
+            "sessions:\n  retention:\n    PAUSED: 30\n", encoding="utf-8"
+        )
+
+        config = load_storage_config(tmp_path)
+
+        assert config.retention.ttl_days == {SessionState.PAUSED: 30.0}
+
+    def test_invalid_retention_raises_error(self, tmp_path: Path):
+        config_dir = tmp_path / ".symforge"
+        config_dir.mkdir()
+        (config_dir / "config.yml").write_text("sessions:\n  retention: 30\n", encoding="utf-8")
+
+        with pytest.raises(StorageConfigError):
+            load_storage_config(tmp_path)
+
+    def test_missing_config_uses_defaults(self, tmp_path: Path):
+        assert load_storage_config(tmp_path) == StorageConfig()
+
+    def test_unknown_backend_raises_error(self, tmp_path: Path):
+        with pytest.raises(StorageConfigError):
+            create_session_repository(tmp_path / "sessions", StorageConfig(backend="nosql"))
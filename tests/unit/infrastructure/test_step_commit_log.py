@@ -0,0 +1,205 @@
+"""
+TDD Unit Tests for the step → commit map and git-backed reset.
+
+Tests cover:
+- StepCommitLog lookup (last line wins, stale entries rejected)
+- Repository records the commit of each new history item on auto-commit
+  (also when saving a lazily loaded session)
+- The map is a local file: `git status` stays clean after auto-committed saves
+- reset with workspace restores tracked artifacts to the step's commit
+- Errors when no commit was recorded for the step
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from symforge.application.usecases.runtime import RuntimeUseCases
+from symforge.domain.exceptions import StepCommitNotFoundError
+from symforge.domain.history import HistoryEvent
+from symforge.domain.process_definition import ProcessDefinition
+from symforge.infrastructure.session_repository import SessionRepository
+from symforge.infrastructure.step_commit_log import StepCommitLog
+
+
+def git(path: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    git(tmp_path, "init")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test User")
+    return tmp_path
+
+
+def commit_artifact(workspace: Path, name: str, content: str) -> None:
+    (workspace / name).write_text(content, encoding="utf-8")
+    git(workspace, "add", name)
+    git(workspace, "commit", "-m", f"edit {name}")
+
+
+class TestStepCommitLog:
+    """Tests for the per-session map file."""
+
+    def test_lookup_returns_last_commit_for_position(self, tmp_path: Path):
+        log = StepCommitLog.for_session(tmp_path, "s1")
+        step = HistoryEvent("step", "a", 1.0)
+        log.path.write_text(
+            StepCommitLog.lines(0, [step], "c1") + StepCommitLog.lines(0, [step], "c2"),
+            encoding="utf-8",
+        )
+
+        assert log.lookup(0, step) == "c2"
+        assert log.lookup(1, step) is None
+
+    def test_stale_entry_is_rejected(self, tmp_path: Path):
+        log = StepCommitLog.for_session(tmp_path, "s1")
+        log.path.write_text(
+            StepCommitLog.lines(0, [HistoryEvent("step", "a", 1.0)], "c1"), encoding="utf-8"
+        )
+
+        assert log.lookup(0, HistoryEvent("step", "a", 2.0)) is None
+
+    def test_missing_file(self, tmp_path: Path):
+        assert StepCommitLog.for_session(tmp_path, "s1").lookup(0, "a") is None
+
+
+class TestRepositoryStepCommits:
+    """Tests for recording commits at save time."""
+
+    def test_new_steps_map_to_their_commit(self, workspace: Path):
+        repo = SessionRepository(workspace / ".symforge" / "sessions", auto_commit=True)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+        first = git(workspace, "rev-parse", "HEAD")
+        session.add_step("b")
+        repo.update(session)
+
+        assert repo.step_commit(session, 0) == first
+        assert repo.step_commit(session, 1) == git(workspace, "rev-parse", "HEAD")
+
+    def test_state_only_update_keeps_step_commit(self, workspace: Path):
+        repo = SessionRepository(workspace / ".symforge" / "sessions", auto_commit=True)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+        first = git(workspace, "rev-parse", "HEAD")
+
+        session.mark_paused()
+        repo.update(session)
+
+        assert repo.step_commit(session, 0) == first
+
+    def test_lazy_session_keeps_earlier_step_commits(self, workspace: Path):
+        repo = SessionRepository(workspace / ".symforge" / "sessions", auto_commit=True)
+        session = repo.create(ProcessDefinition(name="demo"))
+        commits = []
+        for step in ("a", "b"):
+            session.add_step(step)
+            repo.update(session)
+            commits.append(git(workspace, "rev-parse", "HEAD"))
+
+        paused = repo.load_lazy(session.id)
+        paused.mark_paused()
+        repo.update(paused)
+        resumed = repo.load_lazy(session.id)
+        resumed.add_step("c")
+        repo.update(resumed)
+
+        assert [repo.step_commit(resumed, i) for i in range(2)] == commits
+        assert repo.step_commit(resumed, 2) == git(workspace, "rev-parse", "HEAD")
+
+    @pytest.mark.parametrize("layout", ["flat", "sharded"])
+    def test_auto_commit_leaves_clean_status(self, workspace: Path, layout: str):
+        repo = SessionRepository(
+            workspace / ".symforge" / "sessions", auto_commit=True, layout=layout
+        )
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+
+        assert repo.step_commit(session, 0) is not None
+        assert git(workspace, "status", "--porcelain", "--untracked-files=all") == ""
+
+    def test_no_map_without_auto_commit(self, workspace: Path):
+        repo = SessionRepository(workspace / ".symforge" / "sessions")
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+
+        assert repo.step_commit(session, 0) is None
+
+    def test_map_follows_layout_migration(self, workspace: Path):
+        sessions_dir = workspace / ".symforge" / "sessions"
+        repo = SessionRepository(sessions_dir, auto_commit=True)
+        session = repo.create(ProcessDefinition(name="demo"))
+        session.add_step("a")
+        repo.update(session)
+        commit = repo.step_commit(session, 0)
+
+        repo.migrate(layout="sharded")
+        sharded = SessionRepository(sessions_dir, layout="sharded")
+
+        assert sharded.step_commit(sharded.load(session.id), 0) == commit
+
+
+class TestResetRestore:
+    """Tests for reset restoring workspace artifacts."""
+
+    def test_reset_restores_tracked_artifacts(self, workspace: Path):
+        commit_artifact(workspace, "doc.md", "v1")
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions", auto_commit=True)
+        process = ProcessDefinition(name="demo", required_artifacts=["doc.md"])
+        session = runtime.start(process, workspace)
+        session.add_step("draft")
+        runtime.repo.update(session)
+        commit_artifact(workspace, "doc.md", "v2")
+        session.add_step("review")
+        runtime.repo.update(session)
+        (workspace / "doc.md").write_text("v3", encoding="utf-8")
+
+        runtime.reset_step(session, "draft", workspace)
+
+        assert (workspace / "doc.md").read_text(encoding="utf-8") == "v1"
+        assert runtime.repo.load(session.id).history == ["draft"]
+
+    def test_untracked_artifact_is_left_alone(self, workspace: Path):
+        commit_artifact(workspace, "README", "x")
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions", auto_commit=True)
+        process = ProcessDefinition(name="demo", required_artifacts=["notes.md"])
+        session = runtime.start(process, workspace)
+        session.add_step("draft")
+        runtime.repo.update(session)
+        (workspace / "notes.md").write_text("local", encoding="utf-8")
+
+        runtime.reset_step(session, "draft", workspace)
+
+        assert (workspace / "notes.md").read_text(encoding="utf-8") == "local"
+
+    def test_reset_without_recorded_commit_fails(self, workspace: Path):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+        session = runtime.start(ProcessDefinition(name="demo"), workspace)
+        session.add_step("draft")
+        runtime.repo.update(session)
+
+        with pytest.raises(StepCommitNotFoundError):
+            runtime.reset_step(session, "draft", workspace)
+
+        assert runtime.repo.load(session.id).history == ["draft"]
+
+    def test_plain_reset_needs_no_commit(self, workspace: Path):
+        runtime = RuntimeUseCases(workspace / ".symforge" / "sessions")
+        session = runtime.start(ProcessDefinition(name="demo"), workspace)
+        session.add_step("a")
+        session.add_step("b")
+
+        runtime.reset_step(session, "a")
+
+        assert session.history == ["a"]
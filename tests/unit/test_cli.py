@@ -6,11 +6,16 @@ Tests cover:
 - resume command
 - reset command
 - decide command (HIL)
-- status command
+- failed auto-commit (session saved, id/state printed, error on stderr)
+- advance command (flow-driven sessions)
+- status command (single and bulk JSON lines)
+- pause command (single and batch)
+- gc command (retention by state, dry-run)
 - init command
 - validate command
 """
 
+import io
 import json
 import pytest
 from pathlib import Path
@@ -39,7 +44,7 @@ class TestCLIStart:
         assert result == 0
         captured = capsys.readouterr()
         session_id = captured.out.strip()
-        assert len(session_id) == 8
+        assert len(session_id) == 26
 
     def test_start_with_required_artifacts_present(self, workspace: Path, capsys):
         (workspace / "doc.md").write_text("# Content")
@@ -64,7 +69,7 @@ class TestCLIStart:
         assert result == 0
         session_id = capsys.readouterr().out.strip()
         # Session created but in AWAITING_INPUT state
-        assert len(session_id) == 8
+        assert len(session_id) == 26
 
 
 class TestCLIResume:
@@ -131,6 +136,34 @@ class TestCLIReset:
         session = repo.load(session_id)
         assert session.history == ["step1"]
 
+    def test_reset_restore_restores_artifacts(self, workspace: Path, capsys):
+        import subprocess
+        for args in (["init"], ["config", "user.email", "t@t"], ["config", "user.name", "T"]):
+            subprocess.run(["git", *args], cwd=workspace, capture_output=True, check=True)
+        doc = workspace / "doc.md"
+        doc.write_text("v1", encoding="utf-8")
+        subprocess.run(["git", "add", "doc.md"], cwd=workspace, check=True)
+        subprocess.run(["git", "commit", "-qm", "doc"], cwd=workspace, check=True)
+        main([
+            "start", "--process", "demo", "--required", "doc.md",
+            "--workspace", str(workspace), "--auto-commit",
+        ])
+        session_id = capsys.readouterr().out.strip()
+        from symforge.infrastructure.session_repository import SessionRepository
+        repo = SessionRepository(workspace / ".symforge" / "sessions", auto_commit=True)
+        session = repo.load(session_id)
+        session.add_step("step1")
+        repo.update(session)
+        doc.write_text("v2", encoding="utf-8")
+
+        result = main([
+            "reset", session_id, "step1", "--restore",
+            "--workspace", str(workspace), "--auto-commit",
+        ])
+
+        assert result == 0
+        assert doc.read_text(encoding="utf-8") == "v1"
+
 
 class TestCLIDecide:
     """Tests for decide command (HIL)."""
@@ -167,6 +200,132 @@ class TestCLIDecide:
         session = repo.load(session_id)
         assert "decision:approved" in session.history
 
+    def test_decide_records_actor(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+        from symforge.infrastructure.session_repository import SessionRepository
+        repo = SessionRepository(workspace / ".symforge" / "sessions")
+        session = repo.load(session_id)
+        session.mark_awaiting_decision()
+        repo.update(session)
+
+        result = main([
+            "decide", session_id, "approved", "--actor", "alice",
+            "--workspace", str(workspace),
+        ])
+
+        assert result == 0
+        decision = repo.load(session_id).decisions()[0]
+        assert (decision.value, decision.actor) == ("approved", "alice")
+
+
+class TestCLIAutoCommitFailure:
+    """Tests for auto-commit failures after the session is saved."""
+
+    @pytest.fixture
+    def repo_without_identity(self, workspace: Path, monkeypatch) -> Path:
+        import os
+        import subprocess
+        for name in ("GIT_AUTHOR_NAME", "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_NAME",
+                     "GIT_COMMITTER_EMAIL", "EMAIL"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        for args in (["init"], ["config", "user.useConfigOnly", "true"]):
+            subprocess.run(["git", *args], cwd=workspace, capture_output=True, check=True)
+        return workspace
+
+    def test_start_prints_id_and_reports_failed_commit(self, repo_without_identity, capsys):
+        workspace = repo_without_identity
+
+        result = main([
+            "start", "--process", "demo", "--workspace", str(workspace), "--auto-commit",
+        ])
+
+        captured = capsys.readouterr()
+        session_id = captured.out.strip()
+        assert result == 1
+        assert len(session_id) == 26
+        assert "Auto-commit falhou: git commit-tree" in captured.err
+        assert "a sessão foi gravada" in captured.err
+        from symforge.infrastructure.session_repository import SessionRepository
+        repo = SessionRepository(workspace / ".symforge" / "sessions")
+        assert repo.load(session_id).process_name == "demo"
+
+    def test_update_prints_state_and_reports_failed_commit(self, repo_without_identity, capsys):
+        workspace = repo_without_identity
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+        from symforge.infrastructure.session_repository import SessionRepository
+        repo = SessionRepository(workspace / ".symforge" / "sessions")
+        session = repo.load(session_id)
+        session.mark_awaiting_decision()
+        repo.update(session)
+
+        result = main([
+            "decide", session_id, "approved",
+            "--workspace", str(workspace), "--auto-commit",
+        ])
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert captured.out.strip() == "RUNNING"
+        assert captured.err.count("Auto-commit falhou") == 1
+        assert "decision:approved" in repo.load(session_id).history
+
+
+class TestCLIAdvance:
+    """Tests for advance command (flow-driven sessions)."""
+
+    FLOW = (
+        "id: demo\n"
+        "phases:\n"
+        "  - id: main\n"
+        "    steps:\n"
+        "      - id: draft\n"
+        "flow:\n"
+        "  - {id: start, type: start, next: write}\n"
+        "  - {id: write, type: step, step_ref: main.draft, next: review}\n"
+        "  - id: review\n"
+        "    type: decision\n"
+        "    decision:\n"
+        "      branches:\n"
+        "        - {when: approved, goto: end}\n"
+        "        - {when: needs_revision, goto: write}\n"
+        "  - {id: end, type: end}\n"
+    )
+
+    def start_flow(self, workspace: Path, capsys) -> str:
+        (workspace / "process").mkdir()
+        (workspace / "process" / "PROCESS.yml").write_text(self.FLOW, encoding="utf-8")
+        main([
+            "start", "--process", "demo", "--flow", "process/PROCESS.yml",
+            "--workspace", str(workspace),
+        ])
+        return capsys.readouterr().out.strip()
+
+    def test_advance_walks_flow(self, workspace: Path, capsys):
+        session_id = self.start_flow(workspace, capsys)
+
+        assert main(["advance", session_id, "--workspace", str(workspace)]) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result == {
+            "state": "AWAITING_DECISION",
+            "flow_node": "review",
+            "call_stack": [],
+            "options": ["approved", "needs_revision"],
+        }
+
+        assert main(["decide", session_id, "approved", "--workspace", str(workspace)]) == 0
+        assert capsys.readouterr().out.strip() == "COMPLETED"
+
+    def test_status_shows_flow_node(self, workspace: Path, capsys):
+        session_id = self.start_flow(workspace, capsys)
+
+        main(["status", session_id, "--brief", "--workspace", str(workspace)])
+
+        assert json.loads(capsys.readouterr().out)["flow_node"] == "write"
+
 
 class TestCLIStatus:
     """Tests for status command."""
@@ -195,6 +354,201 @@ class TestCLIStatus:
         assert status["process_name"] == "demo"
         assert status["state"] == "RUNNING"
 
+    def test_status_brief_omits_history(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+
+        result = main(["status", session_id, "--brief", "--workspace", str(workspace)])
+
+        assert result == 0
+        status = json.loads(capsys.readouterr().out)
+        assert status["state"] == "RUNNING"
+        assert "history" not in status
+
+
+class TestCLIStatusBulk:
+    """Tests for status --all / --ids-from (JSON lines)."""
+
+    def _start(self, workspace: Path, capsys, count: int) -> list[str]:
+        for _ in range(count):
+            main(["start", "--process", "demo", "--workspace", str(workspace)])
+        return capsys.readouterr().out.split()
+
+    def test_status_all_streams_json_lines(self, workspace: Path, capsys):
+        ids = self._start(workspace, capsys, 5)
+
+        result = main(["status", "--all", "--workspace", str(workspace)])
+
+        assert result == 0
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert sorted(e["id"] for e in entries) == sorted(ids)
+        assert all(e["state"] == "RUNNING" for e in entries)
+
+    def test_status_ids_from_file_keeps_order_and_reports_errors(
+        self, workspace: Path, capsys, tmp_path: Path
+    ):
+        ids = self._start(workspace, capsys, 3)
+        ids_file = tmp_path / "ids.txt"
+        ids_file.write_text("\n".join([ids[2], "missing", ids[0], ""]), encoding="utf-8")
+
+        result = main([
+            "status", "--ids-from", str(ids_file), "--brief", "--workspace", str(workspace),
+        ])
+
+        assert result == 1
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [e["id"] for e in entries] == [ids[2], "missing", ids[0]]
+        assert "error" in entries[1]
+        assert "history" not in entries[0]
+
+    def test_status_ids_from_stdin(self, workspace: Path, capsys, monkeypatch):
+        ids = self._start(workspace, capsys, 2)
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(ids)))
+
+        result = main(["status", "--ids-from", "-", "--workspace", str(workspace)])
+
+        assert result == 0
+        assert len(capsys.readouterr().out.splitlines()) == 2
+
+    def test_status_all_with_sqlite_backend(self, workspace: Path, capsys):
+        config = workspace / ".symforge" / "config.yml"
+        config.parent.mkdir(parents=True)
+        config.write_text("sessions:\n  backend: sqlite\n", encoding="utf-8")
+        ids = self._start(workspace, capsys, 20)
+
+        result = main(["status", "--all", "--workers", "4", "--workspace", str(workspace)])
+
+        assert result == 0
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert sorted(e["id"] for e in entries) == sorted(ids)
+
+    def test_status_without_id_fails(self, workspace: Path):
+        assert main(["status", "--workspace", str(workspace)]) == 1
+
+
+class TestCLIPause:
+    """Tests for pause command."""
+
+    def test_pause_many_sessions(self, workspace: Path, capsys):
+        for _ in range(2):
+            main(["start", "--process", "demo", "--workspace", str(workspace)])
+        ids = capsys.readouterr().out.split()
+
+        result = main(["pause", *ids, "--workspace", str(workspace)])
+
+        assert result == 0
+        assert capsys.readouterr().out.count("sessão pausada") == 2
+        main(["sessions", "list", "--state", "PAUSED", "--workspace", str(workspace)])
+        paused = [json.loads(line)["id"] for line in capsys.readouterr().out.splitlines()]
+        assert sorted(paused) == sorted(ids)
+
+
+class TestCLIGc:
+    """Tests for gc command."""
+
+    def _start_waiting(self, workspace: Path, capsys) -> str:
+        main(["start", "--process", "demo", "--required", "x.md", "--workspace", str(workspace)])
+        return capsys.readouterr().out.strip()
+
+    def test_gc_with_ttl_removes_sessions(self, workspace: Path, capsys):
+        waiting_id = self._start_waiting(workspace, capsys)
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        capsys.readouterr()
+
+        result = main(["gc", "--ttl", "AWAITING_INPUT=0", "--workspace", str(workspace)])
+
+        assert result == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == waiting_id
+        assert "1 sessões" in lines[-1]
+        main(["sessions", "list", "--workspace", str(workspace)])
+        remaining = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [e["state"] for e in remaining] == ["RUNNING"]
+
+    def test_gc_dry_run_uses_config_retention(self, workspace: Path, capsys):
+        config = workspace / ".symforge" / "config.yml"
+        config.parent.mkdir(parents=True)
+        config.write_text("sessions:\n  retention:\n    AWAITING_INPUT: 0\n", encoding="utf-8")
+        waiting_id = self._start_waiting(workspace, capsys)
+
+        result = main(["gc", "--dry-run", "--workspace", str(workspace)])
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert waiting_id in out and "seriam removidos" in out
+        assert main(["status", waiting_id, "--workspace", str(workspace)]) == 0
+
+    def test_gc_without_policy_fails(self, workspace: Path):
+        assert main(["gc", "--workspace", str(workspace)]) == 1
+
+
+class TestCLISessions:
+    """Tests for sessions list/reindex commands."""
+
+    def test_sessions_list_filters_by_state(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        main(["start", "--process", "demo", "--required", "x.md", "--workspace", str(workspace)])
+        waiting_id = capsys.readouterr().out.split()[-1]
+
+        result = main([
+            "sessions", "list",
+            "--state", "AWAITING_INPUT",
+            "--workspace", str(workspace),
+        ])
+
+        assert result == 0
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [e["id"] for e in entries] == [waiting_id]
+        assert entries[0]["process_name"] == "demo"
+
+    def test_sessions_reindex(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        (workspace / ".symforge" / "sessions" / "catalog.tsv").unlink()
+        capsys.readouterr()
+
+        result = main(["sessions", "reindex", "--workspace", str(workspace)])
+
+        assert result == 0
+        assert "sessões: 1" in capsys.readouterr().out
+
+    def test_sessions_compact(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+        main(["complete", session_id, "--workspace", str(workspace)])
+
+        result = main(["sessions", "compact", "--workspace", str(workspace)])
+
+        assert result == 0
+        assert "sessões compactadas: 1" in capsys.readouterr().out
+        assert not (workspace / ".symforge" / "sessions" / f"{session_id}.yml").exists()
+        assert main(["status", session_id, "--workspace", str(workspace)]) == 0
+
+    def test_sessions_migrate_layout(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+
+        result = main(["sessions", "migrate", "--layout", "sharded", "--workspace", str(workspace)])
+
+        assert result == 0
+        sessions_dir = workspace / ".symforge" / "sessions"
+        assert not (sessions_dir / f"{session_id}.yml").exists()
+        assert list(sessions_dir.glob(f"??/??/{session_id}.yml"))
+        assert main(["status", session_id, "--workspace", str(workspace)]) == 0
+
+    def test_sessions_migrate_requires_target(self, workspace: Path):
+        assert main(["sessions", "migrate", "--workspace", str(workspace)]) == 1
+
+    def test_sessions_migrate(self, workspace: Path, capsys):
+        main(["start", "--process", "demo", "--workspace", str(workspace)])
+        session_id = capsys.readouterr().out.strip()
+
+        result = main(["sessions", "migrate", "--format", "json", "--workspace", str(workspace)])
+
+        assert result == 0
+        assert (workspace / ".symforge" / "sessions" / f"{session_id}.json").exists()
+        main(["status", session_id, "--workspace", str(workspace)])
+        assert json.loads(capsys.readouterr().out.split("\n", 1)[1])["id"] == session_id
+
 
 class TestCLIInit:
     """Tests for init command."""
@@ -266,6 +620,84 @@ class TestCLIValidate:
         captured = capsys.readouterr()
         assert "validação falhou" in captured.err
 
+    def test_validate_uses_workspace_process_cache(self, tmp_path: Path, capsys):
+        (tmp_path / ".symforge").mkdir()
+        process_file = tmp_path / "process" / "PROCESS.yml"
+        process_file.parent.mkdir()
+        process_file.write_text("id: demo\nphases:\n  - id: p1\n", encoding="utf-8")
+
+        assert main(["validate", str(process_file)]) == 0
+        assert main(["validate", str(process_file)]) == 0
+
+        assert len(list((tmp_path / ".symforge" / "cache" / "processes").rglob("*.json"))) == 1
+
+    def test_validate_outside_workspace_creates_no_cache(self, tmp_path: Path, capsys):
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text("id: demo\nphases:\n  - id: p1\n", encoding="utf-8")
+
+        assert main(["validate", str(process_file)]) == 0
+
+        assert not (tmp_path / ".symforge").exists()
+
+    def test_validate_recursive_counts_references(self, tmp_path: Path, capsys):
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: p1\n"
+            "    spec_file: P1.md\n"
+            "    sub_phase: sub/PROCESS.yml\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "P1.md").write_text("# p1\n", encoding="utf-8")
+
+        assert main(["validate", str(process_file), "--recursive"]) == 1
+        assert "sub_phase sub/PROCESS.yml: arquivo não encontrado" in capsys.readouterr().err
+
+        sub = tmp_path / "sub" / "PROCESS.yml"
+        sub.parent.mkdir()
+        sub.write_text("id: sub\nphases:\n  - id: s\n", encoding="utf-8")
+        assert main(["validate", str(process_file), "--recursive"]) == 0
+        assert "referências: 2" in capsys.readouterr().out
+
+    def test_validate_flow_reports_summary_and_warnings(self, tmp_path: Path, capsys):
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: p1\n"
+            "flow:\n"
+            "  - {id: start, type: start, next: end}\n"
+            "  - {id: end, type: end}\n"
+            "  - {id: orphan, type: end}\n",
+            encoding="utf-8",
+        )
+
+        assert main(["validate", str(process_file), "--flow"]) == 0
+
+        captured = capsys.readouterr()
+        assert "fluxo: 1 arquivos, 3 nós" in captured.out
+        assert "aviso: PROCESS.yml: 'orphan' inalcançável" in captured.err
+
+    def test_validate_flow_fails_on_dead_end(self, tmp_path: Path, capsys):
+        process_file = tmp_path / "PROCESS.yml"
+        process_file.write_text(
+            "id: demo\n"
+            "phases:\n"
+            "  - id: p1\n"
+            "    steps:\n"
+            "      - id: s1\n"
+            "flow:\n"
+            "  - {id: start, type: start, next: work}\n"
+            "  - {id: work, type: step, step_ref: p1.s1, next: work}\n"
+            "  - {id: end, type: end}\n",
+            encoding="utf-8",
+        )
+
+        assert main(["validate", str(process_file), "--flow"]) == 1
+
+        assert "'work' sem caminho até um end" in capsys.readouterr().err
+
 
 class TestCLIPlugin:
     """Tests for plugin commands."""